@@ -0,0 +1,125 @@
+import _socket
+import asyncio
+from RemoteProcessClient import RemoteProcessClient
+
+
+class IncompleteMessageError(Exception):
+    pass
+
+
+class MessageParser(RemoteProcessClient):
+    """
+    Socket-less RemoteProcessClient decoding messages from the bytes fed to it.
+
+    A message is parsed only once all of its bytes are buffered: a read past the received bytes raises
+    IncompleteMessageError, and parse rewinds to the start of the message so it can be retried after the next feed.
+    Written messages are collected by flush and handed out by take_output.
+    """
+
+    def __init__(self, reuse_objects=False):
+        self.socket = None
+        self.cells = None
+        self.cell_visibilities = None
+
+        self._init_buffers()
+        self._init_pools(reuse_objects)
+
+        self._pending_output = bytearray()
+
+    def feed(self, byte_array):
+        byte_count = len(byte_array)
+
+        self._make_room(self._received_offset - self._read_offset + byte_count)
+        self._buffer[self._received_offset:self._received_offset + byte_count] = byte_array
+        self._received_offset += byte_count
+
+    def parse(self, read_message):
+        """
+        :param read_message: unbound RemoteProcessClient method reading a message, e.g. read_team_size_message
+        :return: (True, message) if the message is complete, (False, None) otherwise
+        """
+        try:
+            return True, read_message(self)
+        except IncompleteMessageError:
+            self._read_offset = self._message_offset
+            return False, None
+
+    def _ensure_buffered(self, byte_count):
+        if self._received_offset - self._read_offset < byte_count:
+            raise IncompleteMessageError()
+
+    def flush(self):
+        self._pending_output += self._output_buffer
+        del self._output_buffer[:]
+
+    def take_output(self):
+        output = bytes(self._pending_output)
+        del self._pending_output[:]
+
+        return output
+
+    def close(self):
+        pass
+
+
+class AsyncRemoteProcessClient:
+    """
+    asyncio counterpart of RemoteProcessClient: the same messages, read from a StreamReader by a MessageParser
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, reuse_objects=False):
+        self.reader = reader
+        self.writer = writer
+        self.parser = MessageParser(reuse_objects)
+
+    @classmethod
+    async def connect(cls, host, port, reuse_objects=False):
+        reader, writer = await asyncio.open_connection(host, port)
+
+        socket = writer.get_extra_info('socket')
+        if socket is not None:
+            socket.setsockopt(_socket.IPPROTO_TCP, _socket.TCP_NODELAY, True)
+
+        return cls(reader, writer, reuse_objects)
+
+    async def write_token_message(self, token):
+        self.parser.write_token_message(token)
+        await self.send_output()
+
+    async def read_team_size_message(self):
+        return await self.read_message(RemoteProcessClient.read_team_size_message)
+
+    async def write_protocol_version_message(self):
+        self.parser.write_protocol_version_message()
+        await self.send_output()
+
+    async def read_game_context_message(self):
+        return await self.read_message(RemoteProcessClient.read_game_context_message)
+
+    async def read_player_context_message(self):
+        return await self.read_message(RemoteProcessClient.read_player_context_message)
+
+    async def write_moves_message(self, moves):
+        self.parser.write_moves_message(moves)
+        await self.send_output()
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def read_message(self, read_message):
+        while True:
+            complete, message = self.parser.parse(read_message)
+            if complete:
+                return message
+
+            byte_array = await self.reader.read(RemoteProcessClient.RECEIVE_BUFFER_SIZE_BYTES)
+
+            if not byte_array:
+                raise IOError("Can't read message from input stream.")
+
+            self.parser.feed(byte_array)
+
+    async def send_output(self):
+        self.writer.write(self.parser.take_output())
+        await self.writer.drain()
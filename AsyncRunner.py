@@ -0,0 +1,93 @@
+import asyncio
+import inspect
+import sys
+from AsyncRemoteProcessClient import AsyncRemoteProcessClient
+from MyStrategy import MyStrategy
+from Runner import Runner
+from model.Move import Move
+
+
+class AsyncRunner:
+    """
+    asyncio counterpart of Runner. Strategy.move may be a plain method or a coroutine.
+
+    Several runners can share one event loop (see run_all), one connection each. Note that the bundled strategies
+    keep their shared info in process-wide singletons, so concurrent connections should use independent strategies.
+    """
+
+    def __init__(self, host, port, token, strategy_class=MyStrategy, reuse_objects=False):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.strategy_class = strategy_class
+        self.reuse_objects = reuse_objects
+
+    async def run(self):
+        remote_process_client = await AsyncRemoteProcessClient.connect(self.host, self.port, self.reuse_objects)
+
+        try:
+            await remote_process_client.write_token_message(self.token)
+            team_size = await remote_process_client.read_team_size_message()
+            await remote_process_client.write_protocol_version_message()
+            game = await remote_process_client.read_game_context_message()
+
+            strategies = []
+
+            for strategy_index in range(team_size):
+                strategies.append(self.strategy_class())
+
+            while True:
+                player_context = await remote_process_client.read_player_context_message()
+                if player_context is None:
+                    break
+
+                player_hockeyists = player_context.hockeyists
+                if player_hockeyists is None or player_hockeyists.__len__() != team_size:
+                    break
+
+                moves = []
+
+                for hockeyist_index in range(team_size):
+                    player_hockeyist = player_hockeyists[hockeyist_index]
+
+                    move = Move()
+                    moves.append(move)
+                    result = strategies[player_hockeyist.teammate_index].move(
+                        player_hockeyist, player_context.world, game, move)
+
+                    if inspect.isawaitable(result):
+                        await result
+
+                await remote_process_client.write_moves_message(moves)
+        finally:
+            await remote_process_client.close()
+
+
+async def run_all(runners):
+    await asyncio.gather(*(runner.run() for runner in runners))
+
+
+UNSUPPORTED_OPTIONS = ['record', 'replay', 'tick_cache_stats', 'tick_deadline_ms', 'gc_control', 'gc_report',
+                       'table_cache']
+
+
+def parse_options(arguments):
+    """
+    Runner's options, of which AsyncRunner supports the address, --reuse-objects and --search-*
+    """
+    options = Runner.parse_options(arguments)
+    unsupported = ['--' + name.replace('_', '-') for name in UNSUPPORTED_OPTIONS
+                   if getattr(options, name) not in (None, False)]
+
+    if unsupported:
+        sys.exit('AsyncRunner.py: error: not supported by AsyncRunner, use Runner.py: %s' % ' '.join(unsupported))
+
+    return options
+
+
+if __name__ == "__main__":
+    options = parse_options(sys.argv[1:])
+    host, port, token = Runner.get_connection_arguments(options.address)
+    Runner.configure_search(options)
+
+    asyncio.run(AsyncRunner(host, port, token, reuse_objects=options.reuse_objects).run())
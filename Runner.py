@@ -1,54 +1,174 @@
-import sys
-from MyStrategy import MyStrategy
-from RemoteProcessClient import RemoteProcessClient
-from model.Move import Move
-
-
-class Runner:
-    def __init__(self):
-        if sys.argv.__len__() == 4:
-            self.remote_process_client = RemoteProcessClient(sys.argv[1], int(sys.argv[2]))
-            self.token = sys.argv[3]
-        elif sys.argv.__len__() == 2:
-            self.remote_process_client = RemoteProcessClient('127.0.0.1', int(sys.argv[1]))
-            self.token = "0000000000000000"
-        else:
-            self.remote_process_client = RemoteProcessClient("127.0.0.1", 31001)
-            self.token = "0000000000000000"
-
-    def run(self):
-        try:
-            self.remote_process_client.write_token_message(self.token)
-            team_size = self.remote_process_client.read_team_size_message()
-            self.remote_process_client.write_protocol_version_message()
-            game = self.remote_process_client.read_game_context_message()
-
-            strategies = []
-
-            for strategy_index in range(team_size):
-                strategies.append(MyStrategy())
-
-            while True:
-                player_context = self.remote_process_client.read_player_context_message()
-                if player_context is None:
-                    break
-
-                player_hockeyists = player_context.hockeyists
-                if player_hockeyists is None or player_hockeyists.__len__() != team_size:
-                    break
-
-                moves = []
-
-                for hockeyist_index in range(team_size):
-                    player_hockeyist = player_hockeyists[hockeyist_index]
-
-                    move = Move()
-                    moves.append(move)
-                    strategies[player_hockeyist.teammate_index].move(player_hockeyist, player_context.world, game, move)
-
-                self.remote_process_client.write_moves_message(moves)
-        finally:
-            self.remote_process_client.close()
-
-
-Runner().run()
\ No newline at end of file
+import argparse
+import sys
+from MyStrategy import MyStrategy
+from gc_controller import GcController
+from RemoteProcessClient import RemoteProcessClient
+from model.Move import Move
+import latency_watchdog
+import tick_cache
+from tick_recording import ReplayClient, TickRecorder
+
+
+class Runner:
+    def __init__(self):
+        options = self.parse_options(sys.argv[1:])
+        host, port, self.token = self.get_connection_arguments(options.address)
+
+        if options.replay is not None:
+            self.remote_process_client = ReplayClient(options.replay, options.reuse_objects)
+        else:
+            self.remote_process_client = RemoteProcessClient(host, port, options.reuse_objects)
+
+        self.recorder = TickRecorder(options.record) if options.record is not None else None
+
+        self.tick_cache_stats = options.tick_cache_stats
+        tick_cache.enable_debug(self.tick_cache_stats)
+
+        self.configure_search(options)
+
+        self.tick_deadline = options.tick_deadline_ms / 1000.0 if options.tick_deadline_ms is not None else None
+        latency_watchdog.set_deadline(self.tick_deadline)
+
+        if options.gc_control or options.gc_report:
+            self.gc_controller = GcController(control=options.gc_control)
+        else:
+            self.gc_controller = None
+
+        self.remote_process_client.gc_controller = self.gc_controller
+
+        self.table_cache = self.configure_table_cache(options)
+
+    @staticmethod
+    def get_connection_arguments(address):
+        if address.__len__() == 3:
+            return address[0], int(address[1]), address[2]
+        elif address.__len__() == 1:
+            return '127.0.0.1', int(address[0]), "0000000000000000"
+        else:
+            return "127.0.0.1", 31001, "0000000000000000"
+
+    @staticmethod
+    def configure_search(options):
+        if options.search_deadline_ms is not None:
+            from base_strategy_factory import BaseStrategyFactory
+            from search_strategy import SearchStrategy
+
+            SearchStrategy.configure(options.search_deadline_ms / 1000.0, options.search_workers)
+            BaseStrategyFactory.forward_strategy = SearchStrategy
+
+    @staticmethod
+    def configure_table_cache(options):
+        if options.table_cache is None:
+            return None
+
+        from table_cache import TableCache, DEFAULT_DIRECTORY
+        return TableCache(options.table_cache or DEFAULT_DIRECTORY)
+
+    @staticmethod
+    def parse_options(arguments):
+        parser = argparse.ArgumentParser()
+        parser.add_argument('address', nargs='*', help="[host port token] or [port]")
+        parser.add_argument('--reuse-objects', action='store_true',
+                            help="update one long-lived object per world entity instead of decoding new ones each tick")
+        parser.add_argument('--record', metavar='PATH',
+                            help="append the received TEAM_SIZE, GAME_CONTEXT and PLAYER_CONTEXT messages to PATH")
+        parser.add_argument('--replay', metavar='PATH',
+                            help="play the messages recorded to PATH instead of connecting to the server")
+        parser.add_argument('--tick-cache-stats', action='store_true',
+                            help="count hits and misses of the tick-cached strategy properties and print them at exit")
+        parser.add_argument('--tick-deadline-ms', type=float, metavar='MS',
+                            help="send fallback moves instead of running strategies when a tick is about to take "
+                                 "longer than MS milliseconds, report the overruns at exit")
+        parser.add_argument('--gc-control', action='store_true',
+                            help="disable automatic garbage collection and collect after the moves of a tick are sent, "
+                                 "report the collections at exit")
+        parser.add_argument('--gc-report', action='store_true',
+                            help="leave garbage collection to gc but report the collections on the critical path at "
+                                 "exit, the baseline for --gc-control")
+        parser.add_argument('--search-deadline-ms', type=float, metavar='MS',
+                            help="play the forward role with the search strategy, which picks a move within MS "
+                                 "milliseconds per hockeyist")
+        parser.add_argument('--search-workers', type=int, default=0, metavar='N',
+                            help="score the search strategy's rollouts in N worker processes instead of in-process")
+        parser.add_argument('--table-cache', nargs='?', const='', metavar='DIR',
+                            help="memory-map the tables precomputed for the game from DIR (.table_cache next to the "
+                                 "bot by default), build the missing ones in the background and save them there")
+
+        return parser.parse_args(arguments)
+
+    def run(self):
+        if self.gc_controller is not None:
+            self.gc_controller.start()
+
+        try:
+            self.remote_process_client.write_token_message(self.token)
+            team_size = self.remote_process_client.read_team_size_message()
+            self.record(RemoteProcessClient.MessageType.TEAM_SIZE)
+            self.remote_process_client.write_protocol_version_message()
+            game = self.remote_process_client.read_game_context_message()
+            self.record(RemoteProcessClient.MessageType.GAME_CONTEXT)
+
+            if self.table_cache is not None:
+                self.table_cache.prepare(game)
+
+            strategies = []
+
+            for strategy_index in range(team_size):
+                strategies.append(MyStrategy())
+
+            while True:
+                player_context = self.remote_process_client.read_player_context_message()
+                if player_context is None:
+                    break
+
+                self.record(RemoteProcessClient.MessageType.PLAYER_CONTEXT, player_context.world.tick)
+
+                player_hockeyists = player_context.hockeyists
+                if player_hockeyists is None or player_hockeyists.__len__() != team_size:
+                    break
+
+                moves = []
+                latency_watchdog.start_tick()
+
+                for hockeyist_index in range(team_size):
+                    player_hockeyist = player_hockeyists[hockeyist_index]
+                    strategy = strategies[player_hockeyist.teammate_index]
+
+                    move = Move()
+                    moves.append(move)
+
+                    if self.tick_deadline is None:
+                        strategy.move(player_hockeyist, player_context.world, game, move)
+                    else:
+                        latency_watchdog.compute_move(strategy, player_hockeyist, player_context.world, game, move)
+
+                self.remote_process_client.write_moves_message(moves)
+
+                if self.gc_controller is not None:
+                    self.gc_controller.finish_tick(player_context.world)
+        finally:
+            self.remote_process_client.close()
+
+            if self.recorder is not None:
+                self.recorder.close()
+
+            if self.table_cache is not None:
+                self.table_cache.wait()
+
+            if self.tick_cache_stats:
+                print(tick_cache.get_report(), file=sys.stderr)
+
+            if self.tick_deadline is not None:
+                print(latency_watchdog.get_report(), file=sys.stderr)
+
+            if self.gc_controller is not None:
+                self.gc_controller.stop()
+                print(self.gc_controller.get_report(), file=sys.stderr)
+
+    def record(self, message_type, tick=-1):
+        if self.recorder is not None:
+            self.recorder.record(message_type, tick, self.remote_process_client.get_last_message_bytes())
+
+
+if __name__ == "__main__":
+    Runner().run()
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+This module provides lookup tables of the expected outcomes of actions, compiled from Game once per game.
+
+The tables are dense NumPy arrays indexed by (swing ticks, attribute bucket, stamina bucket), or by the last two
+for actions without a swing:
+  * an attribute is weakened by lack of stamina: effectiveness = z + (1 - z) * stamina / hockeyist_max_stamina, where
+    z is zero_stamina_hockeyist_effectiveness_factor, and the factor of an attribute is
+    attribute * effectiveness / hockeyist_attribute_base_value;
+  * strike power grows from strike_power_base_factor by strike_power_growth_factor for every swing tick up to
+    max_effective_swing_ticks; the struck puck speed is struck_puck_initial_speed_factor times strike power times the
+    strength factor, pass speed is pass_power_factor times the strength factor for a pass of power 1;
+  * pick up and strike chances of a free puck are their base chances plus the factor of max(dexterity, agility)
+    minus 1, the chance to take the puck away from its owner is lowered by the owner's strength factor as well;
+  * knockdown chance is knockdown_chance_factor times strike power times the striker's strength factor.
+
+Chances are limited to [min_action_chance, max_action_chance]. These are approximations of the game rules: the speeds
+of the puck and of the hockeyists and the attributes of a knocked hockeyist are ignored. Requires NumPy.
+
+The tables depend only on GAME_FIELDS and CACHE_PARAMETERS, the bucket sizes, so table_cache.TableCache can keep them
+on disk between games and pass them to of instead of building them again.
+"""
+import numpy as np
+
+from model.Game import Game
+from model.Hockeyist import Hockeyist
+from table_cache import PrecomputedTables
+
+
+__all__ = ['ActionOutcomes']
+
+
+class ActionOutcomes(PrecomputedTables):
+    DEFAULT_ATTRIBUTE_BUCKET_SIZE = 5
+    DEFAULT_STAMINA_BUCKET_COUNT = 21
+
+    CACHE_NAME = 'action_outcomes'
+    ATTRIBUTE_FIELDS = tuple('%s_hockeyist_%s' % (kind, name) for kind in ('versatile', 'forward', 'defenceman')
+                             for name in ('strength', 'endurance', 'dexterity', 'agility'))
+    GAME_FIELDS = ('hockeyist_attribute_base_value', 'max_random_hockeyist_parameter', 'max_effective_swing_ticks',
+                   'hockeyist_max_stamina', 'zero_stamina_hockeyist_effectiveness_factor', 'strike_power_base_factor',
+                   'strike_power_growth_factor', 'struck_puck_initial_speed_factor', 'pass_power_factor',
+                   'pick_up_puck_base_chance', 'strike_puck_base_chance', 'take_puck_away_base_chance',
+                   'knockdown_chance_factor', 'min_action_chance', 'max_action_chance') + ATTRIBUTE_FIELDS
+    CACHE_PARAMETERS = (DEFAULT_ATTRIBUTE_BUCKET_SIZE, DEFAULT_STAMINA_BUCKET_COUNT)
+    TABLE_NAMES = ('effectiveness', 'attribute_factors', 'strike_powers', 'struck_puck_speeds', 'pass_puck_speeds',
+                   'pick_up_chances', 'strike_puck_chances', 'take_puck_away_base_chances', 'knockdown_chances')
+
+    def __init__(self, game: Game, attribute_bucket_size=DEFAULT_ATTRIBUTE_BUCKET_SIZE,
+                 stamina_bucket_count=DEFAULT_STAMINA_BUCKET_COUNT, tables=None):
+        """
+        :param tables: arrays by the names in TABLE_NAMES built for the same game fields and bucket sizes, the tables
+            are built from the game if None
+        """
+        self.game = game
+        self.attribute_bucket_size = attribute_bucket_size
+        self.stamina_bucket_count = stamina_bucket_count
+
+        max_attribute = max(2 * game.hockeyist_attribute_base_value, game.max_random_hockeyist_parameter,
+                            *(getattr(game, name) for name in self.ATTRIBUTE_FIELDS))
+        self.attribute_bucket_count = int(np.ceil(max_attribute / attribute_bucket_size)) + 1
+        self.swing_tick_count = game.max_effective_swing_ticks + 1
+
+        if tables is None:
+            tables = self.build_tables(game, self.attribute_bucket_count, attribute_bucket_size, stamina_bucket_count)
+
+        self.set_tables(tables)
+
+    @staticmethod
+    def build_tables(game: Game, attribute_bucket_count, attribute_bucket_size, stamina_bucket_count):
+        attributes = np.arange(attribute_bucket_count) * float(attribute_bucket_size)
+        staminas = np.linspace(0.0, game.hockeyist_max_stamina, stamina_bucket_count)
+        swing_ticks = np.arange(game.max_effective_swing_ticks + 1)
+
+        zero_stamina_effectiveness = game.zero_stamina_hockeyist_effectiveness_factor
+        effectiveness = (zero_stamina_effectiveness + (1.0 - zero_stamina_effectiveness) * staminas /
+                         game.hockeyist_max_stamina)
+        attribute_factors = attributes[:, None] * effectiveness[None, :] / game.hockeyist_attribute_base_value
+        strike_powers = game.strike_power_base_factor + game.strike_power_growth_factor * swing_ticks
+
+        def limit_chances(chances):
+            return np.clip(chances, game.min_action_chance, game.max_action_chance)
+
+        powers = strike_powers[:, None, None]
+        factors = attribute_factors[None, :, :]
+
+        return dict(effectiveness=effectiveness, attribute_factors=attribute_factors, strike_powers=strike_powers,
+                    struck_puck_speeds=game.struck_puck_initial_speed_factor * powers * factors,
+                    pass_puck_speeds=game.pass_power_factor * attribute_factors,
+                    pick_up_chances=limit_chances(game.pick_up_puck_base_chance + attribute_factors - 1.0),
+                    strike_puck_chances=limit_chances(game.strike_puck_base_chance + attribute_factors - 1.0),
+                    take_puck_away_base_chances=game.take_puck_away_base_chance + attribute_factors,
+                    knockdown_chances=limit_chances(game.knockdown_chance_factor * powers * factors))
+
+    def get_swing_index(self, swing_ticks):
+        return min(max(swing_ticks, 0), self.swing_tick_count - 1)
+
+    def get_attribute_bucket(self, attribute):
+        return min(max(int(attribute / self.attribute_bucket_size + 0.5), 0), self.attribute_bucket_count - 1)
+
+    def get_stamina_bucket(self, stamina):
+        bucket = int(stamina / self.game.hockeyist_max_stamina * (self.stamina_bucket_count - 1) + 0.5)
+        return min(max(bucket, 0), self.stamina_bucket_count - 1)
+
+    def get_struck_puck_speed(self, hockeyist: Hockeyist, swing_ticks=None):
+        """
+        :param swing_ticks: the hockeyist's own swing ticks by default
+        :return: speed the puck gets from the strike, the speed of the hockeyist not included
+        """
+        if swing_ticks is None:
+            swing_ticks = hockeyist.swing_ticks
+
+        return float(self.struck_puck_speeds[self.get_swing_index(swing_ticks),
+                                             self.get_attribute_bucket(hockeyist.strength),
+                                             self.get_stamina_bucket(hockeyist.stamina)])
+
+    def get_pass_puck_speed(self, hockeyist: Hockeyist, pass_power=1.0):
+        return pass_power * float(self.pass_puck_speeds[self.get_attribute_bucket(hockeyist.strength),
+                                                        self.get_stamina_bucket(hockeyist.stamina)])
+
+    def get_pick_up_chance(self, hockeyist: Hockeyist):
+        return float(self.pick_up_chances[self.get_attribute_bucket(max(hockeyist.dexterity, hockeyist.agility)),
+                                          self.get_stamina_bucket(hockeyist.stamina)])
+
+    def get_strike_puck_chance(self, hockeyist: Hockeyist):
+        return float(self.strike_puck_chances[self.get_attribute_bucket(max(hockeyist.dexterity, hockeyist.agility)),
+                                              self.get_stamina_bucket(hockeyist.stamina)])
+
+    def get_take_puck_away_chance(self, hockeyist: Hockeyist, owner: Hockeyist):
+        chance = (self.take_puck_away_base_chances[
+                      self.get_attribute_bucket(max(hockeyist.dexterity, hockeyist.agility)),
+                      self.get_stamina_bucket(hockeyist.stamina)] -
+                  self.attribute_factors[self.get_attribute_bucket(owner.strength),
+                                         self.get_stamina_bucket(owner.stamina)])
+
+        return min(max(float(chance), self.game.min_action_chance), self.game.max_action_chance)
+
+    def get_knockdown_chance(self, hockeyist: Hockeyist, swing_ticks=None):
+        if swing_ticks is None:
+            swing_ticks = hockeyist.swing_ticks
+
+        return float(self.knockdown_chances[self.get_swing_index(swing_ticks),
+                                            self.get_attribute_bucket(hockeyist.strength),
+                                            self.get_stamina_bucket(hockeyist.stamina)])
+
+    def get_swing_ticks_for_struck_puck_speed(self, hockeyist: Hockeyist, speed):
+        """
+        :return: the least swing ticks giving the puck at least the speed, max_effective_swing_ticks if none does
+        """
+        speeds = self.struck_puck_speeds[:, self.get_attribute_bucket(hockeyist.strength),
+                                         self.get_stamina_bucket(hockeyist.stamina)]
+
+        return self.get_swing_index(int(np.searchsorted(speeds, speed)))
+
+    def get_swing_ticks_for_knockdown_chance(self, hockeyist: Hockeyist, chance):
+        """
+        :return: the least swing ticks giving at least the knockdown chance, max_effective_swing_ticks if none does
+        """
+        chances = self.knockdown_chances[:, self.get_attribute_bucket(hockeyist.strength),
+                                         self.get_stamina_bucket(hockeyist.stamina)]
+
+        return self.get_swing_index(int(np.searchsorted(chances, chance)))
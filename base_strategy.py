@@ -2,10 +2,9 @@
 This module provides class for representing base strategy.
 Every strategy should inherit this class.
 """
-from math import pi
+from math import pi, cos, sin
 
 from model.HockeyistState import HockeyistState
-from model.HockeyistType import HockeyistType
 from model.Puck import Puck
 from model.Player import Player
 from model.ActionType import ActionType
@@ -14,9 +13,21 @@ from model.Hockeyist import Hockeyist
 from model.Move import Move
 from model.Unit import Unit
 from model.World import World
-from iter import first
+from intercept import get_intercept_time
+import latency_watchdog
 from point import Point
-from vector import Vector
+from puck_trajectory import PuckTrajectory
+from rink_geometry import RinkGeometry
+from tick_cache import tick_cached_property, invalidate_tick_cache
+from vector import Vector, get_angle_between, is_between
+from world_index import WorldIndex
+
+try:
+    from action_outcomes import ActionOutcomes
+    from shot_field import ShotField
+except ImportError:
+    # NumPy is not installed: the tables are unavailable and the strategies fall back to their constants
+    ActionOutcomes = ShotField = None
 
 
 __all__ = ['BaseStrategy']
@@ -27,11 +38,12 @@ class BaseStrategy:
     def __init__(self, me: Hockeyist, world: World, game: Game, move: Move, info=None):
         self._me = None
         self._world = None
+        self._index = None
         self._game = None
         self._move = None
         self._info = None
 
-        info = info or self.initial_info()
+        info = info if info is not None else self.initial_info()
 
         self.me = me
         self.world = world
@@ -45,48 +57,56 @@ class BaseStrategy:
         self._opponent_defenceman_distance = 120
 
         self._future = 5
+        self._max_intercept_time = 1000
 
     #region Utils
 
-    @property
+    @tick_cached_property
     def distance_to_puck(self) -> float:
         return self.me.get_distance_to_unit(self.world.puck)
 
-    @property
+    @tick_cached_property
     def our_team_own_puck(self) -> bool:
         owner = self.puck_owner
         return owner is not None and owner.teammate
 
-    @property
+    @tick_cached_property
     def own_puck(self):
         return self.our_team_own_puck and self.puck_owner.id == self.me.id
 
-    @property
+    @tick_cached_property
     def puck_is_free(self):
         return self.puck_owner is None
 
-    @property
+    @tick_cached_property
     def opponent_team_own_puck(self):
         return not self.our_team_own_puck and self.puck_owner is not None
 
     @property
     def puck_owner(self) -> Hockeyist:
-        return self.get_hockeyist_by_id(self.world.puck.owner_hockeyist_id)
+        return self.index.puck_owner
 
     def get_hockeyist_by_id(self, hockeyist_id) -> Hockeyist:
-        return first(self.world.hockeyists, lambda h: h.id == hockeyist_id)
+        return self.index.hockeyists_by_id.get(hockeyist_id)
+
+    @property
+    def rink(self) -> RinkGeometry:
+        """
+        Static geometry of the rink, shared by all strategies for the whole game
+        """
+        return self.index.rink
 
     @property
     def goal_net_center(self) -> Point:
-        return self.get_goal_net_center(self.player)
+        return self.index.rink.goal_net_center
 
     @property
     def opponent_goal_net_center(self) -> Point:
-        return self.get_goal_net_center(self.opponent)
+        return self.index.rink.opponent_goal_net_center
 
     @property
     def goal_net_horizontal(self):
-        return 460
+        return self.index.rink.goal_net_horizontal
     
     @property
     def net_back(self):
@@ -102,15 +122,15 @@ class BaseStrategy:
 
     @property
     def player(self) -> Player:
-        return first(self.world.players, lambda p: p.me)
+        return self.index.player
 
     @property
     def opponent(self) -> Player:
-        return first(self.world.players, lambda p: not p.me)
+        return self.index.opponent
 
     @staticmethod
     def get_goal_net_center(player: Player) -> Point:
-        return Point(player.net_front, (player.net_bottom + player.net_top) / 2)
+        return RinkGeometry.get_goal_net_center(player)
 
     @property
     def puck(self) -> Puck:
@@ -137,38 +157,37 @@ class BaseStrategy:
         return self.me.get_angle_to(x, y)
 
     def unit_is_moving_to_us(self, unit):
-        speed_vector = self.get_speed_vector(unit)
-        vector_to_us = Vector(self.get_unit_position(unit), self.get_unit_position(self.me))
+        angle = get_angle_between(unit.speed_x, unit.speed_y, self.me.x - unit.x, self.me.y - unit.y)
 
-        return abs(speed_vector.angle_to(vector_to_us)) < self._allowed_angle_between_codirectional_vectors
+        return abs(angle) < self._allowed_angle_between_codirectional_vectors
 
     @property
     def angle(self):
         return self.me.angle
 
-    @property
+    @tick_cached_property
     def nearest_teammate(self):
         # The first item is the player itself, so, return the second
         return sorted(self.my_hockeyists, key=self.get_distance_to_unit)[1]
 
-    @property
+    @tick_cached_property
     def nearest_opponent(self):
         return sorted(self.opponent_hockeyists, key=self.get_distance_to_unit)[1]
 
-    @property
+    @tick_cached_property
     def angle_to_nearest_teammate(self):
         return self.get_angle_to_unit(self.nearest_teammate)
 
-    @property
+    @tick_cached_property
     def angle_to_nearest_opponent(self):
         return self.get_angle_to_unit(self.nearest_opponent)
 
     def get_angle_to_goal_net_center(self, player):
         return self.get_angle_to_unit(self.get_goal_net_center(player))
 
-    @property
+    @tick_cached_property
     def angle_to_opponent_goal_net_center(self):
-        return self.get_angle_to_goal_net_center(self.opponent)
+        return self.get_angle_to_unit(self.index.rink.opponent_goal_net_center)
 
     def can_pass_to(self, teammate):
         return self.get_angle_to_unit(teammate) < self.pass_sector / 2
@@ -213,25 +232,25 @@ class BaseStrategy:
         return (self.get_distance_to_unit(other) < self.stick_length and
                 abs(self.get_angle_to_unit(other)) < self.stick_sector / 2)
 
-    @property
+    @tick_cached_property
     def can_influence_puck(self) -> bool:
         return self.can_influence_by_stick(self.puck)
 
     @property
     def opponent_hockeyists(self) -> [Hockeyist]:
-        return [h for h in self.opponent_hockeyists_with_goalie if h.type != HockeyistType.GOALIE]
+        return self.index.opponent_hockeyists
 
     @property
     def opponent_hockeyists_with_goalie(self):
-        return [h for h in self.hockeyists if not h.teammate]
+        return self.index.opponent_hockeyists_with_goalie
 
     @property
     def my_hockeyists(self) -> [Hockeyist]:
-        return [h for h in self.my_hockeyists_with_goalie if h.type != HockeyistType.GOALIE]
+        return self.index.my_hockeyists
 
     @property
     def my_hockeyists_with_goalie(self):
-        return [h for h in self.hockeyists if h.teammate]
+        return self.index.my_hockeyists_with_goalie
 
     @property
     def last_action(self):
@@ -249,7 +268,7 @@ class BaseStrategy:
     def hockeyists(self) -> [Hockeyist]:
         return self.world.hockeyists
 
-    @property
+    @tick_cached_property
     def can_influence_opponent(self):
         return any(map(self.can_influence_by_stick, self.opponent_hockeyists))
 
@@ -257,33 +276,40 @@ class BaseStrategy:
     def state(self) -> HockeyistState:
         return self.me.state
 
-    @property
+    @tick_cached_property
     def angle_to_puck(self):
         return self.get_angle_to_unit(self.puck)
 
     @property
     def goal_net_top_corner(self):
-        return self.get_goal_net_top_corner(self.player)
+        return self.index.rink.goal_net_top_corner
 
     @property
     def goal_net_bottom_corner(self):
-        return self.get_goal_net_bottom_corner(self.player)
+        return self.index.rink.goal_net_bottom_corner
 
     @staticmethod
     def get_goal_net_top_corner(player):
-        return Point(player.net_front, player.net_top)
+        return RinkGeometry.get_goal_net_top_corner(player)
 
     @staticmethod
     def get_goal_net_bottom_corner(player):
-        return Point(player.net_front, player.net_bottom)
+        return RinkGeometry.get_goal_net_bottom_corner(player)
 
-    @property
+    @tick_cached_property
     def kick_opponent_action(self):
         return self.swing_as_long_as_needed
 
     @property
     def swing_as_long_as_needed(self):
-        return self.swing_at_most(self.max_effective_swing_ticks)
+        """
+        Swing until the knockdown chance can't grow any more, for max_effective_swing_ticks without NumPy
+        """
+        if self.outcomes is None:
+            return self.swing_at_most(self.max_effective_swing_ticks)
+
+        return self.swing_at_most(self.outcomes.get_swing_ticks_for_knockdown_chance(self.me,
+                                                                                    self.game.max_action_chance))
 
     def swing_at_most(self, max_swing_ticks):
         if self.swing_ticks >= max_swing_ticks:
@@ -291,7 +317,7 @@ class BaseStrategy:
         else:
             return ActionType.SWING
 
-    @property
+    @tick_cached_property
     def take_puck_or_prevent_attack_or_attack_opponent(self):
         if self.own_puck:
             return ActionType.NONE
@@ -307,7 +333,7 @@ class BaseStrategy:
         else:
             return ActionType.NONE
 
-    @property
+    @tick_cached_property
     def influence_opponent_action(self):
         if self.can_influence_opponent:
             return self.kick_opponent_action
@@ -324,56 +350,53 @@ class BaseStrategy:
 
     @staticmethod
     def get_speed_vector(unit) -> Vector:
-        return Vector(BaseStrategy.get_unit_position(unit),
-                      BaseStrategy.get_unit_position(unit) + Point(unit.speed_x, unit.speed_y))
+        return Vector(Point(unit.x, unit.y), Point(unit.x + unit.speed_x, unit.y + unit.speed_y))
 
     @staticmethod
     def get_unit_position(unit) -> Point:
         return Point(unit.x, unit.y)
 
-    @property
+    @tick_cached_property
     def puck_speed_vector(self) -> Vector:
         return self.get_speed_vector(self.puck)
 
-    @property
+    @tick_cached_property
     def speed_vector(self):
         return self.get_speed_vector(self.me)
 
     @staticmethod
     def vector_is_between(v1, v2, v3):
-        angle1 = v1.angle_to(v2)
-        angle2 = v1.angle_to(v3)
-
-        return (angle1 <= 0 <= angle2 or angle2 <= 0 <= angle1) and abs(angle1) < pi / 2 and abs(angle2) < pi / 2
+        return is_between(v1.dx, v1.dy, v2.dx, v2.dy, v3.dx, v3.dy)
 
-    @property
+    @tick_cached_property
     def puck_is_moving(self):
         return self.puck_speed_vector.length > 0
 
-    @property
+    @tick_cached_property
     def puck_position(self):
         return Point(self.puck.x, self.puck.y)
 
     def puck_is_moving_to_goal_net(self, player):
-        top = Vector(self.puck_position, self.get_goal_net_top_corner(player))
-        bottom = Vector(self.puck_position, self.get_goal_net_bottom_corner(player))
-
-        return self.puck_is_free and self.puck_is_moving and self.vector_is_between(self.puck_speed_vector, top, bottom)
+        """
+        :return: whether the free puck goes into player's goal net within PuckTrajectory.tick_count ticks, bounces
+            off the boards included
+        """
+        return self.puck_is_free and self.puck_is_moving and self.puck_trajectory.get_net_crossing(player) is not None
 
-    @property
+    @tick_cached_property
     def puck_is_moving_to_our_goal_net(self):
         return self.puck_is_moving_to_goal_net(self.player)
 
-    @property
+    @tick_cached_property
     def puck_is_moving_to_opponent_goal_net(self):
         return self.puck_is_moving_to_goal_net(self.opponent)
 
-    @property
+    @tick_cached_property
     def puck_is_dangerous(self):
         return (self.puck_is_moving_to_our_goal_net and
                 self.puck_speed_vector.length > self._dangerous_puck_speed_vector_length)
 
-    @property
+    @tick_cached_property
     def opponent_is_going_to_attack(self):
         if self.opponent_team_own_puck:
             puck_owner = self.puck_owner
@@ -387,17 +410,16 @@ class BaseStrategy:
         else:
             return False
 
-    @property
+    @tick_cached_property
     def opponent_defenceman(self):
-        defenceman = sorted(self.opponent_hockeyists,
-                            key=lambda h: h.get_distance_to_unit(self.opponent_goal_net_center))[0]
+        defenceman, distance = self.index.opponent_nearest_to_net
 
-        if defenceman.get_distance_to_unit(self.opponent_goal_net_center) < self._opponent_defenceman_distance:
+        if distance < self._opponent_defenceman_distance:
             return defenceman
         else:
             return None
 
-    @property
+    @tick_cached_property
     def opponent_has_defenceman(self):
         return self.opponent_defenceman is not None
 
@@ -417,18 +439,62 @@ class BaseStrategy:
         a = Point(unit.speed_x, unit.speed_y) * self._future
         return Point(unit.x, unit.y) + a
 
-    @property
+    @tick_cached_property
     def future_puck_position(self):
         return self.get_future_position(self.puck)
 
     @property
+    def puck_trajectory(self) -> PuckTrajectory:
+        return PuckTrajectory.of(self.world, self.game)
+
+    @property
+    def simulator(self):
+        """
+        Forward simulator of the game for evaluating candidate moves, requires NumPy
+        :rtype: forward_simulator.ForwardSimulator
+        """
+        from forward_simulator import ForwardSimulator
+
+        return ForwardSimulator.of(self.game)
+
+    @property
+    def outcomes(self):
+        """
+        Lookup tables of the expected outcomes of actions, None without NumPy
+        :rtype: action_outcomes.ActionOutcomes
+        """
+        return None if ActionOutcomes is None else ActionOutcomes.of(self.game)
+
+    @property
+    def shot_field(self):
+        """
+        Chances to score from the offensive zone, None without NumPy
+        :rtype: shot_field.ShotField
+        """
+        return None if ShotField is None else ShotField.of(self.game)
+
+    @tick_cached_property
+    def opponent_goalie(self) -> Hockeyist:
+        return next((h for h in self.index.goalies if not h.teammate), None)
+
+    @tick_cached_property
+    def own_speed_along_heading(self):
+        return self.me.speed_x * cos(self.me.angle) + self.me.speed_y * sin(self.me.angle)
+
+    def get_shot_speed(self, swing_ticks):
+        """
+        :return: expected speed of the puck struck after swing_ticks, requires NumPy
+        """
+        return self.outcomes.get_struck_puck_speed(self.me, swing_ticks) + self.own_speed_along_heading
+
+    @tick_cached_property
     def optimal_position_to_puck(self):
         return self.optimal_position_to_interact_with(self.puck)
 
     def get_future_unit_position(self, unit, seconds=1):
-        return self.get_unit_position(unit) + self.get_speed_vector(unit).delta * seconds
+        return Point(unit.x + unit.speed_x * seconds, unit.y + unit.speed_y * seconds)
 
-    @property
+    @tick_cached_property
     def current_speed(self):
         return self.speed_vector.length
 
@@ -438,40 +504,43 @@ class BaseStrategy:
         if self.current_speed < minimal_speed_vector and self.puck_speed_vector.length < minimal_speed_vector:
             return self.get_unit_position(unit)
 
-        t_increase = 100
-        t_max = 1000
-
-        t_left = 0
-        t_right = t_left + t_increase
+        intercept_time = get_intercept_time(unit.x - self.me.x, unit.y - self.me.y, unit.speed_x, unit.speed_y,
+                                            self.hockeyist_max_speed * 0.9)
 
-        p_right = self.get_future_unit_position(unit, t_right)
-
-        while self.get_distance_to_unit(p_right) / (self.hockeyist_max_speed * 0.9) > t_right and t_right < t_max:
-            t_left, t_right = t_right, t_right + t_increase
-
-            p_right = self.get_future_unit_position(unit, t_right)
-
-        if t_right >= t_max:
+        if intercept_time is None or intercept_time >= self._max_intercept_time:
             return self.get_unit_position(unit)
 
-        t_curr = (t_left + t_right) / 2
-        p_curr = self.get_future_unit_position(unit, t_curr)
+        return self.get_future_unit_position(unit, intercept_time)
 
-        t_eps = 0.01
+    def no_goalies(self):
+        return not self.index.goalies
 
-        while abs(self.get_distance_to_unit(p_curr) / (self.hockeyist_max_speed * 0.9) - t_curr) > t_eps:
-            if self.get_distance_to_unit(p_curr) / (self.hockeyist_max_speed * 0.9) > t_curr:
-                t_left = t_curr
-            else:
-                t_right = t_curr
+    @property
+    def time_left(self):
+        """
+        :return: seconds left until the soft deadline of the tick, infinite if there is none
+        """
+        return latency_watchdog.time_left()
 
-            t_curr = (t_left + t_right) / 2
-            p_curr = self.get_future_unit_position(unit, t_curr)
+    def on_tick(self, me: Hockeyist, world: World, game: Game, move: Move):
+        """
+        Rebinds the long-lived strategy to the hockeyist and the world of a new tick and updates its state.
+        Unlike the property setters, doesn't check the types.
+        """
+        self._me = me
+        self._world = world
+        self._index = WorldIndex.of(world)
+        self._game = game
+        self._move = move
 
-        return p_curr
+        invalidate_tick_cache(self)
+        self.update_state()
 
-    def no_goalies(self):
-        return not any(h.type == HockeyistType.GOALIE for h in self.world.hockeyists)
+    def update_state(self):
+        """
+        Called by on_tick once the strategy is rebound; subclasses also call it at the end of __init__
+        """
+        pass
 
     #endregion
 
@@ -488,6 +557,7 @@ class BaseStrategy:
     def me(self, value):
         assert isinstance(value, Hockeyist)
         self._me = value
+        invalidate_tick_cache(self)
 
     @property
     def world(self):
@@ -500,6 +570,16 @@ class BaseStrategy:
     def world(self, value):
         assert isinstance(value, World)
         self._world = value
+        self._index = WorldIndex.of(value)
+        invalidate_tick_cache(self)
+
+    @property
+    def index(self):
+        """
+        Per-tick index of the world, shared with the strategies of teammates
+        :rtype: WorldIndex
+        """
+        return self._index
 
     @property
     def game(self):
@@ -512,6 +592,7 @@ class BaseStrategy:
     def game(self, value):
         assert isinstance(value, Game)
         self._game = value
+        invalidate_tick_cache(self)
 
     @property
     def move(self):
@@ -559,6 +640,9 @@ class BaseStrategy:
 
     @staticmethod
     def initial_info():
-        return {}
+        """
+        :return: the info shared by all instances of the strategy, None if it has no state
+        """
+        return None
 
     #endregion
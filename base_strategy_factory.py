@@ -2,19 +2,23 @@
 This module provides classes for representing base strategy factory pattern
 """
 from base_strategy import BaseStrategy
+from forward_strategy import ForwardStrategy
 from strategies_shared_info import StrategiesSharedInfo
+from team_plan import Role, TeamPlan
 
 __all__ = ['BaseStrategyFactory']
 
 
 class BaseStrategyFactory:
     _instance = None
+    forward_strategy = ForwardStrategy
 
     def __init__(self):
         self._last_strategies = None
         self._strategies_info = StrategiesSharedInfo()
 
         self.last_strategies = {}
+        self.instances = {}
         self.info = self.info or {strategy: strategy.initial_info() for strategy in self.strategies}
 
     def __new__(cls, *args, **kwargs):
@@ -26,7 +30,54 @@ class BaseStrategyFactory:
         pass
 
     def create_base_strategy(self, me, world, game, move):
-        return BaseStrategy(me, world, game, move, self.info[BaseStrategy])
+        return self.get_strategy(BaseStrategy, me, world, game, move)
+
+    def get_strategy(self, strategy, me, world, game, move) -> BaseStrategy:
+        """
+        :return: the long-lived instance of the strategy class for the hockeyist, constructed on the first call and
+            rebound to the tick by on_tick afterwards
+        """
+        instance = self.instances.get((me.id, strategy))
+
+        if instance is None:
+            instance = self.instances[me.id, strategy] = strategy(me, world, game, move, self.info[strategy])
+        else:
+            instance.on_tick(me, world, game, move)
+
+        return instance
+
+    def get_role(self, strategy: BaseStrategy):
+        """
+        :return: role of strategy.me in the team plan of the tick, which is built on the first call within the tick
+        """
+        index = strategy.index
+
+        if index.team_plan is None:
+            roles = self.get_team_roles(strategy)
+            costs = [[self.get_role_cost(strategy, hockeyist, role) for role in roles]
+                     for hockeyist in index.my_hockeyists]
+            index.team_plan = TeamPlan(index.my_hockeyists, roles, costs)
+
+        return index.team_plan.get_role(strategy.me)
+
+    def get_team_roles(self, strategy: BaseStrategy):
+        """
+        :return: one role per hockeyist of index.my_hockeyists
+        """
+        return []
+
+    def get_role_cost(self, strategy: BaseStrategy, hockeyist, role):
+        """
+        :return: cost of hockeyist playing role, by default the distance to the puck for the roles going for it
+        """
+        if role not in (Role.FORWARD, Role.INTERCEPT):
+            return 0.0
+
+        puck_owner = strategy.index.puck_owner
+        if puck_owner is not None and puck_owner.id == hockeyist.id:
+            return 0.0
+
+        return hockeyist.get_distance_to_unit(strategy.puck)
 
     @property
     def strategies(self):
@@ -0,0 +1,59 @@
+"""
+Benchmark of forward_simulator.ForwardSimulator: simulated future-ticks per second for batches of futures stepped
+at once, the way the search strategy scores its candidates, against stepping the same futures one by one.
+
+    python benchmarks/bench_forward_simulator.py [--horizon T] [--seconds S]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests'))
+
+import numpy as np
+
+from helpers import make_game, make_world
+
+from forward_simulator import ForwardSimulator
+
+
+def measure(simulator, hockeyist, puck, count, speed_ups, turns, seconds):
+    """
+    :return: simulated future-ticks per second
+    """
+    runs = 0
+    started = time.perf_counter()
+
+    while time.perf_counter() - started < seconds:
+        simulator.simulate(simulator.start(hockeyist, puck, count), speed_ups, turns)
+        runs += 1
+
+    return runs * count * speed_ups.shape[-1] / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--horizon', type=int, default=30)
+    parser.add_argument('--seconds', type=float, default=1.0)
+    options = parser.parse_args()
+
+    simulator = ForwardSimulator(make_game())
+    world = make_world(7, 2, puck_owner=2)
+    hockeyist = world.hockeyists[1]
+    rnd = np.random.default_rng(1)
+
+    single = None
+
+    for count in (1, 35, 256, 1024):
+        speed_ups = rnd.uniform(-1, 1, (count, options.horizon))
+        turns = rnd.uniform(-0.1, 0.1, (count, options.horizon))
+        rate = measure(simulator, hockeyist, world.puck, count, speed_ups, turns, options.seconds)
+        single = single or rate
+
+        print('%5d futures: %10.0f future-ticks/s (%.1fx one at a time), %.3f ms per batch of %d ticks' %
+              (count, rate, rate / single, count * options.horizon / rate * 1000, options.horizon))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Micro-benchmark of intercept.get_intercept_time, the closed form used by BaseStrategy.optimal_position_to_interact_with,
+against the original search which scanned the time axis in steps of 100 ticks and bisected to 0.01 tick.
+
+    python benchmarks/bench_intercept.py [--pairs N] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from math import hypot
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from intercept import get_intercept_time
+
+
+def get_intercept_time_by_search(dx, dy, speed_x, speed_y, pursuer_speed, t_increase=100, t_max=1000, t_eps=0.01):
+    """
+    The original search, on plain floats instead of Points
+    """
+    def get_time_to_reach(t):
+        return hypot(dx + speed_x * t, dy + speed_y * t) / pursuer_speed
+
+    t_left, t_right = 0, t_increase
+
+    while get_time_to_reach(t_right) > t_right and t_right < t_max:
+        t_left, t_right = t_right, t_right + t_increase
+
+    if t_right >= t_max:
+        return None
+
+    t_curr = (t_left + t_right) / 2
+
+    while abs(get_time_to_reach(t_curr) - t_curr) > t_eps:
+        if get_time_to_reach(t_curr) > t_curr:
+            t_left = t_curr
+        else:
+            t_right = t_curr
+
+        t_curr = (t_left + t_right) / 2
+
+    return t_curr
+
+
+def make_pairs(count, seed):
+    """
+    :return: offsets and velocities of targets as seen on the rink, the puck being up to twice as fast as the pursuer
+    """
+    rnd = random.Random(seed)
+
+    return [(rnd.uniform(-1000, 1000), rnd.uniform(-600, 600), rnd.uniform(-20, 20), rnd.uniform(-20, 20))
+            for _ in range(count)]
+
+
+def measure(function, pairs, pursuer_speed):
+    started = time.perf_counter()
+
+    for dx, dy, speed_x, speed_y in pairs:
+        function(dx, dy, speed_x, speed_y, pursuer_speed)
+
+    return (time.perf_counter() - started) / len(pairs) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pairs', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=1)
+    options = parser.parse_args()
+
+    pursuer_speed = 15.0 * 0.9
+    pairs = make_pairs(options.pairs, options.seed)
+
+    max_difference = 0.0
+    disagreements = 0
+
+    for dx, dy, speed_x, speed_y in pairs:
+        closed_form = get_intercept_time(dx, dy, speed_x, speed_y, pursuer_speed)
+        search = get_intercept_time_by_search(dx, dy, speed_x, speed_y, pursuer_speed)
+
+        if closed_form is not None and closed_form >= 1000:
+            closed_form = None
+
+        if (closed_form is None) != (search is None):
+            disagreements += 1
+        elif closed_form is not None:
+            max_difference = max(max_difference, abs(closed_form - search))
+
+    closed_form = measure(get_intercept_time, pairs, pursuer_speed)
+    search = measure(get_intercept_time_by_search, pairs, pursuer_speed)
+
+    print('closed form %.2f us, search %.2f us per pair (%.1fx)' % (closed_form, search, search / closed_form))
+    print('max time difference %.4f ticks, %d of %d pairs reachable by only one of them' %
+          (max_difference, disagreements, len(pairs)))
+
+
+if __name__ == '__main__':
+    main()
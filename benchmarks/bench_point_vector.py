@@ -0,0 +1,116 @@
+"""
+Micro-benchmark of the slotted point.Point and vector.Vector against the original classes, which had a __dict__,
+built intermediate Points in every operation and normalised the difference of two atan2 calls in angle_to.
+
+    python benchmarks/bench_point_vector.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+from math import hypot, atan2, pi
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from point import Point
+from vector import Vector, get_angle_between
+
+
+class ReferencePoint:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __mul__(self, other):
+        return ReferencePoint(self.x * other, self.y * other)
+
+    def __add__(self, other):
+        return ReferencePoint(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return self + -other
+
+    def __neg__(self):
+        return ReferencePoint(-self.x, -self.y)
+
+
+class ReferenceVector:
+    def __init__(self, a, b):
+
+        if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+            self.start = ReferencePoint(0, 0)
+            self.end = ReferencePoint(a, b)
+        else:
+            self.start = a
+            self.end = b
+
+    def __mul__(self, n):
+        return ReferenceVector(self.start, self.start + self.delta * n)
+
+    @property
+    def dx(self):
+        return self.end.x - self.start.x
+
+    @property
+    def dy(self):
+        return self.end.y - self.start.y
+
+    @property
+    def delta(self):
+        return ReferencePoint(self.dx, self.dy)
+
+    @property
+    def length(self):
+        return hypot(self.dx, self.dy)
+
+    def angle_to(self, v):
+        angle = atan2(v.dy, v.dx) - atan2(self.dy, self.dx)
+
+        while angle > pi:
+            angle -= 2.0 * pi
+
+        while angle < -pi:
+            angle += 2.0 * pi
+
+        return angle
+
+
+def measure(statement, namespace, repeat):
+    return min(timeit.repeat(statement, globals=namespace, number=repeat, repeat=5)) / repeat * 1e9
+
+
+def measure_memory(point_class, count):
+    tracemalloc.start()
+    points = [point_class(float(index), float(index)) for index in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del points
+    return size / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=200000)
+    options = parser.parse_args()
+
+    cases = [('a - b', 'a - b'), ('v * 2', 'v * 2'), ('v.angle_to(w)', 'v.angle_to(w)'), ('v.length', 'v.length')]
+    namespaces = []
+
+    for point_class, vector_class in ((Point, Vector), (ReferencePoint, ReferenceVector)):
+        a, b = point_class(3.0, 4.0), point_class(-1.0, 2.5)
+        namespaces.append(dict(a=a, b=b, v=vector_class(a, b), w=vector_class(b, point_class(7.0, -2.0))))
+
+    for name, statement in cases:
+        current, reference = (measure(statement, namespace, options.repeat) for namespace in namespaces)
+        print('%-14s %7.0f ns, original %7.0f ns' % (name, current, reference))
+
+    print('%-14s %7.0f ns' % ('angle, floats', measure('get_angle_between(1.0, 2.0, -3.0, 0.5)',
+                                                      dict(get_angle_between=get_angle_between), options.repeat)))
+    print('100k points    %7.1f MB, original %7.1f MB' % (measure_memory(Point, 100000),
+                                                          measure_memory(ReferencePoint, 100000)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Throughput of the compiled protocol readers and writers: player contexts decoded and encoded per second.
+
+    python benchmarks/bench_protocol_codec.py [--team-size N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests'))
+
+from helpers import make_client, make_player_context, make_world
+
+import protocol_codec
+
+
+def measure(function, count):
+    started = time.perf_counter()
+
+    for _ in range(count):
+        function()
+
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--team-size', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=20000)
+    options = parser.parse_args()
+
+    context = make_player_context(make_world(10, options.team_size))
+    data = bytearray()
+    protocol_codec.write_player_context(data, context)
+    data = bytes(data)
+
+    client = make_client(data * options.repeat)
+    pooled_client = make_client(data * options.repeat, reuse_objects=True)
+
+    def decode():
+        protocol_codec.read_player_context(client)
+
+    def decode_pooled():
+        protocol_codec.read_pooled_player_context(pooled_client, pooled_client._pools)
+
+    def encode():
+        protocol_codec.write_player_context(bytearray(), context)
+
+    print('player context: %d bytes, team size %d' % (len(data), options.team_size))
+
+    for name, function in (('decode', decode), ('decode pooled', decode_pooled), ('encode', encode)):
+        rate = measure(function, options.repeat)
+        print('%-14s %10.0f contexts/s %8.1f MB/s' % (name, rate, rate * len(data) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Micro-benchmark of ShotField.get_scored_counts as the goalie moves, updating ScoredCounts in place, against the full
+compute from the static tables that every new goalie bucket took before.
+
+    python benchmarks/bench_shot_field.py [--ticks N] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests'))
+
+from helpers import make_game, make_hockeyist
+from model.HockeyistType import HockeyistType
+from shot_field import ShotField
+from test_shot_field import get_counts_by_full_compute
+
+
+def make_goalie_ys(count, seed):
+    """
+    :return: goalie positions of a goalie moving up and down the goal mouth at up to goalie_max_speed
+    """
+    rnd = random.Random(seed)
+    goalie_ys = [470.0]
+
+    while len(goalie_ys) < count:
+        goalie_ys.append(min(max(goalie_ys[-1] + rnd.uniform(-6.0, 6.0), 400.0), 540.0))
+
+    return goalie_ys
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    options = parser.parse_args()
+
+    field = ShotField(make_game())
+    goalie = make_hockeyist(type=HockeyistType.GOALIE, teammate=False)
+    goalie_ys = make_goalie_ys(options.ticks, options.seed)
+    puck_speed = 20.0
+
+    started = time.perf_counter()
+    field.get_scored_counts(goalie, puck_speed)
+    first = time.perf_counter() - started
+
+    started = time.perf_counter()
+
+    for goalie_y in goalie_ys:
+        goalie.y = goalie_y
+        field.get_scored_counts(goalie, puck_speed)
+
+    incremental = (time.perf_counter() - started) / len(goalie_ys)
+
+    buckets = sorted({int(goalie_y / field.GOALIE_STEP + 0.5) for goalie_y in goalie_ys})
+    started = time.perf_counter()
+
+    for bucket in buckets:
+        get_counts_by_full_compute(field, bucket * field.GOALIE_STEP, goalie.radius, puck_speed)
+
+    full = (time.perf_counter() - started) / len(buckets)
+    counts = next(iter(field.scored_counts.values()))
+    kept = sum(array.nbytes for array in (counts.lowers, counts.lower_cells, counts.uppers, counts.upper_cells,
+                                          counts.flat_counts))
+
+    print('first query %.2f ms, then %.1f us per tick; full compute %.2f ms per goalie bucket' %
+          (first * 1e3, incremental * 1e6, full * 1e3))
+    print('%.2f MB kept per puck speed, %.2f MB per goalie bucket and puck speed before' %
+          (kept / 2 ** 20, int(np.prod(field.shape)) * 8 / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
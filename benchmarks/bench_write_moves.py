@@ -0,0 +1,85 @@
+"""
+Micro-benchmark of sending a MOVE message: RemoteProcessClient.write_moves_message, buffered and sent with one
+sendall, against the original writer which sent every field with its own sendall.
+
+    python benchmarks/bench_write_moves.py [--repeat N]
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests'))
+
+from helpers import make_client
+
+from RemoteProcessClient import RemoteProcessClient
+from model.ActionType import ActionType
+from model.Move import Move
+
+
+def write_moves_message_unbuffered(socket, moves):
+    """
+    Field by field writer of the original RemoteProcessClient
+    """
+    socket.sendall(struct.pack('<b', RemoteProcessClient.MessageType.MOVE))
+    socket.sendall(struct.pack('<i', len(moves)))
+
+    for move in moves:
+        socket.sendall(struct.pack('<?', True))
+        socket.sendall(struct.pack('<d', move.speed_up))
+        socket.sendall(struct.pack('<d', move.turn))
+        socket.sendall(struct.pack('<b', move.action))
+
+        if move.action == ActionType.PASS:
+            socket.sendall(struct.pack('<d', move.pass_power))
+            socket.sendall(struct.pack('<d', move.pass_angle))
+        elif move.action == ActionType.SUBSTITUTE:
+            socket.sendall(struct.pack('<i', move.teammate_index))
+
+
+def make_moves(team_size):
+    moves = []
+
+    for index in range(team_size):
+        move = Move()
+        move.speed_up, move.turn = 1.0, 0.05 * index
+        move.action = (ActionType.SWING, ActionType.PASS, ActionType.NONE)[index % 3]
+        moves.append(move)
+
+    return moves
+
+
+def measure(function, repeat):
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        function()
+
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=50000)
+    options = parser.parse_args()
+
+    for team_size in (2, 3, 6):
+        moves = make_moves(team_size)
+        client = make_client()
+        reference_client = make_client()
+
+        buffered = measure(lambda: client.write_moves_message(moves), options.repeat)
+        unbuffered = measure(lambda: write_moves_message_unbuffered(reference_client.socket, moves), options.repeat)
+
+        calls = client.socket.sendall_calls / options.repeat
+        reference_calls = reference_client.socket.sendall_calls / options.repeat
+        assert client.socket.sent == reference_client.socket.sent
+
+        print('%d moves: one sendall %.2f us (%d calls), sendall per field %.2f us (%d calls)' %
+              (team_size, buffered, calls, unbuffered, reference_calls))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,9 +4,10 @@ This module provides classes for representing defender strategy
 from enum import Enum
 from model.ActionType import ActionType
 
-from base_strategy import BaseStrategy
 
-from point import Point
+from state_machine import (StateMachineStrategy, StateInfo, StateBehaviour, Transition, Guard,
+                           OPPONENT_IS_GOING_TO_ATTACK, PUCK_IS_MOVING_TO_OUR_GOAL_NET, CAN_INFLUENCE_PUCK)
+from tick_cache import tick_cached_property
 from vector import Vector
 
 
@@ -23,7 +24,7 @@ class StrategyState(Enum):
     prevent_attack = 7
 
 
-class DefenceStrategy(BaseStrategy):
+class DefenceStrategy(StateMachineStrategy):
 
     def __init__(self, me, world, game, move, info):
         super().__init__(me, world, game, move, info)
@@ -33,107 +34,66 @@ class DefenceStrategy(BaseStrategy):
 
         self.update_state()
 
-    @property
-    def speed_up(self):
-        return {
-            StrategyState.undefined: 0.0,
-            StrategyState.move_to_defence_point: self.speed_up_to_defence_point,
-            StrategyState.normalize_speed: 0.0,
-            StrategyState.wait_for_attack: 0.0,
-            StrategyState.opponent_is_going_to_attack: 1.0,
-            StrategyState.the_puck_is_moving_to_our_goal_net: 0.0,
-            StrategyState.prevent_attack: 0.0
-        }[self.state]
-
-    @property
-    def turn(self):
-        return {
-            StrategyState.undefined: 0.0,
-            StrategyState.move_to_defence_point: self.angle_to_defence_point,
-            StrategyState.normalize_speed: 0.0,
-            StrategyState.wait_for_attack: self.angle_to_puck,
-            StrategyState.opponent_is_going_to_attack: self.get_angle_to_unit(self.optimal_position_to_puck),
-            StrategyState.the_puck_is_moving_to_our_goal_net: self.angle_to_puck,
-            StrategyState.prevent_attack: self.angle_to_puck
-        }[self.state]
-
-    @property
-    def action(self):
-        return {
-            StrategyState.undefined: ActionType.NONE,
-            StrategyState.move_to_defence_point: self.take_puck_or_prevent_attack_or_attack_opponent,
-            StrategyState.normalize_speed: self.take_puck_or_prevent_attack_or_attack_opponent,
-            StrategyState.wait_for_attack: self.take_puck_or_prevent_attack_or_attack_opponent,
-            StrategyState.opponent_is_going_to_attack: self.take_puck_or_prevent_attack_or_attack_opponent,
-            StrategyState.the_puck_is_moving_to_our_goal_net: ActionType.NONE,
-            StrategyState.prevent_attack: ActionType.STRIKE
-        }[self.state]
-
-    def update_state(self):
-        new_state = self.get_next_state(self.state)
-
-        while self.state != new_state:
-            self.state = new_state
-            new_state = self.get_next_state(self.state)
-
-    def get_next_state(self, state):
-        if self.distance_to_defence_point > self._allowed_distance_to_defence_point:
-            if self.state in (StrategyState.undefined,
-                              StrategyState.move_to_defence_point,
-                              StrategyState.normalize_speed,
-                              StrategyState.wait_for_attack) and not self.opponent_is_going_to_attack:
-                return StrategyState.move_to_defence_point
-
-        if state == StrategyState.undefined:
-            return StrategyState.move_to_defence_point
-
-        elif (state == StrategyState.move_to_defence_point and
-                self.distance_to_defence_point < self._allowed_distance_to_defence_point):
-            return StrategyState.normalize_speed
-
-        elif state == StrategyState.normalize_speed:
-            return StrategyState.wait_for_attack
-
-        elif state == StrategyState.wait_for_attack:
-            if self.opponent_is_going_to_attack:
-                return StrategyState.opponent_is_going_to_attack
-            elif self.puck_is_moving_to_our_goal_net:
-                return StrategyState.the_puck_is_moving_to_our_goal_net
-
-        elif state == StrategyState.opponent_is_going_to_attack:
-            if self.puck_is_moving_to_our_goal_net:
-                return StrategyState.the_puck_is_moving_to_our_goal_net
-            elif not self.opponent_is_going_to_attack:
-                return StrategyState.move_to_defence_point
-
-        elif state == StrategyState.the_puck_is_moving_to_our_goal_net:
-            if not self.puck_is_moving_to_our_goal_net:
-                return StrategyState.move_to_defence_point
-            if self.can_influence_puck:
-                return StrategyState.prevent_attack
-
-        elif state == StrategyState.prevent_attack and not self.puck_is_moving_to_our_goal_net:
-            return StrategyState.move_to_defence_point
-
-        return state
-
-    @staticmethod
-    def get_defence_vertical(player):
-        return abs(140 - player.net_back)
+    behaviours = {
+        StrategyState.undefined: StateBehaviour(),
+        StrategyState.move_to_defence_point: StateBehaviour(
+            speed_up=lambda s: s.speed_up_to_defence_point,
+            turn=lambda s: s.angle_to_defence_point,
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.normalize_speed: StateBehaviour(
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.wait_for_attack: StateBehaviour(
+            turn=lambda s: s.angle_to_puck,
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.opponent_is_going_to_attack: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.get_angle_to_unit(s.optimal_position_to_puck),
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.the_puck_is_moving_to_our_goal_net: StateBehaviour(
+            turn=lambda s: s.angle_to_puck),
+        StrategyState.prevent_attack: StateBehaviour(
+            turn=lambda s: s.angle_to_puck,
+            action=ActionType.STRIKE)
+    }
+
+    transitions = [
+        Transition((StrategyState.undefined,
+                    StrategyState.move_to_defence_point,
+                    StrategyState.normalize_speed,
+                    StrategyState.wait_for_attack), StrategyState.move_to_defence_point,
+                   Guard(lambda s: s.distance_to_defence_point > s._allowed_distance_to_defence_point) &
+                   ~OPPONENT_IS_GOING_TO_ATTACK),
+        Transition((StrategyState.undefined,), StrategyState.move_to_defence_point),
+        Transition((StrategyState.move_to_defence_point,), StrategyState.normalize_speed,
+                   Guard(lambda s: s.distance_to_defence_point < s._allowed_distance_to_defence_point)),
+        Transition((StrategyState.normalize_speed,), StrategyState.wait_for_attack),
+        Transition((StrategyState.wait_for_attack,), StrategyState.opponent_is_going_to_attack,
+                   OPPONENT_IS_GOING_TO_ATTACK),
+        Transition((StrategyState.wait_for_attack,
+                    StrategyState.opponent_is_going_to_attack), StrategyState.the_puck_is_moving_to_our_goal_net,
+                   PUCK_IS_MOVING_TO_OUR_GOAL_NET),
+        Transition((StrategyState.opponent_is_going_to_attack,), StrategyState.move_to_defence_point,
+                   ~OPPONENT_IS_GOING_TO_ATTACK),
+        Transition((StrategyState.the_puck_is_moving_to_our_goal_net,
+                    StrategyState.prevent_attack), StrategyState.move_to_defence_point,
+                   ~PUCK_IS_MOVING_TO_OUR_GOAL_NET),
+        Transition((StrategyState.the_puck_is_moving_to_our_goal_net,), StrategyState.prevent_attack,
+                   CAN_INFLUENCE_PUCK)
+    ]
 
     @property
     def defence_vertical(self):
-        return self.get_defence_vertical(self.player)
+        return self.rink.defence_vertical
 
     @property
     def defence_point(self):
-        return Point(self.defence_vertical, self.goal_net_horizontal)
+        return self.rink.defence_point
     
-    @property
+    @tick_cached_property
     def distance_to_defence_point(self):
         return self.get_distance_to_unit(self.defence_point)
 
-    @property
+    @tick_cached_property
     def speed_up_to_defence_point(self):
         speed_up = (self.distance_to_defence_point / 20)**0.5
 
@@ -146,7 +106,7 @@ class DefenceStrategy(BaseStrategy):
         return (self.unit_is_behind(position) and
                 self.get_distance_to_unit(position) < self._allowed_distance_to_move_backward)
 
-    @property
+    @tick_cached_property
     def angle_to_defence_point(self):
         angle = self.get_angle_to_unit(self.defence_point)
         
@@ -155,24 +115,14 @@ class DefenceStrategy(BaseStrategy):
             
         return angle
     
-    @property
+    @tick_cached_property
     def vector_from_goal_net_to_puck(self) -> Vector:
         return Vector(self.goal_net_center, self.puck)
 
-    @property
+    @tick_cached_property
     def distance_from_net_to_player(self):
         return self.get_distance_to_unit(self.goal_net_center)
 
     @staticmethod
     def initial_info():
-        return {
-            'state': StrategyState.undefined
-        }
-
-    @property
-    def state(self):
-        return self.info['state']
-
-    @state.setter
-    def state(self, value):
-        self.info['state'] = value
+        return StateInfo(StrategyState.undefined)
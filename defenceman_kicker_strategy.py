@@ -2,9 +2,10 @@
 This module provides classes for representing defenceman kicker strategy
 """
 from kicker_strategy import KickerStrategy
+from tick_cache import tick_cached_property
 
 
 class DefencemanKickerStrategy(KickerStrategy):
-    @property
+    @tick_cached_property
     def opponent_to_be_attacked(self):
         return self.opponent_defenceman or self.nearest_opponent
\ No newline at end of file
@@ -0,0 +1,201 @@
+"""
+This module provides an approximate simulator of one hockeyist and the puck, stepping K candidate futures at once.
+
+Every future is a column of the SimulationState arrays. A step applies one (speed_up, turn) pair per future:
+  * the turn is limited by hockeyist_turn_angle_factor and the speed up is scaled by hockeyist_speed_up_factor or
+    hockeyist_speed_down_factor, both times the hockeyist's agility weakened by lack of stamina;
+  * the speed decays by friction, is limited by hockeyist_max_speed and the hockeyist bounces off the boards;
+  * stamina is spent by speed_up_stamina_cost_factor and turn_stamina_cost_factor and restored by
+    active_hockeyist_stamina_growth_per_tick;
+  * a puck owned by the hockeyist is carried puck_binding_range ahead of the hockeyist, a free puck moves as in
+    PuckTrajectory (the goal mouths are not modelled here).
+
+Other hockeyists, collisions and actions are not simulated. Friction and restitution are not part of Game, their
+defaults are rough estimates, and no step has been checked against ticks recorded from the game server: rollouts
+rank candidate moves against each other, they don't predict the next tick. Requires NumPy.
+"""
+from math import pi
+
+import numpy as np
+
+from model.Game import Game
+from model.Hockeyist import Hockeyist
+from model.Puck import Puck
+from puck_trajectory import PuckTrajectory
+
+
+__all__ = ['ForwardSimulator', 'SimulationState']
+
+
+class SimulationState:
+    FIELDS = ('x', 'y', 'speed_x', 'speed_y', 'angle', 'stamina', 'puck_x', 'puck_y', 'puck_speed_x', 'puck_speed_y')
+
+    def __init__(self, count, radius=30.0, puck_radius=20.0, agility=100.0):
+        self.count = count
+        self.tick = 0
+
+        self.radius = radius
+        self.puck_radius = puck_radius
+        self.agility = agility
+
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(count))
+
+        self.own_puck = np.zeros(count, bool)
+
+    def copy(self):
+        state = SimulationState(self.count, self.radius, self.puck_radius, self.agility)
+        state.tick = self.tick
+
+        for name in self.FIELDS + ('own_puck',):
+            setattr(state, name, getattr(self, name).copy())
+
+        return state
+
+
+class ForwardSimulator:
+    DEFAULT_HOCKEYIST_SPEED_RETENTION = 0.98
+    DEFAULT_BOARD_RESTITUTION = 0.25
+
+    def __init__(self, game: Game, hockeyist_speed_retention=DEFAULT_HOCKEYIST_SPEED_RETENTION,
+                 puck_speed_retention=PuckTrajectory.DEFAULT_SPEED_RETENTION,
+                 board_restitution=DEFAULT_BOARD_RESTITUTION):
+        self.game = game
+        self.hockeyist_speed_retention = hockeyist_speed_retention
+        self.puck_speed_retention = puck_speed_retention
+        self.board_restitution = board_restitution
+
+    @staticmethod
+    def of(game: Game):
+        """
+        :return: the simulator of the game, attached to it as game.simulator
+        :rtype: ForwardSimulator
+        """
+        simulator = getattr(game, 'simulator', None)
+
+        if simulator is None:
+            simulator = game.simulator = ForwardSimulator(game)
+
+        return simulator
+
+    def start(self, hockeyist: Hockeyist, puck: Puck, count) -> SimulationState:
+        """
+        :return: count identical futures starting from the current hockeyist and puck
+        """
+        state = SimulationState(count, hockeyist.radius, puck.radius, float(hockeyist.agility))
+
+        state.x[:] = hockeyist.x
+        state.y[:] = hockeyist.y
+        state.speed_x[:] = hockeyist.speed_x
+        state.speed_y[:] = hockeyist.speed_y
+        state.angle[:] = hockeyist.angle
+        state.stamina[:] = hockeyist.stamina
+
+        state.puck_x[:] = puck.x
+        state.puck_y[:] = puck.y
+        state.puck_speed_x[:] = puck.speed_x
+        state.puck_speed_y[:] = puck.speed_y
+        state.own_puck[:] = puck.owner_hockeyist_id == hockeyist.id
+
+        return state
+
+    def get_max_turns(self, state):
+        game = self.game
+        effectiveness = (game.zero_stamina_hockeyist_effectiveness_factor +
+                         (1.0 - game.zero_stamina_hockeyist_effectiveness_factor) *
+                         state.stamina / game.hockeyist_max_stamina)
+        agility = state.agility * effectiveness / game.hockeyist_attribute_base_value
+
+        return game.hockeyist_turn_angle_factor * agility, agility
+
+    def step(self, state: SimulationState, speed_up, turn):
+        """
+        Advances every future by one tick in place. speed_up and turn are scalars or arrays of state.count items.
+        """
+        game = self.game
+
+        speed_up = np.clip(speed_up, -1.0, 1.0)
+        max_turns, agility = self.get_max_turns(state)
+        turn = np.clip(turn, -max_turns, max_turns)
+
+        angle = state.angle + turn
+        angle = np.where(angle > pi, angle - 2.0 * pi, angle)
+        state.angle = np.where(angle < -pi, angle + 2.0 * pi, angle)
+
+        acceleration = np.where(speed_up >= 0, game.hockeyist_speed_up_factor, game.hockeyist_speed_down_factor)
+        acceleration = acceleration * speed_up * agility
+        cos, sin = np.cos(state.angle), np.sin(state.angle)
+
+        speed_x = (state.speed_x + acceleration * cos) * self.hockeyist_speed_retention
+        speed_y = (state.speed_y + acceleration * sin) * self.hockeyist_speed_retention
+
+        speed = np.hypot(speed_x, speed_y)
+        limit = np.where(speed > game.hockeyist_max_speed, game.hockeyist_max_speed / np.maximum(speed, 1e-9), 1.0)
+        state.speed_x = speed_x * limit
+        state.speed_y = speed_y * limit
+
+        state.x, state.speed_x = self._move(state.x + state.speed_x, state.speed_x, state.radius,
+                                            game.rink_left, game.rink_right)
+        state.y, state.speed_y = self._move(state.y + state.speed_y, state.speed_y, state.radius,
+                                            game.rink_top, game.rink_bottom)
+
+        stamina = (state.stamina - np.abs(speed_up) * game.speed_up_stamina_cost_factor -
+                   np.abs(turn) / game.hockeyist_turn_angle_factor * game.turn_stamina_cost_factor +
+                   game.active_hockeyist_stamina_growth_per_tick)
+        state.stamina = np.clip(stamina, 0.0, game.hockeyist_max_stamina)
+
+        self._step_puck(state, cos, sin)
+        state.tick += 1
+
+    def _step_puck(self, state, cos, sin):
+        game = self.game
+        owned = state.own_puck
+
+        free_x, free_speed_x = self._move(state.puck_x + state.puck_speed_x,
+                                          state.puck_speed_x * self.puck_speed_retention, state.puck_radius,
+                                          game.rink_left, game.rink_right)
+        free_y, free_speed_y = self._move(state.puck_y + state.puck_speed_y,
+                                          state.puck_speed_y * self.puck_speed_retention, state.puck_radius,
+                                          game.rink_top, game.rink_bottom)
+
+        state.puck_x = np.where(owned, state.x + game.puck_binding_range * cos, free_x)
+        state.puck_y = np.where(owned, state.y + game.puck_binding_range * sin, free_y)
+        state.puck_speed_x = np.where(owned, state.speed_x, free_speed_x)
+        state.puck_speed_y = np.where(owned, state.speed_y, free_speed_y)
+
+    def _move(self, position, speed, radius, low, high):
+        below = position - radius < low
+        above = position + radius > high
+
+        position = np.where(below, 2 * (low + radius) - position, position)
+        position = np.where(above, 2 * (high - radius) - position, position)
+        speed = np.where(below | above, -speed * self.board_restitution, speed)
+
+        return position, speed
+
+    def simulate(self, state: SimulationState, speed_ups, turns):
+        """
+        Runs state.count futures for T ticks in place; speed_ups and turns are arrays of shape (count, T), or
+        broadcastable to it, with the move of every future at every tick.
+        :return: the state
+        """
+        speed_ups = np.broadcast_to(speed_ups, np.broadcast(speed_ups, turns).shape)
+        turns = np.broadcast_to(turns, speed_ups.shape)
+
+        for tick in range(speed_ups.shape[-1]):
+            self.step(state, speed_ups[..., tick], turns[..., tick])
+
+        return state
+
+    def can_reach(self, state: SimulationState, x, y):
+        """
+        :return: boolean array telling in which futures the point is within the stick's reach
+        """
+        game = self.game
+        angle = np.arctan2(y - state.y, x - state.x) - state.angle
+        angle = np.abs((angle + pi) % (2.0 * pi) - pi)
+
+        return (np.hypot(x - state.x, y - state.y) < game.stick_length) & (angle < game.stick_sector / 2)
+
+    def can_reach_puck(self, state: SimulationState):
+        return self.can_reach(state, state.puck_x, state.puck_y)
@@ -2,11 +2,11 @@
 This module provides classes for representing forward strategy
 """
 from enum import Enum
-from math import copysign
 
-from model.ActionType import ActionType
-from base_strategy import BaseStrategy
 from point import Point
+from state_machine import (StateMachineStrategy, StateInfo, StateBehaviour, Transition, Guard, ANY_STATE,
+                           OUR_TEAM_OWN_PUCK)
+from tick_cache import tick_cached_property
 
 
 __all__ = ['ForwardStrategy']
@@ -22,7 +22,15 @@ class StrategyState(Enum):
     ready_to_strike = 7
 
 
-class ForwardStrategy(BaseStrategy):
+class ForwardInfo(StateInfo):
+    __slots__ = ('pre_attack_position',)
+
+    def __init__(self, state=StrategyState.undefined, pre_attack_position=None):
+        super().__init__(state)
+        self.pre_attack_position = pre_attack_position
+
+
+class ForwardStrategy(StateMachineStrategy):
 
     def __init__(self, me, world, game, move, info):
         super().__init__(me, world, game, move, info)
@@ -37,121 +45,78 @@ class ForwardStrategy(BaseStrategy):
 
         self.update_state()
 
-    @property
-    def speed_up(self):
-        return {
-            StrategyState.undefined: 1.0,
-            StrategyState.take_puck: 1.0,
-            StrategyState.set_to_attack: 1.0,
-            StrategyState.go_to_attack_position: 1.0,
-            StrategyState.rotate_to_goal_position: -0.5,
-            StrategyState.move_to_goal_position: 1.0,
-            StrategyState.ready_to_strike: 1.0
-        }[self.info['state']]
-
-    @property
-    def turn(self):
-        return {
-            StrategyState.undefined: 0.0,
-            StrategyState.take_puck: self.get_angle_to_unit(self.optimal_position_to_puck),
-            StrategyState.set_to_attack: self.angle_to_nearest_pre_attack_position,
-            StrategyState.go_to_attack_position: self.angle_to_nearest_attack_position,
-            StrategyState.rotate_to_goal_position: self.angle_to_goal_position,
-            StrategyState.move_to_goal_position: self.angle_to_goal_position,
-            StrategyState.ready_to_strike: self.angle_to_goal_position
-        }[self.info['state']]
-
-    @property
-    def action(self):
-        return {
-            StrategyState.undefined: self.take_puck_or_prevent_attack_or_attack_opponent,
-            StrategyState.take_puck: self.take_puck_or_prevent_attack_or_attack_opponent,
-            StrategyState.set_to_attack: ActionType.NONE,
-            StrategyState.go_to_attack_position: ActionType.NONE,
-            StrategyState.rotate_to_goal_position: ActionType.NONE,
-            StrategyState.move_to_goal_position: ActionType.NONE,
-            StrategyState.ready_to_strike: self.swing_at_most(self._max_swing_ticks)
-        }[self.info['state']]
+    behaviours = {
+        StrategyState.undefined: StateBehaviour(
+            speed_up=1.0,
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.take_puck: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.get_angle_to_unit(s.optimal_position_to_puck),
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.set_to_attack: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.angle_to_nearest_pre_attack_position),
+        StrategyState.go_to_attack_position: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.angle_to_nearest_attack_position),
+        StrategyState.rotate_to_goal_position: StateBehaviour(
+            speed_up=-0.5,
+            turn=lambda s: s.angle_to_goal_position),
+        StrategyState.move_to_goal_position: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.angle_to_goal_position),
+        StrategyState.ready_to_strike: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.angle_to_best_shot,
+            action=lambda s: s.swing_at_most(s.max_swing_ticks))
+    }
+
+    transitions = [
+        Transition(ANY_STATE, StrategyState.take_puck, ~OUR_TEAM_OWN_PUCK),
+        Transition((StrategyState.undefined, StrategyState.take_puck), StrategyState.set_to_attack),
+        Transition((StrategyState.set_to_attack,), StrategyState.go_to_attack_position,
+                   Guard(lambda s: s.distance_to_nearest_pre_attack_position <
+                         s._allowed_distance_to_pre_attack_position)),
+        Transition((StrategyState.go_to_attack_position,), StrategyState.rotate_to_goal_position,
+                   Guard(lambda s: s.distance_to_nearest_attack_position < s._allowed_distance)),
+        Transition((StrategyState.rotate_to_goal_position,), StrategyState.move_to_goal_position,
+                   Guard(lambda s: abs(s.angle_to_goal_position) < s._allowed_angle)),
+        Transition((StrategyState.move_to_goal_position,), StrategyState.ready_to_strike,
+                   Guard.attribute('time_to_strike'))
+    ]
 
     @staticmethod
     def initial_info():
-        return {
-            'state': StrategyState.undefined,
-            'pre_attack_position': None
-        }
-
-    @staticmethod
-    def get_attack_vertical(player):
-        return abs(500 - player.net_back)
+        return ForwardInfo()
 
     @property
     def attack_vertical(self):
-        return self.get_attack_vertical(self.opponent)
+        return self.rink.attack_vertical
 
     @property
-    def attack_positions(self) -> [Point]:
-        return [
-            Point(self.attack_vertical, 200.0),
-            Point(self.attack_vertical, 720.0)
-        ]
-
-    @staticmethod
-    def get_pre_attack_vertical(player):
-        return abs(650 - player.net_back)
+    def attack_positions(self) -> (Point, Point):
+        return self.rink.attack_positions
 
     @property
     def pre_attack_vertical(self):
-        return self.get_pre_attack_vertical(self.opponent)
+        return self.rink.pre_attack_vertical
 
     @property
-    def pre_attack_positions(self):
-        return [
-            Point(self.pre_attack_vertical, 240),
-            Point(self.pre_attack_vertical, 680)
-        ]
+    def pre_attack_positions(self) -> (Point, Point):
+        return self.rink.pre_attack_positions
 
     def get_goal_position(self, attack_point: Point) -> Point:
-        return Point((self.opponent.net_front + self.opponent.net_back) / 2,
-                     copysign(self.goal_net_height / 2,
-                              self.goal_net_horizontal - attack_point.y) + self.goal_net_horizontal)
+        return self.rink.get_goal_position(attack_point)
 
     def update_state(self):
-        new_state = self.get_next_state(self.state)
-
-        while self.state != new_state:
-            self.state = new_state
-            new_state = self.get_next_state(self.state)
+        super().update_state()
 
         if self.state == StrategyState.set_to_attack:
             self.pre_attack_position_info = self.optimal_pre_attack_position
         else:
             self.pre_attack_position_info = None
 
-    def get_next_state(self, state):
-        if self.our_team_own_puck:
-            if state in (StrategyState.undefined, StrategyState.take_puck):
-                state = StrategyState.set_to_attack
-
-            elif (state == StrategyState.set_to_attack and
-                    self.distance_to_nearest_pre_attack_position < self._allowed_distance_to_pre_attack_position):
-                state = StrategyState.go_to_attack_position
-
-            elif (state == StrategyState.go_to_attack_position and
-                    self.distance_to_nearest_attack_position < self._allowed_distance):
-                state = StrategyState.rotate_to_goal_position
-
-            elif (state == StrategyState.rotate_to_goal_position and
-                    abs(self.angle_to_goal_position) < self._allowed_angle):
-                state = StrategyState.move_to_goal_position
-
-            elif state == StrategyState.move_to_goal_position and self.time_to_strike:
-                state = StrategyState.ready_to_strike
-        else:
-            state = StrategyState.take_puck
-
-        return state
-
-    @property
+    @tick_cached_property
     def time_to_strike(self):
         return (self.distance_to_nearest_goal_position < self._allowed_distance_to_goal_position or
                 self.opponent_is_going_to_prevent_attack or
@@ -159,27 +124,77 @@ class ForwardStrategy(BaseStrategy):
                 (self.opponent_has_defenceman and
                     self.get_distance_to_unit(self.opponent_defenceman) < self._allowed_distance_to_opponent))
 
-    @property
-    def state(self):
-        return self.info['state']
+    @tick_cached_property
+    def max_swing_ticks(self):
+        """
+        Swing until the struck puck is expected to pass the opponent's goalie, but not longer than an opponent needs
+        to get the puck within reach of its stick; _max_swing_ticks without NumPy
+        """
+        if self.outcomes is None:
+            return self._max_swing_ticks
+
+        swing_ticks = self.outcomes.get_swing_ticks_for_struck_puck_speed(
+            self.me, self.speed_to_pass_goalie - self.own_speed_along_heading)
+
+        return min(swing_ticks, self.ticks_until_opponent_reaches_puck)
+
+    @tick_cached_property
+    def speed_to_pass_goalie(self):
+        """
+        Puck speed at which a shot at the far corner of the opponent's goal net gets there before the goalie does,
+        friction ignored
+        """
+        goalie = self.opponent_goalie
+
+        if goalie is None:
+            return 0.0
+
+        top_corner = self.rink.opponent_goal_net_top_corner
+        bottom_corner = self.rink.opponent_goal_net_bottom_corner
+        corner = top_corner if abs(top_corner.y - self.me.y) > abs(bottom_corner.y - self.me.y) else bottom_corner
+        gap = abs(corner.y - goalie.y) - goalie.radius - self.puck.radius
+
+        if gap <= 0:
+            return float('inf')
+
+        return self.get_distance_to_unit(corner) * self.game.goalie_max_speed / gap
+
+    @tick_cached_property
+    def angle_to_best_shot(self):
+        """
+        Angle to the direction with the best chance to score by the shot field, to the goal position without NumPy or
+        if no direction scores
+        """
+        if self.shot_field is None:
+            return self.angle_to_goal_position
+
+        angle, chance = self.shot_field.get_best_angle(self.opponent, self.opponent_goalie,
+                                                       self.get_shot_speed(self.max_swing_ticks), self.me.x, self.me.y)
+
+        if chance <= 0:
+            return self.angle_to_goal_position
 
-    @state.setter
-    def state(self, value):
-        self.info['state'] = value
+        return self.normalize_angle(angle - self.me.angle)
+
+    @tick_cached_property
+    def ticks_until_opponent_reaches_puck(self):
+        distance = min((h.get_distance_to_unit(self.puck) for h in self.opponent_hockeyists), default=float('inf'))
+
+        return max(int((distance - self.game.stick_length) / self.game.hockeyist_max_speed), 0)
 
     @property
     def pre_attack_position_info(self):
-        return self.info['pre_attack_position']
+        return self.info.pre_attack_position
 
     @pre_attack_position_info.setter
     def pre_attack_position_info(self, value):
-        self.info['pre_attack_position'] = value
+        self.info.pre_attack_position = value
 
-    @property
+    @tick_cached_property
     def opponent_is_going_to_prevent_attack(self):
         return any(self.unit_is_ahead(h) and self.unit_is_moving_to_us(h) for h in self.opponent_hockeyists)
 
-    @property
+    @tick_cached_property
     def opponent_is_nearby(self):
         return any(self.get_distance_to_unit(h) < self._allowed_distance_to_opponent for h in self.opponent_hockeyists)
 
@@ -201,15 +216,15 @@ class ForwardStrategy(BaseStrategy):
     def angle_to_nearest_pre_attack_position(self):
         return self.get_angle_to_unit(self.optimal_pre_attack_position)
 
-    @property
+    @tick_cached_property
     def nearest_attack_position(self):
         return sorted(self.attack_positions, key=self.get_distance_to_unit)[0]
 
-    @property
+    @tick_cached_property
     def angle_to_nearest_attack_position(self):
         return self.get_angle_to_unit(self.nearest_attack_position)
 
-    @property
+    @tick_cached_property
     def angle_to_goal_position(self):
         return self.get_angle_to_unit(self.nearest_goal_position)
 
@@ -217,14 +232,14 @@ class ForwardStrategy(BaseStrategy):
     def distance_to_nearest_pre_attack_position(self):
         return self.get_distance_to_unit(self.optimal_pre_attack_position)
 
-    @property
+    @tick_cached_property
     def distance_to_nearest_attack_position(self):
         return self.get_distance_to_unit(self.nearest_attack_position)
 
-    @property
+    @tick_cached_property
     def distance_to_nearest_goal_position(self):
         return self.get_distance_to_unit(self.nearest_goal_position)
 
-    @property
+    @tick_cached_property
     def nearest_goal_position(self):
         return self.get_goal_position(self.nearest_attack_position)
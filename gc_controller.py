@@ -0,0 +1,134 @@
+"""
+This module provides class for scheduling garbage collection off the critical path of ticks.
+
+Automatic collection is disabled for the whole game. After the first tick the objects alive by then (modules, game,
+long-lived strategies) are frozen, so that full collections don't traverse them. The controller collects only once
+the moves of a tick are sent, while the server simulates the next one:
+  * the young generations, as soon as as many objects are allocated as gc's own thresholds would allow;
+  * everything, once per slack period: the after_goal_state_tick_count ticks after a goal or ticks when none of our
+    hockeyists is active (all of them knocked down or resting), and at least every full_collection_period ticks.
+
+Collections are timed by a gc callback: the ones run from the arrival of a world, its decoding included, to the
+sending of its moves are on the critical path, the rest run between ticks, see get_report. A controller made with control=False only
+times the collections and leaves them to gc, which gives the baseline to compare the critical path pauses against.
+"""
+import gc
+import time
+
+from model.HockeyistState import HockeyistState
+from model.HockeyistType import HockeyistType
+from model.World import World
+
+
+__all__ = ['GcController']
+
+
+class GcController:
+    DEFAULT_FULL_COLLECTION_PERIOD = 1000
+
+    def __init__(self, full_collection_period=DEFAULT_FULL_COLLECTION_PERIOD, control=True):
+        """
+        :param control: whether to schedule the collections, otherwise they are only timed
+        """
+        self.full_collection_period = full_collection_period
+        self.control = control
+        self.thresholds = gc.get_threshold()
+
+        self.in_tick = False
+        self.frozen = False
+        self.last_full_collection_tick = 0
+        self.in_slack_period = False
+
+        self.collection_started = 0.0
+        self.critical_path_collections = 0
+        self.critical_path_time = 0.0
+        self.critical_path_max_time = 0.0
+        self.off_path_collections = [0, 0, 0]
+        self.off_path_time = [0.0, 0.0, 0.0]
+
+    def start(self):
+        if self.control:
+            gc.disable()
+
+        gc.callbacks.append(self.on_collection)
+
+    def stop(self):
+        gc.callbacks.remove(self.on_collection)
+
+        if self.control:
+            gc.enable()
+
+    def on_collection(self, phase, info):
+        if phase == 'start':
+            self.collection_started = time.perf_counter()
+            return
+
+        duration = time.perf_counter() - self.collection_started
+
+        if self.in_tick:
+            self.critical_path_collections += 1
+            self.critical_path_time += duration
+            self.critical_path_max_time = max(self.critical_path_max_time, duration)
+        else:
+            self.off_path_collections[info['generation']] += 1
+            self.off_path_time[info['generation']] += duration
+
+    def start_tick(self):
+        """
+        Called once the PLAYER_CONTEXT message of the tick arrives, before it is decoded, see
+        RemoteProcessClient.gc_controller
+        """
+        self.in_tick = True
+
+    @staticmethod
+    def is_slack_tick(world: World):
+        if any(player.just_scored_goal or player.just_missed_goal for player in world.players):
+            return True
+
+        return not any(h.teammate and h.type != HockeyistType.GOALIE and
+                       h.state in (HockeyistState.ACTIVE, HockeyistState.SWINGING) for h in world.hockeyists)
+
+    def finish_tick(self, world: World):
+        """
+        Called once the moves of the tick are sent
+        """
+        self.in_tick = False
+
+        if not self.control:
+            return
+
+        if not self.frozen:
+            gc.collect()
+            gc.freeze()
+            self.frozen = True
+            self.last_full_collection_tick = world.tick
+            return
+
+        slack_tick = self.is_slack_tick(world)
+
+        if ((slack_tick and not self.in_slack_period) or
+                world.tick - self.last_full_collection_tick >= self.full_collection_period):
+            gc.collect()
+            self.last_full_collection_tick = world.tick
+        else:
+            count0, count1, _ = gc.get_count()
+
+            if count0 >= self.thresholds[0]:
+                gc.collect(1 if count1 + 1 >= self.thresholds[1] else 0)
+
+        self.in_slack_period = slack_tick
+
+    def get_report(self):
+        """
+        :return: the collections on and off the critical path, compare the critical path of a controlling run with
+            the one of a control=False run of the same game
+        """
+        lines = ['garbage collection %s' % ('scheduled by the controller' if self.control else 'left to gc'),
+                 'collections on the critical path: %d, %.3f ms, longest %.3f ms' %
+                 (self.critical_path_collections, self.critical_path_time * 1000, self.critical_path_max_time * 1000)]
+
+        for generation in range(3):
+            lines.append('generation %d collections between ticks: %d, %.3f ms' %
+                         (generation, self.off_path_collections[generation], self.off_path_time[generation] * 1000))
+
+        return '\n'.join(lines)
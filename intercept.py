@@ -0,0 +1,41 @@
+"""
+This module provides a solver for the time a pursuer needs to intercept a moving target.
+
+The pursuer is assumed to move straight with constant speed, the target to keep its velocity. The intercept time is
+the smallest non-negative root of
+
+    |d + v * t| = s * t,  that is  (v.v - s^2) * t^2 + 2 * (d.v) * t + d.d = 0,
+
+where d is the vector from the pursuer to the target, v is the velocity of the target and s is the pursuer's speed.
+"""
+from math import sqrt, copysign
+
+
+__all__ = ['get_intercept_time']
+
+
+def get_intercept_time(dx, dy, speed_x, speed_y, pursuer_speed):
+    """
+    :return: the earliest non-negative intercept time or None if the target can't be intercepted
+    """
+    c = dx * dx + dy * dy
+
+    if c == 0:
+        return 0.0
+
+    a = speed_x * speed_x + speed_y * speed_y - pursuer_speed * pursuer_speed
+    b = 2 * (dx * speed_x + dy * speed_y)
+
+    if a == 0:
+        return -c / b if b < 0 else None
+
+    discriminant = b * b - 4 * a * c
+
+    if discriminant < 0:
+        return None
+
+    q = -(b + copysign(sqrt(discriminant), b)) / 2
+    roots = [t for t in (q / a, c / q) if t >= 0]
+
+    return min(roots) if roots else None
+
@@ -3,6 +3,7 @@ This module provides classes for representing kicker strategy
 """
 from base_strategy import BaseStrategy
 from model.ActionType import ActionType
+from tick_cache import tick_cached_property
 
 
 class KickerStrategy(BaseStrategy):
@@ -21,10 +22,10 @@ class KickerStrategy(BaseStrategy):
         else:
             return ActionType.CANCEL_STRIKE
 
-    @property
+    @tick_cached_property
     def opponent_to_be_attacked(self):
         return self.nearest_opponent
 
-    @property
+    @tick_cached_property
     def future_opponent_position(self):
         return self.optimal_position_to_interact_with(self.opponent_to_be_attacked)
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+This module provides the per-tick latency watchdog.
+
+Runner starts the watchdog's clock as soon as the world of a tick is decoded and computes the moves through
+compute_move. Before running the strategy of a hockeyist it checks whether the soft deadline of the tick is at risk,
+that is whether less time is left than a move is expected to take. If so the strategy isn't run and the fallback move
+is sent: speed_up and turn of the last move computed for the hockeyist, without its action, or a move doing nothing
+before the first one. Moves finishing after the deadline are counted per strategy and state, see get_report.
+
+The expected move time is the move_time_percentile of the last move_time_window move times, so a single slow move
+(a table built on first use, a garbage collection) doesn't make the following ones fall back. The first move of every
+hockeyist is not counted, it pays for the imports and the setup of the game. The estimate is kept below
+max_expected_move_part of the deadline, so the first strategy of a tick always runs and the estimate keeps being
+updated even when the strategies are slower than the deadline.
+
+Strategies may call time_left to degrade gracefully; it is infinite while no deadline is set.
+"""
+import time
+from collections import Counter, deque
+
+
+__all__ = ['set_deadline', 'start_tick', 'time_left', 'is_at_risk', 'compute_move', 'get_report']
+
+
+deadline = None
+tick_started = 0.0
+expected_move_time = 0.0
+
+move_time_window = 50
+move_time_percentile = 90
+max_expected_move_part = 0.5
+recent_move_times = deque(maxlen=move_time_window)
+
+last_moves = {}
+overruns = Counter()
+fallbacks = Counter()
+
+
+def set_deadline(seconds):
+    """
+    :param seconds: soft deadline of a tick, None to disable the watchdog
+    """
+    global deadline
+    deadline = seconds
+
+
+def start_tick():
+    global tick_started
+    tick_started = time.perf_counter()
+
+
+def time_left():
+    """
+    :return: seconds left until the deadline of the current tick, negative after it, infinite if there is no deadline
+    """
+    if deadline is None:
+        return float('inf')
+
+    return deadline - (time.perf_counter() - tick_started)
+
+
+def is_at_risk():
+    return time_left() < expected_move_time
+
+
+def update_expected_move_time(duration):
+    global expected_move_time
+
+    recent_move_times.append(duration)
+    move_times = sorted(recent_move_times)
+    percentile = move_times[min(len(move_times) - 1, int(len(move_times) * move_time_percentile / 100))]
+
+    expected_move_time = percentile if deadline is None else min(percentile, deadline * max_expected_move_part)
+
+
+def describe(strategy):
+    """
+    :return: name of the strategy class and the state kept in its info, if any
+    """
+    state = getattr(getattr(strategy, 'info', None), 'state', None)
+    name = type(strategy).__name__
+
+    return name if state is None else '%s.%s' % (name, getattr(state, 'name', state))
+
+
+def compute_move(my_strategy, me, world, game, move):
+    """
+    Computes the move of the hockeyist by my_strategy unless the deadline is at risk, in which case fills in the
+    fallback move. The strategy actually played is taken from my_strategy.strategy, if there is one.
+    """
+    if is_at_risk():
+        last_move = last_moves.get(me.teammate_index)
+
+        if last_move is not None:
+            move.speed_up, move.turn = last_move
+
+        fallbacks[me.teammate_index] += 1
+        return
+
+    started = time.perf_counter()
+    my_strategy.move(me, world, game, move)
+    duration = time.perf_counter() - started
+
+    if me.teammate_index in last_moves:
+        update_expected_move_time(duration)
+
+    last_moves[me.teammate_index] = move.speed_up, move.turn
+
+    if time_left() < 0:
+        overruns[describe(getattr(my_strategy, 'strategy', my_strategy))] += 1
+
+
+def get_report():
+    lines = ['%-60s overruns: %8d' % (name, count) for name, count in overruns.most_common()]
+    lines += ['fallback moves of teammate %d: %d' % (index, count) for index, count in sorted(fallbacks.items())]
+
+    return '\n'.join(lines)
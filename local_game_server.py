@@ -0,0 +1,378 @@
+"""
+This module provides a local stand-in for the game server, speaking the server side of the Code Hockey protocol.
+
+It sends scripted or recorded worlds to a single bot, enforces a per-tick response deadline and reports
+the bot's response latency. The deadline covers the whole tick, from sending PLAYER_CONTEXT to reading the last
+byte of MOVE. Examples, replaying a recording made with Runner --record and playing 600 scripted ticks:
+
+    python local_game_server.py match.bin --deadline-ms 20 --bot-command "python Runner.py"
+    python local_game_server.py --scripted-ticks 600 --team-size 3 --bot-command "python Runner.py"
+"""
+import argparse
+import random
+import shlex
+import socket
+import subprocess
+import sys
+import time
+from math import pi, cos, sin
+
+from RemoteProcessClient import RemoteProcessClient
+from model.Game import Game
+from model.Hockeyist import Hockeyist
+from model.HockeyistState import HockeyistState
+from model.HockeyistType import HockeyistType
+from model.Player import Player
+from model.PlayerContext import PlayerContext
+from model.Puck import Puck
+from model.World import World
+from tick_recording import ReplayClient
+
+
+__all__ = ['ServerProcessClient', 'LocalGameServer', 'LatencyReport', 'read_recording', 'script_game',
+           'GAME_VALUES']
+
+
+# Game constants of the scripted worlds, in the order of the Game constructor
+GAME_VALUES = dict(
+    random_seed=1234567890123, tick_count=6000, world_width=1200.0, world_height=800.0, goal_net_top=370.0,
+    goal_net_width=55.0, goal_net_height=200.0, rink_top=150.0, rink_left=65.0, rink_bottom=770.0, rink_right=1135.0,
+    after_goal_state_tick_count=300, overtime_tick_count=2000, default_action_cooldown_ticks=60,
+    swing_action_cooldown_ticks=10, cancel_strike_action_cooldown_ticks=60, action_cooldown_ticks_after_losing_puck=15,
+    stick_length=120.0, stick_sector=1.0471975511965976, pass_sector=2.0943951023931953,
+    hockeyist_attribute_base_value=100, min_action_chance=0.0, max_action_chance=1.0, strike_angle_deviation=0.0349,
+    pass_angle_deviation=0.0349, pick_up_puck_base_chance=0.6, take_puck_away_base_chance=0.25,
+    max_effective_swing_ticks=20, strike_power_base_factor=0.75, strike_power_growth_factor=0.0125,
+    strike_puck_base_chance=0.75, knockdown_chance_factor=0.8, knockdown_ticks_factor=20.0,
+    max_speed_to_allow_substitute=1.0, substitution_area_height=120.0, pass_power_factor=15.0,
+    hockeyist_max_stamina=2000.0, active_hockeyist_stamina_growth_per_tick=0.1,
+    resting_hockeyist_stamina_growth_per_tick=0.5, zero_stamina_hockeyist_effectiveness_factor=0.75,
+    speed_up_stamina_cost_factor=1.0, turn_stamina_cost_factor=1.0, take_puck_stamina_cost=10.0,
+    swing_stamina_cost=10.0, strike_stamina_base_cost=20.0, strike_stamina_cost_growth_factor=1.0,
+    cancel_strike_stamina_cost=10.0, pass_stamina_cost=20.0, goalie_max_speed=6.0, hockeyist_max_speed=15.0,
+    struck_hockeyist_initial_speed_factor=7.5, hockeyist_speed_up_factor=0.116, hockeyist_speed_down_factor=0.069,
+    hockeyist_turn_angle_factor=0.0523, versatile_hockeyist_strength=100, versatile_hockeyist_endurance=100,
+    versatile_hockeyist_dexterity=100, versatile_hockeyist_agility=100, forward_hockeyist_strength=110,
+    forward_hockeyist_endurance=90, forward_hockeyist_dexterity=110, forward_hockeyist_agility=90,
+    defenceman_hockeyist_strength=110, defenceman_hockeyist_endurance=110, defenceman_hockeyist_dexterity=90,
+    defenceman_hockeyist_agility=90, min_random_hockeyist_parameter=80, max_random_hockeyist_parameter=120,
+    struck_puck_initial_speed_factor=20.0, puck_binding_range=55.0)
+
+
+class DeadlineSocket:
+    """
+    Socket wrapper whose receives time out at an absolute deadline instead of after a timeout per call
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.timeout = connection.gettimeout()
+        self.deadline_at = None
+
+    def recv_into(self, buffer, byte_count=0):
+        if self.deadline_at is None:
+            return self.connection.recv_into(buffer, byte_count)
+
+        remaining = self.deadline_at - time.perf_counter()
+
+        if remaining <= 0:
+            raise socket.timeout('tick deadline expired')
+
+        self.connection.settimeout(remaining)
+
+        try:
+            return self.connection.recv_into(buffer, byte_count)
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def sendall(self, data):
+        self.connection.sendall(data)
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+        self.connection.settimeout(timeout)
+
+    def close(self):
+        self.connection.close()
+
+
+class ServerProcessClient(RemoteProcessClient):
+    """
+    Server end of an accepted bot connection
+    """
+
+    def __init__(self, connection):
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+        self.socket = DeadlineSocket(connection)
+        self.cells = None
+        self.cell_visibilities = None
+
+        self._init_buffers()
+        self._init_pools(False)
+
+    def read_token_message(self):
+        self._begin_message()
+        message_type = self.read_enum(RemoteProcessClient.MessageType)
+        self.ensure_message_type(message_type, RemoteProcessClient.MessageType.AUTHENTICATION_TOKEN)
+        return self.read_string()
+
+    def write_team_size_message(self, team_size):
+        self.write_enum(RemoteProcessClient.MessageType.TEAM_SIZE)
+        self.write_int(team_size)
+        self.flush()
+
+    def read_protocol_version_message(self):
+        self._begin_message()
+        message_type = self.read_enum(RemoteProcessClient.MessageType)
+        self.ensure_message_type(message_type, RemoteProcessClient.MessageType.PROTOCOL_VERSION)
+        return self.read_int()
+
+    def write_game_context_message(self, game):
+        self.write_enum(RemoteProcessClient.MessageType.GAME_CONTEXT)
+        self.write_game(game)
+        self.flush()
+
+    def write_player_context_message(self, player_context):
+        self.write_enum(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+        self.write_player_context(player_context)
+        self.flush()
+
+    def read_moves_message(self, deadline_at=None):
+        """
+        :param deadline_at: time.perf_counter() value by which the whole message must be read, no limit if None
+        :raise socket.timeout: if the deadline expires first
+        """
+        self.socket.deadline_at = deadline_at
+
+        try:
+            self._begin_message()
+            message_type = self.read_enum(RemoteProcessClient.MessageType)
+            self.ensure_message_type(message_type, RemoteProcessClient.MessageType.MOVE)
+            return self.read_moves()
+        finally:
+            self.socket.deadline_at = None
+
+    def write_game_over_message(self):
+        self.write_enum(RemoteProcessClient.MessageType.GAME_OVER)
+        self.flush()
+
+
+class LatencyReport:
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.latencies = []
+        self.moves = []
+        self.missed_tick = None
+
+    def get_percentile(self, percent):
+        if not self.latencies:
+            return None
+
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))]
+
+    def __str__(self):
+        lines = ['ticks answered: %d' % len(self.latencies)]
+
+        if self.latencies:
+            lines += ['latency p%s: %.3f ms' % (percent, self.get_percentile(percent) * 1000)
+                      for percent in (50, 90, 99, 100)]
+            lines.append('latency mean: %.3f ms' % (sum(self.latencies) / len(self.latencies) * 1000))
+
+        if self.missed_tick is not None:
+            lines.append('deadline of %.3f ms missed at tick %d' % (self.deadline * 1000, self.missed_tick))
+
+        return '\n'.join(lines)
+
+
+class LocalGameServer:
+    """
+    Plays player contexts to one bot. A bot that does not answer a tick within the deadline gets GAME_OVER.
+    A bot still running handshake_timeout after the game is over is killed.
+    """
+
+    def __init__(self, game, team_size, player_contexts, port=31001, deadline=None, handshake_timeout=10.0):
+        self.game = game
+        self.team_size = team_size
+        self.player_contexts = player_contexts
+        self.port = port
+        self.deadline = deadline
+        self.handshake_timeout = handshake_timeout
+
+    def run(self, bot_command=None) -> LatencyReport:
+        report = LatencyReport(self.deadline)
+
+        listener = socket.socket()
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
+        listener.bind(('127.0.0.1', self.port))
+        listener.listen(1)
+
+        bot = subprocess.Popen(bot_command + [str(self.port)]) if bot_command else None
+
+        try:
+            listener.settimeout(self.handshake_timeout)
+            connection, _ = listener.accept()
+            connection.settimeout(self.handshake_timeout)
+            client = ServerProcessClient(connection)
+
+            try:
+                client.read_token_message()
+                client.write_team_size_message(self.team_size)
+                client.read_protocol_version_message()
+                client.write_game_context_message(self.game)
+
+                client.socket.settimeout(None)
+
+                for player_context in self.player_contexts:
+                    started = time.perf_counter()
+                    client.write_player_context_message(player_context)
+
+                    try:
+                        moves = client.read_moves_message(started + self.deadline if self.deadline is not None
+                                                          else None)
+                    except socket.timeout:
+                        report.missed_tick = player_context.world.tick
+                        break
+
+                    report.latencies.append(time.perf_counter() - started)
+                    report.moves.append(moves)
+
+                client.socket.settimeout(self.handshake_timeout)
+                client.write_game_over_message()
+            finally:
+                client.close()
+        finally:
+            listener.close()
+
+            if bot is not None:
+                try:
+                    bot.wait(self.handshake_timeout)
+                except subprocess.TimeoutExpired:
+                    bot.kill()
+                    bot.wait()
+
+        return report
+
+
+def read_recording(path):
+    """
+    :return: team size, game and the iterator of player contexts recorded with Runner --record
+    """
+    replay_client = ReplayClient(path)
+    team_size = replay_client.read_team_size_message()
+    game = replay_client.read_game_context_message()
+
+    def read_player_contexts():
+        try:
+            player_context = replay_client.read_player_context_message()
+
+            while player_context is not None:
+                yield player_context
+                player_context = replay_client.read_player_context_message()
+        finally:
+            replay_client.close()
+
+    return team_size, game, read_player_contexts()
+
+
+def script_game(team_size=2, tick_count=600, seed=0):
+    """
+    Scripted worlds: every field hockeyist skates around a circle of its own, the puck is free and bounces off the
+    boards for the first half of every 200 ticks and is carried by the field hockeyists in turn for the other half,
+    the goalies follow the puck along their goal nets
+    :return: team size, game and the iterator of the player contexts of my player
+    """
+    game = Game(**GAME_VALUES)
+    rnd = random.Random(seed)
+    players = [Player(1, True, 'me', 0, False, game.goal_net_top, game.rink_left - game.goal_net_width,
+                      game.goal_net_top + game.goal_net_height, game.rink_left, game.rink_left,
+                      game.rink_left - game.goal_net_width, False, False),
+               Player(2, False, 'opponent', 0, False, game.goal_net_top, game.rink_right,
+                      game.goal_net_top + game.goal_net_height, game.rink_right + game.goal_net_width,
+                      game.rink_right, game.rink_right + game.goal_net_width, False, False)]
+
+    circles = [(rnd.uniform(game.rink_left + 200, game.rink_right - 200),
+                rnd.uniform(game.rink_top + 150, game.rink_bottom - 150),
+                rnd.uniform(60, 140), rnd.uniform(-pi, pi), rnd.choice((-1, 1)) * rnd.uniform(0.02, 0.08))
+               for _ in range(2 * team_size)]
+    puck_x, puck_y = game.world_width / 2, (game.rink_top + game.rink_bottom) / 2
+    puck_speed_x, puck_speed_y = rnd.uniform(-12, 12), rnd.uniform(-12, 12)
+
+    def make_hockeyist(id, player, teammate_index, x, y, speed_x, speed_y, angle, type):
+        return Hockeyist(id, player.id, teammate_index, 85.0, 30.0, x, y, speed_x, speed_y, angle, 0.0, player.me,
+                         type, 100, 100, 100, 100, game.hockeyist_max_stamina, HockeyistState.ACTIVE,
+                         teammate_index, 0, 0, 0, None, None)
+
+    def get_player_contexts():
+        nonlocal puck_x, puck_y, puck_speed_x, puck_speed_y
+
+        for tick in range(tick_count):
+            hockeyists = []
+
+            for index, (center_x, center_y, radius, phase, angular_speed) in enumerate(circles):
+                player = players[index // team_size]
+                position_angle = phase + angular_speed * tick
+                angle = position_angle + (pi / 2 if angular_speed > 0 else -pi / 2)
+                speed = abs(angular_speed) * radius
+                hockeyists.append(make_hockeyist(
+                    3 + index, player, index % team_size, center_x + radius * cos(position_angle),
+                    center_y + radius * sin(position_angle), speed * cos(angle), speed * sin(angle),
+                    (angle + pi) % (2 * pi) - pi, HockeyistType.VERSATILE))
+
+            carrier = hockeyists[tick // 200 % len(hockeyists)] if tick % 200 >= 100 else None
+
+            if carrier is not None:
+                puck_x = carrier.x + game.puck_binding_range * cos(carrier.angle)
+                puck_y = carrier.y + game.puck_binding_range * sin(carrier.angle)
+                puck_speed_x, puck_speed_y = carrier.speed_x, carrier.speed_y
+            else:
+                puck_x, puck_y = puck_x + puck_speed_x, puck_y + puck_speed_y
+
+                if not game.rink_left + 20 <= puck_x <= game.rink_right - 20:
+                    puck_speed_x = -puck_speed_x
+                if not game.rink_top + 20 <= puck_y <= game.rink_bottom - 20:
+                    puck_speed_y = -puck_speed_y
+
+                puck_x = min(max(puck_x, game.rink_left + 20), game.rink_right - 20)
+                puck_y = min(max(puck_y, game.rink_top + 20), game.rink_bottom - 20)
+
+            goalie_y = min(max(puck_y, game.goal_net_top + 30), game.goal_net_top + game.goal_net_height - 30)
+            goalies = [make_hockeyist(1, players[0], -1, game.rink_left + 30, goalie_y, 0.0, 0.0, 0.0,
+                                      HockeyistType.GOALIE),
+                       make_hockeyist(2, players[1], -1, game.rink_right - 30, goalie_y, 0.0, 0.0, pi,
+                                      HockeyistType.GOALIE)]
+
+            puck = Puck(0, 1.0, 20.0, puck_x, puck_y, puck_speed_x, puck_speed_y,
+                        -1 if carrier is None else carrier.id, -1 if carrier is None else carrier.player_id)
+            world = World(tick, game.tick_count, game.world_width, game.world_height, players, goalies + hockeyists,
+                          puck)
+
+            yield PlayerContext(hockeyists[:team_size], world)
+
+    return team_size, game, get_player_contexts()
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('recording', nargs='?', help="recording made with Runner --record")
+    source.add_argument('--scripted-ticks', type=int, metavar='N', help="play N ticks of scripted worlds instead")
+    parser.add_argument('--team-size', type=int, default=2, help="team size of the scripted worlds")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the scripted worlds")
+    parser.add_argument('--port', type=int, default=31001)
+    parser.add_argument('--deadline-ms', type=float, default=None, help="per-tick response deadline, whole tick")
+    parser.add_argument('--bot-command', help="command starting the bot, the port is appended to it")
+    options = parser.parse_args(arguments)
+
+    if options.scripted_ticks is not None:
+        team_size, game, player_contexts = script_game(options.team_size, options.scripted_ticks, options.seed)
+    else:
+        team_size, game, player_contexts = read_recording(options.recording)
+    deadline = options.deadline_ms / 1000 if options.deadline_ms is not None else None
+
+    server = LocalGameServer(game, team_size, player_contexts, options.port, deadline)
+    print(server.run(shlex.split(options.bot_command) if options.bot_command else None))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
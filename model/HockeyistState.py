@@ -1,5 +1,5 @@
-class HockeyistState:
-    ACTIVE = 0
-    SWINGING = 1
-    KNOCKED_DOWN = 2
+class HockeyistState:
+    ACTIVE = 0
+    SWINGING = 1
+    KNOCKED_DOWN = 2
     RESTING = 3
\ No newline at end of file
@@ -1,6 +1,6 @@
-class HockeyistType:
-    GOALIE = 0
-    VERSATILE = 1
-    FORWARD = 2
-    DEFENCEMAN = 3
+class HockeyistType:
+    GOALIE = 0
+    VERSATILE = 1
+    FORWARD = 2
+    DEFENCEMAN = 3
     RANDOM = 4
\ No newline at end of file
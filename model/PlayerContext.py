@@ -1,7 +1,7 @@
-from model.World import World
-
-
-class PlayerContext:
-    def __init__(self, hockeyists, world: (None, World)):
-        self.hockeyists = hockeyists
+from model.World import World
+
+
+class PlayerContext:
+    def __init__(self, hockeyists, world: (None, World)):
+        self.hockeyists = hockeyists
         self.world = world
\ No newline at end of file
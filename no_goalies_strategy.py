@@ -9,34 +9,39 @@ from simple_striker_strategy import SimpleStrikerStrategy
 __all__ = ['NoGoaliesStrategy']
 
 
+class NoGoaliesInfo:
+    __slots__ = ('simple_striker', 'defence')
+
+    def __init__(self):
+        self.simple_striker = SimpleStrikerStrategy.initial_info()
+        self.defence = DefenceStrategy.initial_info()
+
+
 class NoGoaliesStrategy(BaseStrategy):
 
     def __init__(self, me, world, game, move, info):
         super().__init__(me, world, game, move, info)
 
-        strategy = DefenceStrategy if self.opponent_team_own_puck else SimpleStrikerStrategy
+        self.strategies = {}
+        self.strategy = None
 
-        self.strategy = strategy(me, world, game, move, info[strategy])
+        self.update_state()
 
-    @staticmethod
-    def initial_info():
-        return {
-            SimpleStrikerStrategy: SimpleStrikerStrategy.initial_info(),
-            DefenceStrategy: DefenceStrategy.initial_info()
-        }
+    def update_state(self):
+        strategy = DefenceStrategy if self.opponent_team_own_puck else SimpleStrikerStrategy
+        instance = self.strategies.get(strategy)
 
-    @property
-    def info(self):
-        self._info[type(self.strategy)] = self.strategy.info
+        if instance is None:
+            info = self.info.defence if strategy is DefenceStrategy else self.info.simple_striker
+            instance = self.strategies[strategy] = strategy(self.me, self.world, self.game, self.move, info)
+        else:
+            instance.on_tick(self.me, self.world, self.game, self.move)
 
-        return self._info
+        self.strategy = instance
 
-    @info.setter
-    def info(self, value):
-        if len(value) == 2 and SimpleStrikerStrategy in value and DefenceStrategy in value:
-            self._info = value
-        else:
-            super().info[type(self.strategy)] = value
+    @staticmethod
+    def initial_info():
+        return NoGoaliesInfo()
 
     @property
     def speed_up(self):
@@ -1,9 +1,12 @@
 """
 This module provides classes for representing point
 """
+from math import hypot
 
 
 class Point:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -15,10 +18,27 @@ class Point:
         return Point(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other):
-        return self + -other
+        return Point(self.x - other.x, self.y - other.y)
 
     def __neg__(self):
         return Point(-self.x, -self.y)
 
     def __repr__(self):
-        return 'Point({0}, {1})'.format(self.x, self.y)
\ No newline at end of file
+        return 'Point({0}, {1})'.format(self.x, self.y)
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y
+
+    def cross(self, other):
+        return self.x * other.y - self.y * other.x
+
+    @property
+    def squared_length(self):
+        return self.x * self.x + self.y * self.y
+
+    @property
+    def length(self):
+        return hypot(self.x, self.y)
+
+    def get_distance_to(self, other):
+        return hypot(other.x - self.x, other.y - self.y)
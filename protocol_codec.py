@@ -0,0 +1,505 @@
+"""
+This module provides declarative schemas of the protocol model classes and compiles them into readers and writers.
+
+Each schema lists the fields of a model class in wire order. At import every schema is compiled into a pair of
+specialised functions: consecutive fixed-size fields are merged into a single struct.Struct, so a whole Game or
+Hockeyist record is decoded with one unpack_from call and encoded with one pack call.
+
+Readers take a client providing read_boolean, read_int, read_string and reserve_bytes (see RemoteProcessClient).
+Writers append the encoded value to a bytearray. Pooled readers additionally take a collections.defaultdict(dict)
+of pools keyed by model class and reuse the instances found there, so entity identity is stable across ticks.
+
+Move is not described by a schema, because the set of its fields depends on the action: read_move and write_move
+are written by hand.
+"""
+import struct
+
+from model.ActionType import ActionType
+from model.Game import Game
+from model.Hockeyist import Hockeyist
+from model.Move import Move
+from model.HockeyistState import HockeyistState
+from model.HockeyistType import HockeyistType
+from model.Player import Player
+from model.PlayerContext import PlayerContext
+from model.Puck import Puck
+from model.World import World
+
+
+__all__ = ['BOOLEAN', 'INT', 'LONG', 'DOUBLE', 'STRING', 'OPTIONAL_INT', 'EnumField', 'ListField', 'RecordSchema',
+           'GAME_SCHEMA', 'HOCKEYIST_SCHEMA', 'PLAYER_SCHEMA', 'PUCK_SCHEMA', 'WORLD_SCHEMA', 'PLAYER_CONTEXT_SCHEMA',
+           'read_game', 'write_game', 'read_hockeyist', 'write_hockeyist', 'read_player', 'write_player',
+           'read_puck', 'write_puck', 'read_world', 'write_world', 'read_player_context', 'write_player_context',
+           'read_pooled_world', 'read_pooled_player_context', 'read_move', 'write_move', 'write_moves',
+           'locate_records']
+
+
+BYTE_ORDER_FORMAT_STRING = '<'
+
+
+class FixedField:
+    """
+    Field encoded with a single struct format character
+    """
+
+    def __init__(self, format_char):
+        self.format_char = format_char
+
+
+class EnumField(FixedField):
+    """
+    Signed byte holding a value of the enum class, unknown values are decoded as None
+    """
+
+    def __init__(self, enum_class):
+        super().__init__('b')
+
+        self.values = {value: value for key, value in enum_class.__dict__.items() if not key.startswith('__')}
+
+
+class ListField:
+    """
+    Int count followed by the records, negative count stands for None
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+
+
+class VariableField:
+    def __init__(self, name):
+        self.name = name
+
+
+BOOLEAN = FixedField('?')
+INT = FixedField('i')
+LONG = FixedField('q')
+DOUBLE = FixedField('d')
+STRING = VariableField('string')
+OPTIONAL_INT = VariableField('optional_int')
+
+
+class RecordSchema:
+    """
+    Boolean presence flag followed by the fields, which are passed positionally to the model class constructor.
+
+    Pooled readers keep one instance per value of key_field (or a single instance if key_field is None)
+    and update its fields in place instead of constructing a new one.
+    """
+
+    def __init__(self, model_class, fields, key_field=None):
+        parameters = model_class.__init__.__code__.co_varnames[1:model_class.__init__.__code__.co_argcount]
+        assert tuple(name for name, _ in fields) == parameters, model_class
+
+        self.model_class = model_class
+        self.fields = fields
+        self.key_field = key_field
+
+        self.read = None
+        self.read_pooled = None
+        self.write = None
+        self.layout = None
+
+    def get_runs(self):
+        """
+        Splits fields into lists of consecutive fixed-size fields and single variable-size fields
+        """
+        runs = []
+
+        for name, field in self.fields:
+            if isinstance(field, FixedField) and runs and isinstance(runs[-1][0][1], FixedField):
+                runs[-1].append((name, field))
+            else:
+                runs.append([(name, field)])
+
+        return runs
+
+
+def compile_schema(schema: RecordSchema):
+    namespace = {'model_class': schema.model_class}
+    reader_lines = ['def read(client):',
+                    '    if not client.read_boolean():',
+                    '        return None']
+    pooled_reader_lines = ['def read_pooled(client, pools):',
+                           '    if not client.read_boolean():',
+                           '        return None']
+    writer_lines = ['def write(out, value):',
+                    '    if value is None:',
+                    '        out += FALSE',
+                    '        return',
+                    '    out += TRUE']
+
+    schema.layout = []
+
+    for index, run in enumerate(schema.get_runs()):
+        name, field = run[0]
+
+        if isinstance(field, FixedField):
+            struct_name = '_struct_%d' % index
+            namespace[struct_name] = struct.Struct(
+                BYTE_ORDER_FORMAT_STRING + ''.join(f.format_char for _, f in run))
+
+            schema.layout.append(namespace[struct_name])
+
+            read_lines = ['    buffer, offset = client.reserve_bytes(%d)' % namespace[struct_name].size,
+                          '    %s, = %s.unpack_from(buffer, offset)' % (', '.join(n for n, _ in run), struct_name)]
+            write_args = []
+
+            for n, f in run:
+                if isinstance(f, EnumField):
+                    enum_name = '_enum_%s' % n
+                    namespace[enum_name] = f.values
+
+                    read_lines.append('    %s = %s.get(%s)' % (n, enum_name, n))
+                    write_args.append('-1 if value.%s is None else value.%s' % (n, n))
+                else:
+                    write_args.append('value.%s' % n)
+
+            reader_lines += read_lines
+            pooled_reader_lines += read_lines
+            writer_lines.append('    out += %s.pack(%s)' % (struct_name, ', '.join(write_args)))
+
+        elif isinstance(field, ListField):
+            namespace['_read_' + name] = field.schema.read
+            namespace['_read_pooled_' + name] = field.schema.read_pooled
+            namespace['_write_' + name] = field.schema.write
+
+            reader_lines.append('    %s = read_list(client, _read_%s)' % (name, name))
+            pooled_reader_lines.append('    %s = read_pooled_list(client, pools, _read_pooled_%s)' % (name, name))
+            writer_lines.append('    write_list(out, value.%s, _write_%s)' % (name, name))
+
+        elif isinstance(field, RecordSchema):
+            namespace['_read_' + name] = field.read
+            namespace['_read_pooled_' + name] = field.read_pooled
+            namespace['_write_' + name] = field.write
+
+            reader_lines.append('    %s = _read_%s(client)' % (name, name))
+            pooled_reader_lines.append('    %s = _read_pooled_%s(client, pools)' % (name, name))
+            writer_lines.append('    _write_%s(out, value.%s)' % (name, name))
+
+        elif field is STRING:
+            reader_lines.append('    %s = client.read_string()' % name)
+            pooled_reader_lines.append('    %s = client.read_string()' % name)
+            writer_lines.append('    write_string(out, value.%s)' % name)
+
+        elif field is OPTIONAL_INT:
+            reader_lines.append('    %s = client.read_int() if client.read_boolean() else None' % name)
+            pooled_reader_lines.append('    %s = client.read_int() if client.read_boolean() else None' % name)
+            writer_lines.append('    write_optional_int(out, value.%s)' % name)
+
+        else:
+            raise ValueError("Unsupported field type [field=%s]." % name)
+
+        if not isinstance(field, FixedField):
+            schema.layout.append(field)
+
+    arguments = ', '.join(name for name, _ in schema.fields)
+    reader_lines.append('    return model_class(%s)' % arguments)
+
+    pooled_reader_lines += ['    pool = pools[model_class]',
+                            '    instance = pool.get(%s)' % schema.key_field,
+                            '    if instance is None:',
+                            '        instance = pool[%s] = model_class(%s)' % (schema.key_field, arguments),
+                            '    else:']
+    pooled_reader_lines += ['        instance.%s = %s' % (name, name) for name, _ in schema.fields]
+    pooled_reader_lines.append('    return instance')
+
+    namespace.update(read_list=read_list, read_pooled_list=read_pooled_list, write_list=write_list,
+                     write_string=write_string, write_optional_int=write_optional_int, TRUE=TRUE, FALSE=FALSE)
+
+    exec('\n'.join(reader_lines), namespace)
+    exec('\n'.join(pooled_reader_lines), namespace)
+    exec('\n'.join(writer_lines), namespace)
+
+    schema.read = namespace['read']
+    schema.read_pooled = namespace['read_pooled']
+    schema.write = namespace['write']
+
+    return schema.read, schema.write
+
+
+INTEGER_STRUCT = struct.Struct(BYTE_ORDER_FORMAT_STRING + 'i')
+OPTIONAL_INTEGER_STRUCT = struct.Struct(BYTE_ORDER_FORMAT_STRING + '?i')
+TRUE = b'\x01'
+FALSE = b'\x00'
+
+
+def read_list(client, read_item):
+    count = client.read_int()
+    if count < 0:
+        return None
+
+    return [read_item(client) for _ in range(count)]
+
+
+def read_pooled_list(client, pools, read_item):
+    count = client.read_int()
+    if count < 0:
+        return None
+
+    return [read_item(client, pools) for _ in range(count)]
+
+
+def write_list(out, values, write_item):
+    if values is None:
+        out += INTEGER_STRUCT.pack(-1)
+        return
+
+    out += INTEGER_STRUCT.pack(len(values))
+
+    for value in values:
+        write_item(out, value)
+
+
+def write_string(out, value):
+    if value is None:
+        out += INTEGER_STRUCT.pack(-1)
+        return
+
+    byte_array = value.encode()
+
+    out += INTEGER_STRUCT.pack(len(byte_array))
+    out += byte_array
+
+
+def write_optional_int(out, value):
+    if value is None:
+        out += FALSE
+    else:
+        out += OPTIONAL_INTEGER_STRUCT.pack(True, value)
+
+
+def locate_records(schema, buffer, offset, located):
+    """
+    Walks the encoded record at offset without decoding it.
+    For every present record of a schema found in located (nested ones included) appends the offset of its first field
+    to located[schema].
+
+    :return: offset just past the record
+    """
+    present = buffer[offset]
+    offset += 1
+
+    if not present:
+        return offset
+
+    if schema in located:
+        located[schema].append(offset)
+
+    for item in schema.layout:
+        if isinstance(item, struct.Struct):
+            offset += item.size
+        elif isinstance(item, ListField):
+            count, = INTEGER_STRUCT.unpack_from(buffer, offset)
+            offset += INTEGER_STRUCT.size
+
+            for _ in range(count):
+                offset = locate_records(item.schema, buffer, offset, located)
+        elif isinstance(item, RecordSchema):
+            offset = locate_records(item, buffer, offset, located)
+        elif item is STRING:
+            length, = INTEGER_STRUCT.unpack_from(buffer, offset)
+            offset += INTEGER_STRUCT.size + max(length, 0)
+        elif item is OPTIONAL_INT:
+            offset += 1 + (INTEGER_STRUCT.size if buffer[offset] else 0)
+
+    return offset
+
+
+GAME_SCHEMA = RecordSchema(Game, [
+    ('random_seed', LONG),
+    ('tick_count', INT),
+    ('world_width', DOUBLE),
+    ('world_height', DOUBLE),
+    ('goal_net_top', DOUBLE),
+    ('goal_net_width', DOUBLE),
+    ('goal_net_height', DOUBLE),
+    ('rink_top', DOUBLE),
+    ('rink_left', DOUBLE),
+    ('rink_bottom', DOUBLE),
+    ('rink_right', DOUBLE),
+    ('after_goal_state_tick_count', INT),
+    ('overtime_tick_count', INT),
+    ('default_action_cooldown_ticks', INT),
+    ('swing_action_cooldown_ticks', INT),
+    ('cancel_strike_action_cooldown_ticks', INT),
+    ('action_cooldown_ticks_after_losing_puck', INT),
+    ('stick_length', DOUBLE),
+    ('stick_sector', DOUBLE),
+    ('pass_sector', DOUBLE),
+    ('hockeyist_attribute_base_value', INT),
+    ('min_action_chance', DOUBLE),
+    ('max_action_chance', DOUBLE),
+    ('strike_angle_deviation', DOUBLE),
+    ('pass_angle_deviation', DOUBLE),
+    ('pick_up_puck_base_chance', DOUBLE),
+    ('take_puck_away_base_chance', DOUBLE),
+    ('max_effective_swing_ticks', INT),
+    ('strike_power_base_factor', DOUBLE),
+    ('strike_power_growth_factor', DOUBLE),
+    ('strike_puck_base_chance', DOUBLE),
+    ('knockdown_chance_factor', DOUBLE),
+    ('knockdown_ticks_factor', DOUBLE),
+    ('max_speed_to_allow_substitute', DOUBLE),
+    ('substitution_area_height', DOUBLE),
+    ('pass_power_factor', DOUBLE),
+    ('hockeyist_max_stamina', DOUBLE),
+    ('active_hockeyist_stamina_growth_per_tick', DOUBLE),
+    ('resting_hockeyist_stamina_growth_per_tick', DOUBLE),
+    ('zero_stamina_hockeyist_effectiveness_factor', DOUBLE),
+    ('speed_up_stamina_cost_factor', DOUBLE),
+    ('turn_stamina_cost_factor', DOUBLE),
+    ('take_puck_stamina_cost', DOUBLE),
+    ('swing_stamina_cost', DOUBLE),
+    ('strike_stamina_base_cost', DOUBLE),
+    ('strike_stamina_cost_growth_factor', DOUBLE),
+    ('cancel_strike_stamina_cost', DOUBLE),
+    ('pass_stamina_cost', DOUBLE),
+    ('goalie_max_speed', DOUBLE),
+    ('hockeyist_max_speed', DOUBLE),
+    ('struck_hockeyist_initial_speed_factor', DOUBLE),
+    ('hockeyist_speed_up_factor', DOUBLE),
+    ('hockeyist_speed_down_factor', DOUBLE),
+    ('hockeyist_turn_angle_factor', DOUBLE),
+    ('versatile_hockeyist_strength', INT),
+    ('versatile_hockeyist_endurance', INT),
+    ('versatile_hockeyist_dexterity', INT),
+    ('versatile_hockeyist_agility', INT),
+    ('forward_hockeyist_strength', INT),
+    ('forward_hockeyist_endurance', INT),
+    ('forward_hockeyist_dexterity', INT),
+    ('forward_hockeyist_agility', INT),
+    ('defenceman_hockeyist_strength', INT),
+    ('defenceman_hockeyist_endurance', INT),
+    ('defenceman_hockeyist_dexterity', INT),
+    ('defenceman_hockeyist_agility', INT),
+    ('min_random_hockeyist_parameter', INT),
+    ('max_random_hockeyist_parameter', INT),
+    ('struck_puck_initial_speed_factor', DOUBLE),
+    ('puck_binding_range', DOUBLE)
+])
+
+HOCKEYIST_SCHEMA = RecordSchema(Hockeyist, [
+    ('id', LONG),
+    ('player_id', LONG),
+    ('teammate_index', INT),
+    ('mass', DOUBLE),
+    ('radius', DOUBLE),
+    ('x', DOUBLE),
+    ('y', DOUBLE),
+    ('speed_x', DOUBLE),
+    ('speed_y', DOUBLE),
+    ('angle', DOUBLE),
+    ('angular_speed', DOUBLE),
+    ('teammate', BOOLEAN),
+    ('type', EnumField(HockeyistType)),
+    ('strength', INT),
+    ('endurance', INT),
+    ('dexterity', INT),
+    ('agility', INT),
+    ('stamina', DOUBLE),
+    ('state', EnumField(HockeyistState)),
+    ('original_position_index', INT),
+    ('remaining_knockdown_ticks', INT),
+    ('remaining_cooldown_ticks', INT),
+    ('swing_ticks', INT),
+    ('last_action', EnumField(ActionType)),
+    ('last_action_tick', OPTIONAL_INT)
+], key_field='id')
+
+PLAYER_SCHEMA = RecordSchema(Player, [
+    ('id', LONG),
+    ('me', BOOLEAN),
+    ('name', STRING),
+    ('goal_count', INT),
+    ('strategy_crashed', BOOLEAN),
+    ('net_top', DOUBLE),
+    ('net_left', DOUBLE),
+    ('net_bottom', DOUBLE),
+    ('net_right', DOUBLE),
+    ('net_front', DOUBLE),
+    ('net_back', DOUBLE),
+    ('just_scored_goal', BOOLEAN),
+    ('just_missed_goal', BOOLEAN)
+], key_field='id')
+
+PUCK_SCHEMA = RecordSchema(Puck, [
+    ('id', LONG),
+    ('mass', DOUBLE),
+    ('radius', DOUBLE),
+    ('x', DOUBLE),
+    ('y', DOUBLE),
+    ('speed_x', DOUBLE),
+    ('speed_y', DOUBLE),
+    ('owner_hockeyist_id', LONG),
+    ('owner_player_id', LONG)
+], key_field='id')
+
+read_game, write_game = compile_schema(GAME_SCHEMA)
+read_hockeyist, write_hockeyist = compile_schema(HOCKEYIST_SCHEMA)
+read_player, write_player = compile_schema(PLAYER_SCHEMA)
+read_puck, write_puck = compile_schema(PUCK_SCHEMA)
+
+WORLD_SCHEMA = RecordSchema(World, [
+    ('tick', INT),
+    ('tick_count', INT),
+    ('width', DOUBLE),
+    ('height', DOUBLE),
+    ('players', ListField(PLAYER_SCHEMA)),
+    ('hockeyists', ListField(HOCKEYIST_SCHEMA)),
+    ('puck', PUCK_SCHEMA)
+])
+
+read_world, write_world = compile_schema(WORLD_SCHEMA)
+read_pooled_world = WORLD_SCHEMA.read_pooled
+
+PLAYER_CONTEXT_SCHEMA = RecordSchema(PlayerContext, [
+    ('hockeyists', ListField(HOCKEYIST_SCHEMA)),
+    ('world', WORLD_SCHEMA)
+])
+
+read_player_context, write_player_context = compile_schema(PLAYER_CONTEXT_SCHEMA)
+read_pooled_player_context = PLAYER_CONTEXT_SCHEMA.read_pooled
+
+
+MOVE_STRUCT = struct.Struct(BYTE_ORDER_FORMAT_STRING + 'ddb')
+PASS_STRUCT = struct.Struct(BYTE_ORDER_FORMAT_STRING + 'dd')
+MOVE_ACTIONS = EnumField(ActionType).values
+
+
+def read_move(client):
+    if not client.read_boolean():
+        return None
+
+    buffer, offset = client.reserve_bytes(MOVE_STRUCT.size)
+    speed_up, turn, action = MOVE_STRUCT.unpack_from(buffer, offset)
+
+    move = Move()
+
+    move.speed_up = speed_up
+    move.turn = turn
+    move.action = MOVE_ACTIONS.get(action)
+    if move.action == ActionType.PASS:
+        buffer, offset = client.reserve_bytes(PASS_STRUCT.size)
+        move.pass_power, move.pass_angle = PASS_STRUCT.unpack_from(buffer, offset)
+    elif move.action == ActionType.SUBSTITUTE:
+        move.teammate_index = client.read_int()
+
+    return move
+
+
+def write_move(out, move):
+    if move is None:
+        out += FALSE
+        return
+
+    out += TRUE
+    out += MOVE_STRUCT.pack(move.speed_up, move.turn, -1 if move.action is None else move.action)
+    if move.action == ActionType.PASS:
+        out += PASS_STRUCT.pack(move.pass_power, move.pass_angle)
+    elif move.action == ActionType.SUBSTITUTE:
+        out += INTEGER_STRUCT.pack(move.teammate_index)
+
+
+def write_moves(out, moves):
+    write_list(out, moves, write_move)
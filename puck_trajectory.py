@@ -0,0 +1,123 @@
+"""
+This module provides class for predicting the path of a free puck.
+
+The puck keeps its velocity, loses a part of its speed every tick and bounces off the rink boards, losing a part of
+its normal speed. Between the goal_net_top and the goal net bottom the left and right boards are open: a puck whose
+center crosses rink_left or rink_right there goes into the goal net and stops.
+
+The path is simulated once per tick for tick_count ticks ahead. Then the position and speed at any tick are O(1)
+lookups and the tick when the puck goes into either goal net is known. Goal nets are told apart by side: the net of a
+player is the one whose front is on the same side of the rink center.
+
+Speed retention and board restitution are not part of Game: the defaults are rough estimates and can be overridden.
+"""
+from model.Game import Game
+from model.World import World
+from point import Point
+
+
+__all__ = ['PuckTrajectory']
+
+
+class PuckTrajectory:
+    DEFAULT_TICK_COUNT = 120
+    DEFAULT_SPEED_RETENTION = 0.999
+    DEFAULT_BOARD_RESTITUTION = 0.25
+
+    def __init__(self, world: World, game: Game, tick_count=DEFAULT_TICK_COUNT,
+                 speed_retention=DEFAULT_SPEED_RETENTION, board_restitution=DEFAULT_BOARD_RESTITUTION):
+        self.tick = world.tick
+        self.tick_count = tick_count
+
+        puck = world.puck
+        x, y, speed_x, speed_y, radius = puck.x, puck.y, puck.speed_x, puck.speed_y, puck.radius
+
+        left, right, top, bottom = game.rink_left, game.rink_right, game.rink_top, game.rink_bottom
+        self.center_x = (left + right) / 2
+        mouth_top = game.goal_net_top
+        mouth_bottom = game.goal_net_top + game.goal_net_height
+
+        self.xs = [x]
+        self.ys = [y]
+        self.speed_xs = [speed_x]
+        self.speed_ys = [speed_y]
+
+        self.net_crossings = {}
+
+        for tick in range(1, tick_count + 1):
+            previous_x, previous_y = x, y
+
+            x += speed_x
+            y += speed_y
+
+            if y - radius < top:
+                y = 2 * (top + radius) - y
+                speed_y = -speed_y * board_restitution
+            elif y + radius > bottom:
+                y = 2 * (bottom - radius) - y
+                speed_y = -speed_y * board_restitution
+
+            if x - radius < left or x + radius > right:
+                line, sign = (left, -1) if x - radius < left else (right, 1)
+
+                if (x - line) * sign > 0:
+                    crossing_y = previous_y + (y - previous_y) * (line - previous_x) / (x - previous_x)
+
+                    if mouth_top <= crossing_y <= mouth_bottom:
+                        self.net_crossings[sign] = (tick - 1 + (line - previous_x) / (x - previous_x), crossing_y)
+                        x, y, speed_x, speed_y = line, crossing_y, 0.0, 0.0
+
+                if sign not in self.net_crossings and not mouth_top <= y <= mouth_bottom:
+                    x = 2 * (line - sign * radius) - x
+                    speed_x = -speed_x * board_restitution
+
+            speed_x *= speed_retention
+            speed_y *= speed_retention
+
+            self.xs.append(x)
+            self.ys.append(y)
+            self.speed_xs.append(speed_x)
+            self.speed_ys.append(speed_y)
+
+            if self.net_crossings:
+                break
+
+        last = len(self.xs) - 1
+        self.xs += [self.xs[last]] * (tick_count - last)
+        self.ys += [self.ys[last]] * (tick_count - last)
+        self.speed_xs += [self.speed_xs[last]] * (tick_count - last)
+        self.speed_ys += [self.speed_ys[last]] * (tick_count - last)
+
+    @staticmethod
+    def of(world: World, game: Game):
+        """
+        :return: the trajectory of this tick, attached to the world as world.puck_trajectory
+        :rtype: PuckTrajectory
+        """
+        trajectory = getattr(world, 'puck_trajectory', None)
+
+        if trajectory is None or trajectory.tick != world.tick:
+            trajectory = world.puck_trajectory = PuckTrajectory(world, game)
+
+        return trajectory
+
+    def _clamp(self, ticks):
+        return min(max(int(ticks), 0), self.tick_count)
+
+    def get_position(self, ticks) -> Point:
+        """
+        :return: position of the puck in ticks from now, the last predicted one beyond tick_count
+        """
+        ticks = self._clamp(ticks)
+        return Point(self.xs[ticks], self.ys[ticks])
+
+    def get_speed(self, ticks) -> Point:
+        ticks = self._clamp(ticks)
+        return Point(self.speed_xs[ticks], self.speed_ys[ticks])
+
+    def get_net_crossing(self, player):
+        """
+        :return: (ticks, y) when and where the puck crosses the front of player's goal net within tick_count ticks,
+            ticks being fractional, or None
+        """
+        return self.net_crossings.get(-1 if player.net_front < self.center_x else 1)
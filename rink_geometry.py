@@ -0,0 +1,112 @@
+"""
+This module provides class for the static geometry of the rink: the points and segments which depend only on where
+the goal nets of the two players are.
+
+It is built once per game, on the first tick, and shared through WorldIndex.rink. Instances are immutable.
+  * goal nets: centers, top and bottom corners and the front segments (top corner to bottom corner);
+  * ForwardStrategy's attack and pre-attack positions and the goal positions next to the opponent's goal net,
+    one above and one below goal_net_horizontal;
+  * DefenceStrategy's defence point and TimeWastingStrategy's start point.
+"""
+from math import copysign
+
+from model.Player import Player
+from point import Point
+from vector import Vector
+
+
+__all__ = ['RinkGeometry']
+
+
+class RinkGeometry:
+    GOAL_NET_HORIZONTAL = 460
+    ATTACK_OFFSET = 500
+    ATTACK_YS = (200.0, 720.0)
+    PRE_ATTACK_OFFSET = 650
+    PRE_ATTACK_YS = (240, 680)
+    DEFENCE_OFFSET = 140
+    TIME_WASTING_START_POINT = (600, 200)
+
+    __slots__ = ('player_id', 'opponent_id', 'net_fronts', 'goal_net_horizontal',
+                 'goal_net_center', 'goal_net_top_corner', 'goal_net_bottom_corner', 'goal_net_front',
+                 'opponent_goal_net_center', 'opponent_goal_net_top_corner', 'opponent_goal_net_bottom_corner',
+                 'opponent_goal_net_front', 'attack_vertical', 'attack_positions', 'pre_attack_vertical',
+                 'pre_attack_positions', 'top_goal_position', 'bottom_goal_position', 'goal_positions',
+                 'defence_vertical', 'defence_point', 'time_wasting_start_point')
+
+    _instance = None
+
+    def __init__(self, player: Player, opponent: Player):
+        values = dict(player_id=player.id, opponent_id=opponent.id, net_fronts=(player.net_front, opponent.net_front),
+                      goal_net_horizontal=self.GOAL_NET_HORIZONTAL)
+
+        for prefix, owner in (('', player), ('opponent_', opponent)):
+            top_corner = self.get_goal_net_top_corner(owner)
+            bottom_corner = self.get_goal_net_bottom_corner(owner)
+
+            values[prefix + 'goal_net_center'] = self.get_goal_net_center(owner)
+            values[prefix + 'goal_net_top_corner'] = top_corner
+            values[prefix + 'goal_net_bottom_corner'] = bottom_corner
+            values[prefix + 'goal_net_front'] = Vector(top_corner, bottom_corner)
+
+        attack_vertical = abs(self.ATTACK_OFFSET - opponent.net_back)
+        pre_attack_vertical = abs(self.PRE_ATTACK_OFFSET - opponent.net_back)
+        values.update(attack_vertical=attack_vertical,
+                      attack_positions=tuple(Point(attack_vertical, y) for y in self.ATTACK_YS),
+                      pre_attack_vertical=pre_attack_vertical,
+                      pre_attack_positions=tuple(Point(pre_attack_vertical, y) for y in self.PRE_ATTACK_YS))
+
+        goal_position_x = (opponent.net_front + opponent.net_back) / 2
+        half_goal_net_height = (opponent.net_bottom - opponent.net_top) / 2
+        top_goal_position = Point(goal_position_x, -half_goal_net_height + self.GOAL_NET_HORIZONTAL)
+        bottom_goal_position = Point(goal_position_x, half_goal_net_height + self.GOAL_NET_HORIZONTAL)
+        values.update(top_goal_position=top_goal_position, bottom_goal_position=bottom_goal_position,
+                      goal_positions=(top_goal_position, bottom_goal_position))
+
+        defence_vertical = abs(self.DEFENCE_OFFSET - player.net_back)
+        values.update(defence_vertical=defence_vertical,
+                      defence_point=Point(defence_vertical, self.GOAL_NET_HORIZONTAL),
+                      time_wasting_start_point=Point(*self.TIME_WASTING_START_POINT))
+
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('RinkGeometry is immutable')
+
+    @staticmethod
+    def of(player: Player, opponent: Player):
+        """
+        :return: the geometry of the game, built on the first call
+        :rtype: RinkGeometry
+        """
+        geometry = RinkGeometry._instance
+
+        if (geometry is None or geometry.player_id != player.id or geometry.opponent_id != opponent.id or
+                geometry.net_fronts != (player.net_front, opponent.net_front)):
+            geometry = RinkGeometry._instance = RinkGeometry(player, opponent)
+
+        return geometry
+
+    @staticmethod
+    def get_goal_net_center(player: Player) -> Point:
+        return Point(player.net_front, (player.net_bottom + player.net_top) / 2)
+
+    @staticmethod
+    def get_goal_net_top_corner(player: Player) -> Point:
+        return Point(player.net_front, player.net_top)
+
+    @staticmethod
+    def get_goal_net_bottom_corner(player: Player) -> Point:
+        return Point(player.net_front, player.net_bottom)
+
+    def get_goal_position(self, attack_point: Point) -> Point:
+        """
+        :return: the goal position on the other side of goal_net_horizontal than attack_point, the bottom one for
+            an attack point on it
+        """
+        if copysign(1.0, self.goal_net_horizontal - attack_point.y) < 0:
+            return self.top_goal_position
+        else:
+            return self.bottom_goal_position
+
@@ -0,0 +1,351 @@
+"""
+This module provides classes for representing search strategy
+
+Instead of following a state machine, the strategy scores candidate (speed_up, turn) pairs by rollouts of the forward
+simulator and keeps the best one found before its per-tick deadline. A rollout applies the candidate for the first
+commit_ticks ticks and then steers straight to the target: the puck, or once we own the puck the position with the best
+chance to score within reach over the horizon by the shot field (the opponent's goal net if no shot scores there).
+The sooner the target is reached, the better; candidates which don't reach it are ranked by the remaining distance.
+The strike starts as soon as no reachable shot is better than the one in the current direction.
+
+Candidates come in rounds: a coarse grid first, then finer and finer grids around the best candidate so far, until
+the deadline. The fallback move (full speed straight to the target) is the best one before any round is scored, so
+a move is always ready when the time runs out.
+
+With worker_count > 0 the rounds are scored by a persistent pool of processes. The hockeyist and the puck are passed
+to them through a shared memory block, one row per teammate. The workers give up at the deadline too, so a late
+rollout doesn't keep them busy into the next search; results coming after the deadline are dropped.
+With the tick's soft deadline set (see latency_watchdog) a search takes at most the time left divided by the number
+of teammates plus one.
+Requires NumPy.
+"""
+import atexit
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from base_strategy import BaseStrategy
+from forward_simulator import ForwardSimulator, SimulationState
+from model.ActionType import ActionType
+from tick_cache import tick_cached_property
+
+
+__all__ = ['SearchStrategy']
+
+
+SNAPSHOT_FIELDS = ('key', 'x', 'y', 'speed_x', 'speed_y', 'angle', 'stamina', 'radius', 'agility',
+                   'puck_x', 'puck_y', 'puck_speed_x', 'puck_speed_y', 'puck_radius', 'own_puck',
+                   'target_x', 'target_y', 'reach_distance')
+SNAPSHOT = {name: index for index, name in enumerate(SNAPSHOT_FIELDS)}
+SNAPSHOT_ROWS = 6
+
+
+def get_snapshots(memory):
+    return np.ndarray((SNAPSHOT_ROWS, len(SNAPSHOT_FIELDS)), np.float64, memory.buf)
+
+
+def score_candidates(simulator, snapshot, speed_ups, turns, horizon, commit_ticks, deadline=None):
+    """
+    :param deadline: time.perf_counter() value to give up at
+    :return: the score of every candidate, the greater the better, or None if the deadline has passed
+    """
+    state = SimulationState(len(speed_ups), snapshot[SNAPSHOT['radius']], snapshot[SNAPSHOT['puck_radius']],
+                            snapshot[SNAPSHOT['agility']])
+
+    for name in SimulationState.FIELDS:
+        getattr(state, name)[:] = snapshot[SNAPSHOT[name]]
+
+    own_puck = snapshot[SNAPSHOT['own_puck']] > 0
+    state.own_puck[:] = own_puck
+
+    target_x, target_y = snapshot[SNAPSHOT['target_x']], snapshot[SNAPSHOT['target_y']]
+    reach_distance = snapshot[SNAPSHOT['reach_distance']]
+
+    reached_at = np.full(len(speed_ups), np.inf)
+
+    for tick in range(horizon):
+        if deadline is not None and time.perf_counter() > deadline:
+            return None
+
+        if not own_puck:
+            target_x, target_y = state.puck_x, state.puck_y
+
+        if tick < commit_ticks:
+            simulator.step(state, speed_ups, turns)
+        else:
+            angle = np.arctan2(target_y - state.y, target_x - state.x) - state.angle
+            simulator.step(state, 1.0, (angle + np.pi) % (2.0 * np.pi) - np.pi)
+
+        if own_puck:
+            reached = np.hypot(target_x - state.x, target_y - state.y) < reach_distance
+        else:
+            reached = simulator.can_reach_puck(state)
+
+        reached_at = np.where(np.isinf(reached_at) & reached, tick + 1, reached_at)
+
+    distance = np.hypot(target_x - state.x, target_y - state.y)
+    return np.where(np.isfinite(reached_at), -reached_at, -horizon - distance / simulator.game.hockeyist_max_speed)
+
+
+_worker_simulator = None
+_worker_memory = None
+
+
+def _init_worker(game, memory_name):
+    global _worker_simulator, _worker_memory
+
+    _worker_simulator = ForwardSimulator(game)
+    _worker_memory = shared_memory.SharedMemory(memory_name)
+
+
+def _score_in_worker(row, key, speed_ups, turns, horizon, commit_ticks, deadline):
+    snapshot = get_snapshots(_worker_memory)[row].copy()
+
+    if snapshot[SNAPSHOT['key']] != key:
+        return None
+
+    return score_candidates(_worker_simulator, snapshot, speed_ups, turns, horizon, commit_ticks, deadline)
+
+
+class RolloutPool:
+    _instance = None
+
+    def __init__(self, game, worker_count):
+        self.game = game
+        self.memory = shared_memory.SharedMemory(create=True, size=SNAPSHOT_ROWS * len(SNAPSHOT_FIELDS) * 8)
+        self.snapshots = get_snapshots(self.memory)
+        self.snapshots[:] = np.nan
+
+        self.worker_count = worker_count
+        self.executor = ProcessPoolExecutor(worker_count, initializer=_init_worker, initargs=(game, self.memory.name))
+
+        atexit.register(self.close)
+
+    @staticmethod
+    def of(game, worker_count):
+        """
+        :return: the pool of worker_count workers simulating the game, the pool of another game or worker count is
+            closed and replaced
+        :rtype: RolloutPool
+        """
+        pool = RolloutPool._instance
+
+        if pool is None or pool.game is not game or pool.worker_count != worker_count:
+            if pool is not None:
+                pool.close()
+
+            pool = RolloutPool._instance = RolloutPool(game, worker_count)
+
+        return pool
+
+    def submit(self, row, key, speed_ups, turns, horizon, commit_ticks, deadline=None):
+        """
+        :param deadline: time.perf_counter() value the workers give up at, the clock is shared by the processes
+        :return: futures scoring the candidates split between the workers
+        """
+        return [(indices, self.executor.submit(_score_in_worker, row, key, speed_ups[indices], turns[indices],
+                                               horizon, commit_ticks, deadline))
+                for indices in np.array_split(np.arange(len(speed_ups)), self.worker_count) if len(indices)]
+
+    def close(self):
+        atexit.unregister(self.close)
+
+        if RolloutPool._instance is self:
+            RolloutPool._instance = None
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        del self.snapshots
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SearchStrategy(BaseStrategy):
+    deadline = 0.010
+    worker_count = 0
+    horizon = 30
+    commit_ticks = 5
+    speed_up_steps = 5
+    turn_steps = 7
+
+    def __init__(self, me, world, game, move, info):
+        super().__init__(me, world, game, move, info)
+
+        self._allowed_distance_to_goal_net = 400
+        self._allowed_distance_to_shot_position = 50
+
+        self.update_state()
+
+    def update_state(self):
+        started = time.perf_counter()
+        game = self.game
+
+        self._key = float(self.world.tick)
+        self._snapshot = self.get_snapshot()
+        self._max_turn = game.hockeyist_turn_angle_factor * self.me.agility / game.hockeyist_attribute_base_value
+
+        angle_to_target = self.get_angle_to(self._snapshot[SNAPSHOT['target_x']], self._snapshot[SNAPSHOT['target_y']])
+
+        self.best_speed_up = 1.0
+        self.best_turn = max(-self._max_turn, min(self._max_turn, angle_to_target))
+        self.best_score = -np.inf
+        self.rounds = 0
+
+        self.search(started + min(self.deadline, self.time_left / (len(self.index.my_hockeyists) + 1)))
+
+    @staticmethod
+    def configure(deadline, worker_count=0):
+        SearchStrategy.deadline = deadline
+        SearchStrategy.worker_count = worker_count
+
+    def get_snapshot(self):
+        me, puck = self.me, self.puck
+        snapshot = np.zeros(len(SNAPSHOT_FIELDS))
+
+        if not self.own_puck:
+            target, reach_distance = puck, self._allowed_distance_to_goal_net
+        elif self.best_shot_chance > 0:
+            target, reach_distance = self.best_shot_position, self._allowed_distance_to_shot_position
+        else:
+            target, reach_distance = self.opponent_goal_net_center, self._allowed_distance_to_goal_net
+
+        values = dict(key=self._key, x=me.x, y=me.y, speed_x=me.speed_x, speed_y=me.speed_y, angle=me.angle,
+                      stamina=me.stamina, radius=me.radius, agility=me.agility,
+                      puck_x=puck.x, puck_y=puck.y, puck_speed_x=puck.speed_x, puck_speed_y=puck.speed_y,
+                      puck_radius=puck.radius, own_puck=float(self.own_puck),
+                      target_x=target.x, target_y=target.y, reach_distance=reach_distance)
+
+        for name, value in values.items():
+            snapshot[SNAPSHOT[name]] = value
+
+        return snapshot
+
+    @property
+    def shot_speed(self):
+        return self.get_shot_speed(self.max_effective_swing_ticks)
+
+    @property
+    def best_shot_position(self):
+        return self.best_shot[0]
+
+    @property
+    def best_shot_chance(self):
+        return self.best_shot[2]
+
+    @tick_cached_property
+    def best_shot(self):
+        """
+        :return: position within reach over the horizon with the best shot, direction and chance to score of the shot
+        """
+        return self.shot_field.get_best_position(self.opponent, self.opponent_goalie, self.shot_speed, self.me.x,
+                                                 self.me.y, self.horizon * self.game.hockeyist_max_speed)
+
+    @tick_cached_property
+    def shot_chance(self):
+        """
+        :return: chance to score by a shot in the current direction
+        """
+        return self.shot_field.get_chance(self.opponent, self.opponent_goalie, self.shot_speed, self.me.x, self.me.y,
+                                          self.me.angle)
+
+    def get_candidates(self, spread):
+        """
+        :return: grid of speed_ups and turns around the best candidate, spread being the part of the full range
+        """
+        speed_ups = np.clip(self.best_speed_up + spread * 2.0 * np.linspace(-1.0, 1.0, self.speed_up_steps), -1, 1)
+        turns = np.clip(self.best_turn + spread * 2.0 * self._max_turn * np.linspace(-1.0, 1.0, self.turn_steps),
+                        -self._max_turn, self._max_turn)
+
+        speed_ups, turns = np.meshgrid(speed_ups, turns)
+        return speed_ups.ravel(), turns.ravel()
+
+    def update_best(self, speed_ups, turns, scores):
+        best = int(np.argmax(scores))
+
+        if scores[best] > self.best_score:
+            self.best_speed_up, self.best_turn = float(speed_ups[best]), float(turns[best])
+            self.best_score = scores[best]
+
+        self.rounds += 1
+
+    def search(self, deadline):
+        if self.worker_count > 0:
+            self.search_in_pool(deadline)
+        else:
+            self.search_in_process(deadline)
+
+    def search_in_process(self, deadline):
+        simulator = self.simulator
+        spread = 1.0
+
+        while time.perf_counter() < deadline:
+            speed_ups, turns = self.get_candidates(spread)
+            scores = score_candidates(simulator, self._snapshot, speed_ups, turns, self.horizon, self.commit_ticks,
+                                      deadline)
+
+            if scores is None:
+                break
+
+            self.update_best(speed_ups, turns, scores)
+            spread /= 2
+
+    def search_in_pool(self, deadline):
+        pool = RolloutPool.of(self.game, self.worker_count)
+        row = self.me.teammate_index % SNAPSHOT_ROWS
+        pool.snapshots[row] = self._snapshot
+
+        spread = 1.0
+
+        while time.perf_counter() < deadline:
+            speed_ups, turns = self.get_candidates(spread)
+            pending = dict((future, indices) for indices, future in
+                           pool.submit(row, self._key, speed_ups, turns, self.horizon, self.commit_ticks, deadline))
+            scores = np.full(len(speed_ups), -np.inf)
+            complete = True
+
+            while pending and complete:
+                done, _ = wait(pending, max(0.0, deadline - time.perf_counter()), FIRST_COMPLETED)
+
+                if not done:
+                    break
+
+                for future in done:
+                    result = future.result()
+
+                    # a worker gives up at the deadline, or on the snapshot of another tick
+                    if result is None:
+                        complete = False
+                    else:
+                        scores[pending[future]] = result
+
+                    del pending[future]
+
+            for future in pending:
+                future.cancel()
+
+            if pending or not complete:
+                break
+
+            self.update_best(speed_ups, turns, scores)
+            spread /= 2
+
+    @property
+    def speed_up(self):
+        return self.best_speed_up
+
+    @property
+    def turn(self):
+        return self.best_turn
+
+    @property
+    def action(self):
+        if not self.own_puck:
+            return self.take_puck_or_prevent_attack_or_attack_opponent
+        elif 0 < self.best_shot_chance <= self.shot_chance:
+            return self.swing_at_most(self.max_effective_swing_ticks)
+        elif (self.get_distance_to_unit(self.opponent_goal_net_center) < self._allowed_distance_to_goal_net and
+                abs(self.angle_to_opponent_goal_net_center) < self.stick_sector / 2):
+            return self.swing_at_most(self.max_effective_swing_ticks)
+        else:
+            return ActionType.NONE
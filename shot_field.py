@@ -0,0 +1,282 @@
+"""
+This module provides a field of the chances to score from the offensive zone, by position and heading of the striker.
+
+The offensive zone is the half of the rink next to the opponent's goal net, split into cells of CELL_SIZE. A shot
+leaves the center of a cell in one of HEADING_COUNT headings towards the net, deviated by the normal distribution of
+strike_angle_deviation, which is sampled by DEVIATION_SAMPLES equally likely quantiles. For every sample where the
+puck center crosses the goal mouth the static tables keep the cell and heading, the crossing y and the path length;
+they depend only on Game and are built once, see table_cache.TableCache.
+
+A sample scores unless the goalie, moving at goalie_max_speed towards the crossing y within the goal mouth, gets
+within goalie radius plus PUCK_RADIUS of it by the time the puck, slowing down as in PuckTrajectory, gets there.
+For a puck speed that is the case when the goalie y lies strictly between two bounds of the sample, so the
+ScoredCounts of a speed keep the samples the goalie can block sorted by both bounds: when the goalie moves only the
+samples with a bound between its old and new y are checked, and only their cells are updated. The counts of the
+MAX_KEPT_SPEEDS speeds used last are kept, in buckets of GOALIE_STEP and SPEED_STEP.
+Rebounds, other hockeyists and the speed of the striker are ignored.
+
+Tables are built for the net on the right; queries about the net on the left are mirrored. Requires NumPy.
+"""
+from collections import OrderedDict
+from math import pi
+from statistics import NormalDist
+
+import numpy as np
+
+from model.Game import Game
+from model.Hockeyist import Hockeyist
+from model.Player import Player
+from point import Point
+from puck_trajectory import PuckTrajectory
+from table_cache import PrecomputedTables
+
+
+__all__ = ['ShotField', 'ScoredCounts']
+
+
+class ShotField(PrecomputedTables):
+    CELL_SIZE = 20.0
+    HEADING_COUNT = 64
+    DEVIATION_SAMPLES = 7
+    PUCK_RADIUS = 20.0
+    GOALIE_STEP = 10.0
+    SPEED_STEP = 1.0
+    MAX_KEPT_SPEEDS = 4
+
+    CACHE_NAME = 'shot_field'
+    GAME_FIELDS = ('world_width', 'rink_left', 'rink_right', 'rink_top', 'rink_bottom', 'goal_net_top',
+                   'goal_net_height', 'strike_angle_deviation')
+    CACHE_PARAMETERS = (CELL_SIZE, HEADING_COUNT, DEVIATION_SAMPLES)
+    TABLE_NAMES = ('entry_cells', 'entry_crossing_ys', 'entry_distances')
+
+    def __init__(self, game: Game, tables=None):
+        """
+        :param tables: arrays by the names in TABLE_NAMES built for the same game fields, the tables are built from
+            the game if None
+        """
+        self.game = game
+        self.speed_retention = PuckTrajectory.DEFAULT_SPEED_RETENTION
+
+        self.left = game.world_width / 2
+        self.column_count = int(np.ceil((game.rink_right - self.left) / self.CELL_SIZE))
+        self.row_count = int(np.ceil((game.rink_bottom - game.rink_top) / self.CELL_SIZE))
+        self.shape = (self.column_count, self.row_count, self.HEADING_COUNT)
+
+        self.xs = self.left + (np.arange(self.column_count) + 0.5) * self.CELL_SIZE
+        self.ys = game.rink_top + (np.arange(self.row_count) + 0.5) * self.CELL_SIZE
+        self.headings = -pi / 2 + (np.arange(self.HEADING_COUNT) + 0.5) * pi / self.HEADING_COUNT
+
+        if tables is None:
+            tables = self.build_tables()
+
+        self.set_tables(tables)
+
+        self.scored_counts = OrderedDict()
+
+    def build_tables(self):
+        game = self.game
+        quantiles = [NormalDist().inv_cdf((index + 0.5) / self.DEVIATION_SAMPLES)
+                     for index in range(self.DEVIATION_SAMPLES)]
+
+        angles = (self.headings[None, None, :, None] +
+                  game.strike_angle_deviation * np.array(quantiles)[None, None, None, :])
+        cos, sin = np.cos(angles), np.sin(angles)
+        distances = (game.rink_right - self.xs)[:, None, None, None] / cos
+        crossing_ys = self.ys[None, :, None, None] + distances * sin
+        distances = np.broadcast_to(distances, crossing_ys.shape)
+
+        scored = (cos > 0) & (crossing_ys >= game.goal_net_top) & (crossing_ys <= game.goal_net_top +
+                                                                     game.goal_net_height)
+        cells = np.broadcast_to(np.arange(np.prod(self.shape)).reshape(self.shape)[..., None], scored.shape)
+
+        return dict(entry_cells=cells[scored].astype(np.int32), entry_crossing_ys=crossing_ys[scored],
+                    entry_distances=distances[scored])
+
+    def get_scored_counts(self, goalie: Hockeyist, puck_speed):
+        """
+        :param goalie: the opponent's goalie, None if there is none
+        :return: uint8 array of shape (columns, rows, headings) of the numbers of the DEVIATION_SAMPLES samples that
+            score, valid until the next query
+        """
+        speed_bucket = max(int(puck_speed / self.SPEED_STEP + 0.5), 0)
+        counts = self.scored_counts.get(speed_bucket)
+
+        if counts is None or (goalie is not None and counts.goalie_radius != goalie.radius):
+            if counts is None and len(self.scored_counts) >= self.MAX_KEPT_SPEEDS:
+                self.scored_counts.popitem(last=False)
+
+            counts = self.scored_counts[speed_bucket] = ScoredCounts(
+                self, speed_bucket * self.SPEED_STEP, 0.0 if goalie is None else goalie.radius)
+
+        self.scored_counts.move_to_end(speed_bucket)
+        counts.move_goalie(None if goalie is None else int(goalie.y / self.GOALIE_STEP + 0.5) * self.GOALIE_STEP)
+
+        return counts.counts
+
+    def is_mirrored(self, opponent: Player):
+        return opponent.net_front < self.left
+
+    def to_field(self, opponent: Player, x, y, angle=0.0):
+        """
+        :return: x, y and angle in the orientation of the tables
+        """
+        if self.is_mirrored(opponent):
+            x, angle = self.game.rink_left + self.game.rink_right - x, pi - angle
+
+        return x, y, (angle + pi) % (2 * pi) - pi
+
+    def from_field_angle(self, opponent: Player, angle):
+        return (pi - angle + pi) % (2 * pi) - pi if self.is_mirrored(opponent) else angle
+
+    def get_cell(self, x, y):
+        column = min(max(int((x - self.left) / self.CELL_SIZE), 0), self.column_count - 1)
+        row = min(max(int((y - self.game.rink_top) / self.CELL_SIZE), 0), self.row_count - 1)
+
+        return column, row
+
+    def get_heading_index(self, angle):
+        """
+        :return: the index of the heading nearest to the angle in the orientation of the tables, None if the angle
+            points away from the net
+        """
+        if abs(angle) >= pi / 2:
+            return None
+
+        return min(int((angle + pi / 2) / pi * self.HEADING_COUNT), self.HEADING_COUNT - 1)
+
+    def get_chance(self, opponent: Player, goalie: Hockeyist, puck_speed, x, y, angle):
+        """
+        :return: the chance to score by a shot from (x, y) in the direction of angle
+        """
+        x, y, angle = self.to_field(opponent, x, y, angle)
+        heading = self.get_heading_index(angle)
+
+        if heading is None or x < self.left:
+            return 0.0
+
+        counts = self.get_scored_counts(goalie, puck_speed)
+
+        return int(counts[self.get_cell(x, y) + (heading,)]) / self.DEVIATION_SAMPLES
+
+    def get_best_angle(self, opponent: Player, goalie: Hockeyist, puck_speed, x, y):
+        """
+        :return: the direction of the best shot from (x, y) and its chance to score, (None, 0.0) outside the
+            offensive zone
+        """
+        x, y, _ = self.to_field(opponent, x, y)
+
+        if x < self.left:
+            return None, 0.0
+
+        cell_counts = self.get_scored_counts(goalie, puck_speed)[self.get_cell(x, y)]
+        heading = int(np.argmax(cell_counts))
+
+        return (self.from_field_angle(opponent, float(self.headings[heading])),
+                int(cell_counts[heading]) / self.DEVIATION_SAMPLES)
+
+    def get_best_position(self, opponent: Player, goalie: Hockeyist, puck_speed, x, y, max_distance):
+        """
+        :return: the center of the cell within max_distance of (x, y) with the best shot, the direction and the
+            chance to score of that shot, (None, None, 0.0) if there is no cell in reach
+        """
+        field_x, field_y, _ = self.to_field(opponent, x, y)
+        in_reach = np.hypot(self.xs[:, None] - field_x, self.ys[None, :] - field_y) <= max_distance
+
+        if not in_reach.any():
+            return None, None, 0.0
+
+        counts = self.get_scored_counts(goalie, puck_speed)
+        best_counts = np.where(in_reach, counts.max(axis=2).astype(np.int16), -1)
+        column, row = np.unravel_index(int(np.argmax(best_counts)), best_counts.shape)
+        heading = int(np.argmax(counts[column, row]))
+
+        position_x = float(self.xs[column])
+
+        if self.is_mirrored(opponent):
+            position_x = self.game.rink_left + self.game.rink_right - position_x
+
+        return (Point(position_x, float(self.ys[row])), self.from_field_angle(opponent, float(self.headings[heading])),
+                int(counts[column, row, heading]) / self.DEVIATION_SAMPLES)
+
+
+class ScoredCounts:
+    """
+    Numbers of the scoring samples by cell for one puck speed, updated in place as the goalie moves.
+
+    With the goalie y clipped to the goal mouth, a reachable sample is blocked if and only if its crossing y is
+    within goalie radius plus PUCK_RADIUS of the mouth and lower < goalie y < upper, where lower and upper are the
+    crossing y minus and plus that distance and the goalie's reach by the time the puck gets there. Moving the goalie
+    up blocks the samples with lower between its old and new y and unblocks those with upper there, a sample with both
+    is counted once each way; moving it down does the opposite.
+    """
+    MAX_SCATTERED_CELLS = 512
+
+    def __init__(self, field: ShotField, puck_speed, goalie_radius):
+        game = field.game
+        retention = field.speed_retention
+        self.goalie_radius = goalie_radius
+
+        with np.errstate(divide='ignore'):
+            left_part = 1.0 - field.entry_distances * (1.0 - retention) / puck_speed
+
+        reachable = left_part > 0
+        self.top = game.goal_net_top + goalie_radius
+        self.bottom = game.goal_net_top + game.goal_net_height - goalie_radius
+        block_distance = goalie_radius + field.PUCK_RADIUS
+        crossing_ys = field.entry_crossing_ys[reachable]
+        blockable = (crossing_ys > self.top - block_distance) & (crossing_ys < self.bottom + block_distance)
+        crossing_ys = crossing_ys[blockable]
+        cells = field.entry_cells[reachable][blockable]
+        half_widths = game.goalie_max_speed * np.log(left_part[reachable][blockable]) / np.log(retention)
+        half_widths += block_distance
+
+        self.lowers, self.lower_cells = self.sort_bounds(crossing_ys - half_widths, cells)
+        self.uppers, self.upper_cells = self.sort_bounds(crossing_ys + half_widths, cells)
+
+        self.flat_counts = np.bincount(field.entry_cells[reachable], minlength=int(np.prod(field.shape)))
+        self.flat_counts = self.flat_counts.astype(np.uint8)
+        self.counts = self.flat_counts.reshape(field.shape)
+        self.counts.setflags(write=False)
+        self.goalie_y = -np.inf
+
+    @staticmethod
+    def sort_bounds(bounds, cells):
+        order = np.argsort(bounds)
+        return bounds[order], cells[order]
+
+    def move_goalie(self, goalie_y):
+        """
+        Updates the counts of the cells with samples that the move from the previous goalie y blocks or unblocks.
+
+        :param goalie_y: None if there is no goalie
+        """
+        goalie_y = -np.inf if goalie_y is None else min(max(goalie_y, self.top), self.bottom)
+
+        if goalie_y == self.goalie_y:
+            return
+
+        low, high = min(self.goalie_y, goalie_y), max(self.goalie_y, goalie_y)
+        passed_lower_cells = self.lower_cells[np.searchsorted(self.lowers, low):np.searchsorted(self.lowers, high)]
+        passed_upper_cells = self.upper_cells[np.searchsorted(self.uppers, low, side='right'):
+                                              np.searchsorted(self.uppers, high, side='right')]
+
+        # the counts are uint8, a cell going below zero in between wraps around and comes back
+        if goalie_y > self.goalie_y:
+            self.update_counts(np.subtract, passed_lower_cells)
+            self.update_counts(np.add, passed_upper_cells)
+        else:
+            self.update_counts(np.add, passed_lower_cells)
+            self.update_counts(np.subtract, passed_upper_cells)
+
+        self.goalie_y = goalie_y
+
+    def update_counts(self, operation, cells):
+        """
+        Applies operation with 1 to the count of every cell of cells, once per occurrence.
+        """
+        if len(cells) > self.MAX_SCATTERED_CELLS:
+            # cheaper than scattering when the goalie appears or leaves and most samples change
+            operation(self.flat_counts, np.bincount(cells, minlength=len(self.flat_counts)).astype(np.uint8),
+                      out=self.flat_counts)
+        else:
+            operation.at(self.flat_counts, cells, 1)
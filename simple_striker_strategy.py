@@ -3,7 +3,8 @@ This module provides classes for representing simply striker strategy
 """
 from enum import Enum
 from model.ActionType import ActionType
-from base_strategy import BaseStrategy
+from state_machine import (StateMachineStrategy, StateInfo, StateBehaviour, Transition, Guard, ANY_STATE,
+                           OWN_PUCK, OUR_TEAM_OWN_PUCK)
 
 
 class StrategyState(Enum):
@@ -13,7 +14,7 @@ class StrategyState(Enum):
     attack = 4
 
 
-class SimpleStrikerStrategy(BaseStrategy):
+class SimpleStrikerStrategy(StateMachineStrategy):
 
     def __init__(self, me, world, game, move, info):
         super().__init__(me, world, game, move, info)
@@ -22,67 +23,30 @@ class SimpleStrikerStrategy(BaseStrategy):
 
         self.update_state()
 
-    @property
-    def speed_up(self):
-        return {
-            StrategyState.kick_all_opponents: 1.0,
-            StrategyState.take_puck: 1.0,
-            StrategyState.turn_to_opponent_goal_net: 0.0,
-            StrategyState.attack: 0.0
-        }[self.state]
-
-    @property
-    def turn(self):
-        return {
-            StrategyState.kick_all_opponents: self.angle_to_nearest_opponent,
-            StrategyState.take_puck: self.angle_to_puck,
-            StrategyState.turn_to_opponent_goal_net: self.angle_to_opponent_goal_net_center,
-            StrategyState.attack: self.angle_to_opponent_goal_net_center
-        }[self.state]
-
-    @property
-    def action(self):
-        return {
-            StrategyState.kick_all_opponents: self.take_puck_or_prevent_attack_or_attack_opponent,
-            StrategyState.take_puck: self.take_puck_or_prevent_attack_or_attack_opponent,
-            StrategyState.turn_to_opponent_goal_net: ActionType.NONE,
-            StrategyState.attack: ActionType.STRIKE
-        }[self.state]
+    behaviours = {
+        StrategyState.kick_all_opponents: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.angle_to_nearest_opponent,
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.take_puck: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.angle_to_puck,
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.turn_to_opponent_goal_net: StateBehaviour(
+            turn=lambda s: s.angle_to_opponent_goal_net_center),
+        StrategyState.attack: StateBehaviour(
+            turn=lambda s: s.angle_to_opponent_goal_net_center,
+            action=ActionType.STRIKE)
+    }
+
+    transitions = [
+        Transition(ANY_STATE, StrategyState.take_puck, ~OUR_TEAM_OWN_PUCK),
+        Transition(ANY_STATE, StrategyState.attack,
+                   OWN_PUCK & Guard(lambda s: abs(s.get_angle_to_unit(s.opponent_goal_net_center)) < s._allowed_angle)),
+        Transition(ANY_STATE, StrategyState.turn_to_opponent_goal_net, OWN_PUCK),
+        Transition(ANY_STATE, StrategyState.kick_all_opponents)
+    ]
 
     @staticmethod
     def initial_info():
-        return {
-            'state': StrategyState.kick_all_opponents
-        }
-
-    @property
-    def state(self):
-        return self.info['state']
-
-    @state.setter
-    def state(self, value):
-        self.info['state'] = value
-
-    def update_state(self):
-        new_state = self.get_next_state(self.state)
-
-        while self.state != new_state:
-            self.state = new_state
-            new_state = self.get_next_state(self.state)
-
-    def get_next_state(self, state):
-        if not self.our_team_own_puck:
-            state = StrategyState.take_puck
-        elif self.own_puck:
-            state = StrategyState.turn_to_opponent_goal_net
-        else:
-            state = StrategyState.kick_all_opponents
-
-        if state == StrategyState.take_puck and self.own_puck:
-            state = StrategyState.turn_to_opponent_goal_net
-
-        elif (state == StrategyState.turn_to_opponent_goal_net and
-                abs(self.get_angle_to_unit(self.opponent_goal_net_center)) < self._allowed_angle):
-            state = StrategyState.attack
-
-        return state
\ No newline at end of file
+        return StateInfo(StrategyState.kick_all_opponents)
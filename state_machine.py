@@ -0,0 +1,120 @@
+"""
+This module provides classes for declaring strategies as state machines.
+
+Every state maps to a StateBehaviour holding speed_up, turn and action. Each of them is either a constant or
+a callable taking the strategy, and only the one of the active state is evaluated. Transitions are checked in
+the declared order and the first one which matches the current state and whose guard holds gives the next state.
+The current state is kept in a StateInfo shared by all instances of the strategy.
+"""
+from base_strategy import BaseStrategy
+from model.ActionType import ActionType
+
+
+__all__ = ['StateMachineStrategy', 'StateInfo', 'StateBehaviour', 'Transition', 'Guard', 'ANY_STATE',
+           'OWN_PUCK', 'OUR_TEAM_OWN_PUCK', 'OPPONENT_IS_GOING_TO_ATTACK', 'PUCK_IS_MOVING_TO_OUR_GOAL_NET',
+           'CAN_INFLUENCE_PUCK']
+
+
+ANY_STATE = None
+
+
+class Guard:
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+    @staticmethod
+    def attribute(name):
+        return Guard(lambda strategy: getattr(strategy, name))
+
+    def __call__(self, strategy):
+        return self.predicate(strategy)
+
+    def __invert__(self):
+        return Guard(lambda strategy: not self.predicate(strategy))
+
+    def __and__(self, other):
+        return Guard(lambda strategy: self.predicate(strategy) and other(strategy))
+
+
+OWN_PUCK = Guard.attribute('own_puck')
+OUR_TEAM_OWN_PUCK = Guard.attribute('our_team_own_puck')
+OPPONENT_IS_GOING_TO_ATTACK = Guard.attribute('opponent_is_going_to_attack')
+PUCK_IS_MOVING_TO_OUR_GOAL_NET = Guard.attribute('puck_is_moving_to_our_goal_net')
+CAN_INFLUENCE_PUCK = Guard.attribute('can_influence_puck')
+
+
+class Transition:
+    def __init__(self, sources, target, guard=None):
+        """
+        :param sources: states the transition starts from, ANY_STATE for every state
+        :param guard: callable taking the strategy, None for the unconditional transition
+        """
+        self.sources = frozenset(sources) if sources is not ANY_STATE else ANY_STATE
+        self.target = target
+        self.guard = guard
+
+    def matches(self, strategy, state):
+        return ((self.sources is ANY_STATE or state in self.sources) and
+                (self.guard is None or self.guard(strategy)))
+
+
+class StateBehaviour:
+    def __init__(self, speed_up=0.0, turn=0.0, action=ActionType.NONE):
+        self.speed_up = speed_up
+        self.turn = turn
+        self.action = action
+
+
+class StateInfo:
+    __slots__ = ('state',)
+
+    def __init__(self, state):
+        self.state = state
+
+
+class StateMachineStrategy(BaseStrategy):
+    """
+    Keeps the state in info.state. Subclasses declare behaviours and transitions and call update_state()
+    once they are initialized.
+    """
+
+    behaviours = {}
+    transitions = []
+
+    @staticmethod
+    def evaluate(value, strategy):
+        return value(strategy) if callable(value) else value
+
+    @property
+    def speed_up(self):
+        return self.evaluate(self.behaviours[self.state].speed_up, self)
+
+    @property
+    def turn(self):
+        return self.evaluate(self.behaviours[self.state].turn, self)
+
+    @property
+    def action(self):
+        return self.evaluate(self.behaviours[self.state].action, self)
+
+    @property
+    def state(self):
+        return self.info.state
+
+    @state.setter
+    def state(self, value):
+        self.info.state = value
+
+    def update_state(self):
+        new_state = self.get_next_state(self.state)
+
+        while self.state != new_state:
+            self.state = new_state
+            new_state = self.get_next_state(self.state)
+
+    def get_next_state(self, state):
+        for transition in self.transitions:
+            if transition.matches(self, state):
+                return transition.target
+
+        return state
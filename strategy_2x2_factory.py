@@ -5,17 +5,18 @@ from base_strategy import BaseStrategy
 from base_strategy_factory import BaseStrategyFactory
 from defence_strategy import DefenceStrategy
 from defenceman_kicker_strategy import DefencemanKickerStrategy
-from forward_strategy import ForwardStrategy
 from no_goalies_strategy import NoGoaliesStrategy
+from team_plan import Role
 
 __all__ = ['Strategy2x2Factory']
 
 
 class Strategy2x2Factory(BaseStrategyFactory):
-    @staticmethod
-    def is_forward(strategy: BaseStrategy):
-        return strategy.own_puck or sorted(strategy.my_hockeyists,
-                                           key=lambda h: h.get_distance_to_unit(strategy.puck))[0].id == strategy.me.id
+    def is_forward(self, strategy: BaseStrategy):
+        return self.get_role(strategy) in (Role.FORWARD, Role.INTERCEPT)
+
+    def get_team_roles(self, strategy: BaseStrategy):
+        return [Role.FORWARD if strategy.our_team_own_puck else Role.INTERCEPT, Role.DEFENCE]
 
     def create_strategy(self, me, world, game, move) -> BaseStrategy:
         strategy = self.create_base_strategy(me, world, game, move)
@@ -24,29 +25,29 @@ class Strategy2x2Factory(BaseStrategyFactory):
             strategy = NoGoaliesStrategy
         elif strategy.my_score == strategy.opponent_score:
             if strategy.opponent_team_own_puck:
-                strategy = self.last_strategies[me.id]
+                strategy = self.last_strategies.get(me.id, DefenceStrategy)
 
                 if (strategy == DefencemanKickerStrategy or
-                        all(s == ForwardStrategy for s in self.last_strategies.values())):
+                        all(s == self.forward_strategy for s in self.last_strategies.values())):
                     strategy = DefenceStrategy
             else:
-                strategy = ForwardStrategy if self.is_forward(strategy) else DefenceStrategy
+                strategy = self.forward_strategy if self.is_forward(strategy) else DefenceStrategy
         else:
             if self.is_forward(strategy):
-                strategy = ForwardStrategy
+                strategy = self.forward_strategy
             else:
                 strategy = DefenceStrategy
 
         self.last_strategies[me.id] = strategy
 
-        return strategy(me, world, game, move, self.info[strategy])
+        return self.get_strategy(strategy, me, world, game, move)
 
     @property
     def strategies(self):
         return [
             BaseStrategy,
             DefenceStrategy,
-            ForwardStrategy,
+            self.forward_strategy,
             NoGoaliesStrategy,
             DefencemanKickerStrategy
         ]
@@ -5,11 +5,11 @@ from base_strategy import BaseStrategy
 from base_strategy_factory import BaseStrategyFactory
 from defence_strategy import DefenceStrategy
 from defenceman_kicker_strategy import DefencemanKickerStrategy
-from forward_strategy import ForwardStrategy
 from model.HockeyistType import HockeyistType
 from no_goalies_strategy import NoGoaliesStrategy
+from team_plan import Role
 
-__all__ = ['Strategy2x2Factory']
+__all__ = ['Strategy2x3Factory']
 
 
 class Strategy2x3Factory(BaseStrategyFactory):
@@ -19,29 +19,53 @@ class Strategy2x3Factory(BaseStrategyFactory):
         if strategy.no_goalies():
             strategy = NoGoaliesStrategy
         else:
-            if strategy.our_team_own_puck:
-                strategy = {
-                    HockeyistType.VERSATILE: DefencemanKickerStrategy,
-                    HockeyistType.FORWARD: ForwardStrategy,
-                    HockeyistType.DEFENCEMAN: DefenceStrategy
-                }[strategy.me.type]
-            else:
-                strategy = {
-                    HockeyistType.VERSATILE: DefenceStrategy,
-                    HockeyistType.FORWARD: ForwardStrategy,
-                    HockeyistType.DEFENCEMAN: DefenceStrategy
-                }[strategy.me.type]
+            strategy = {
+                Role.KICKER: DefencemanKickerStrategy,
+                Role.FORWARD: self.forward_strategy,
+                Role.INTERCEPT: self.forward_strategy,
+                Role.DEFENCE: DefenceStrategy
+            }[self.get_role(strategy)]
 
         self.last_strategies[me.id] = strategy
 
-        return strategy(me, world, game, move, self.info[strategy])
+        return self.get_strategy(strategy, me, world, game, move)
+
+    @staticmethod
+    def get_preferred_roles(strategy: BaseStrategy):
+        if strategy.our_team_own_puck:
+            return {
+                HockeyistType.VERSATILE: Role.KICKER,
+                HockeyistType.FORWARD: Role.FORWARD,
+                HockeyistType.DEFENCEMAN: Role.DEFENCE
+            }
+        else:
+            return {
+                HockeyistType.VERSATILE: Role.DEFENCE,
+                HockeyistType.FORWARD: Role.INTERCEPT,
+                HockeyistType.DEFENCEMAN: Role.DEFENCE
+            }
+
+    def get_team_roles(self, strategy: BaseStrategy):
+        preferred_roles = self.get_preferred_roles(strategy)
+        return [preferred_roles[t] for t in (HockeyistType.VERSATILE, HockeyistType.FORWARD, HockeyistType.DEFENCEMAN)]
+
+    def get_role_cost(self, strategy: BaseStrategy, hockeyist, role):
+        """
+        Playing a role other than the preferred one of the hockeyist's type costs more than any distance on the rink
+        """
+        cost = super().get_role_cost(strategy, hockeyist, role)
+
+        if self.get_preferred_roles(strategy).get(hockeyist.type) != role:
+            cost += strategy.game.world_width + strategy.game.world_height
+
+        return cost
 
     @property
     def strategies(self):
         return [
             BaseStrategy,
             DefenceStrategy,
-            ForwardStrategy,
+            self.forward_strategy,
             NoGoaliesStrategy,
             DefencemanKickerStrategy
         ]
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+This module provides an on-disk cache of the tables precomputed from Game: action_outcomes.ActionOutcomes and
+shot_field.ShotField.
+
+Tables are stored as one .npy file each, which are memory-mapped when loaded, under
+
+    <directory>/v<CACHE_VERSION>/<CACHE_NAME>-<key>/<table name>.npy
+
+where key is a hash of the GAME_FIELDS and CACHE_PARAMETERS of the table class. Bump CACHE_VERSION whenever the way
+any tables are built changes. Table classes derive from PrecomputedTables, which provides of(game, tables), attaching
+the tables to the game and building them if tables is None, and get_tables() of the attached instance.
+
+Runner calls prepare as soon as GAME_CONTEXT is read: cached tables are attached right away, missing ones are built
+and saved by a background thread. A strategy asking for tables the thread is building waits for them, because the of
+method of the table classes holds a lock while building. Tables are written to a temporary directory which is then
+renamed, so concurrent bots never read partial files.
+"""
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+from model.Game import Game
+
+
+__all__ = ['PrecomputedTables', 'TableCache', 'CACHE_VERSION', 'DEFAULT_DIRECTORY']
+
+
+CACHE_VERSION = 1
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.table_cache')
+
+
+def get_table_classes():
+    from action_outcomes import ActionOutcomes
+    from shot_field import ShotField
+
+    return [ActionOutcomes, ShotField]
+
+
+class PrecomputedTables:
+    """
+    Base of the table classes. A subclass sets CACHE_NAME, which is also the attribute of Game its instance is
+    attached as, GAME_FIELDS and CACHE_PARAMETERS, the values the tables depend on, and TABLE_NAMES. Its __init__
+    takes the game and tables keyword, and passes the tables it is given or builds to set_tables.
+    """
+    CACHE_NAME = None
+    GAME_FIELDS = ()
+    CACHE_PARAMETERS = ()
+    TABLE_NAMES = ()
+
+    def __init_subclass__(cls, **keywords):
+        super().__init_subclass__(**keywords)
+        cls._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, game: Game, tables=None):
+        """
+        Safe to call from several threads: the first one builds or attaches the tables, the others wait for it.
+
+        :param tables: tables to use instead of building them, if the game has none attached yet
+        :return: the instance of the game, attached to it as the game attribute named CACHE_NAME
+        """
+        instance = getattr(game, cls.CACHE_NAME, None)
+
+        if instance is None:
+            with cls._lock:
+                instance = getattr(game, cls.CACHE_NAME, None)
+
+                if instance is None:
+                    instance = cls(game, tables=tables)
+                    setattr(game, cls.CACHE_NAME, instance)
+
+        return instance
+
+    def set_tables(self, tables):
+        """
+        Makes the tables read-only and sets them as the attributes named in TABLE_NAMES
+        """
+        for name in self.TABLE_NAMES:
+            table = tables[name]
+            table.setflags(write=False)
+            setattr(self, name, table)
+
+    def get_tables(self):
+        return {name: getattr(self, name) for name in self.TABLE_NAMES}
+
+
+class TableCache:
+    def __init__(self, directory=DEFAULT_DIRECTORY):
+        self.directory = os.path.join(directory, 'v%d' % CACHE_VERSION)
+        self.builders = []
+
+    @staticmethod
+    def get_key(game: Game, table_class):
+        values = [repr(getattr(game, name)) for name in table_class.GAME_FIELDS]
+        values += [repr(parameter) for parameter in table_class.CACHE_PARAMETERS]
+
+        return hashlib.sha1('\n'.join(values).encode()).hexdigest()[:16]
+
+    def get_path(self, game: Game, table_class):
+        return os.path.join(self.directory, '%s-%s' % (table_class.CACHE_NAME, self.get_key(game, table_class)))
+
+    def load(self, game: Game, table_class):
+        """
+        :return: the cached tables memory-mapped read-only, by name, None if they are missing or can't be read
+        """
+        path = self.get_path(game, table_class)
+
+        try:
+            return {name: np.asarray(np.load(os.path.join(path, name + '.npy'), mmap_mode='r'))
+                    for name in table_class.TABLE_NAMES}
+        except (OSError, ValueError):
+            return None
+
+    def save(self, game: Game, table_class, tables):
+        path = self.get_path(game, table_class)
+
+        if os.path.isdir(path):
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        temporary_path = tempfile.mkdtemp(prefix='.%s-' % table_class.CACHE_NAME, dir=self.directory)
+
+        try:
+            for name in table_class.TABLE_NAMES:
+                np.save(os.path.join(temporary_path, name + '.npy'), tables[name])
+
+            os.rename(temporary_path, path)
+        except OSError:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+            if not os.path.isdir(path):
+                raise
+
+    def prepare(self, game: Game, table_classes=None):
+        """
+        Attaches the cached tables of table_classes to the game, starts a background thread building and saving the
+        missing ones
+        :param table_classes: all the known table classes if None
+        :return: the table classes whose tables were loaded from the cache
+        """
+        loaded = []
+        missing = []
+
+        for table_class in (table_classes if table_classes is not None else get_table_classes()):
+            tables = self.load(game, table_class)
+
+            if tables is None:
+                missing.append(table_class)
+            else:
+                table_class.of(game, tables)
+                loaded.append(table_class)
+
+        if missing:
+            builder = threading.Thread(target=self.build, args=(game, missing), name='table-cache-builder', daemon=True)
+            builder.start()
+            self.builders.append(builder)
+
+        return loaded
+
+    def build(self, game: Game, table_classes):
+        for table_class in table_classes:
+            try:
+                self.save(game, table_class, table_class.of(game).get_tables())
+            except OSError as error:
+                print('could not cache %s tables: %s' % (table_class.CACHE_NAME, error), file=sys.stderr)
+
+    def wait(self):
+        """
+        Waits until the background builds are finished
+        """
+        for builder in self.builders:
+            builder.join()
+
+        self.builders = []
@@ -0,0 +1,95 @@
+"""
+This module provides classes for assigning roles to the hockeyists of the team once per tick.
+
+The factory lists one role per hockeyist, repeating roles as needed, and the cost of every hockeyist in every role.
+TeamPlan finds the assignment with the least total cost by the Hungarian algorithm, O(n^3) for n hockeyists.
+
+The plan of the tick is attached to the world index as index.team_plan, so the first teammate to move builds it and
+the others only look their role up.
+"""
+from model.Hockeyist import Hockeyist
+
+
+__all__ = ['Role', 'TeamPlan', 'solve_assignment']
+
+
+class Role:
+    FORWARD = 0
+    DEFENCE = 1
+    KICKER = 2
+    INTERCEPT = 3
+
+
+def solve_assignment(costs):
+    """
+    :param costs: square matrix, costs[i][j] being the cost of assigning row i to column j
+    :return: list of the columns assigned to the rows
+    """
+    n = len(costs)
+    inf = float('inf')
+
+    row_potentials = [0.0] * (n + 1)
+    column_potentials = [0.0] * (n + 1)
+    column_rows = [0] * (n + 1)
+    previous_columns = [0] * (n + 1)
+
+    for row in range(1, n + 1):
+        column_rows[0] = row
+        column = 0
+        min_slacks = [inf] * (n + 1)
+        used = [False] * (n + 1)
+
+        while column_rows[column] != 0:
+            used[column] = True
+            current_row = column_rows[column]
+            delta = inf
+            next_column = 0
+
+            for j in range(1, n + 1):
+                if not used[j]:
+                    slack = costs[current_row - 1][j - 1] - row_potentials[current_row] - column_potentials[j]
+
+                    if slack < min_slacks[j]:
+                        min_slacks[j] = slack
+                        previous_columns[j] = column
+
+                    if min_slacks[j] < delta:
+                        delta = min_slacks[j]
+                        next_column = j
+
+            for j in range(n + 1):
+                if used[j]:
+                    row_potentials[column_rows[j]] += delta
+                    column_potentials[j] -= delta
+                else:
+                    min_slacks[j] -= delta
+
+            column = next_column
+
+        while column:
+            previous_column = previous_columns[column]
+            column_rows[column] = column_rows[previous_column]
+            column = previous_column
+
+    columns = [0] * n
+
+    for column in range(1, n + 1):
+        columns[column_rows[column] - 1] = column - 1
+
+    return columns
+
+
+class TeamPlan:
+    def __init__(self, hockeyists, roles, costs):
+        """
+        :param hockeyists: hockeyists to plan for
+        :param roles: one role per hockeyist
+        :param costs: costs[i][j] is the cost of hockeyists[i] playing roles[j]
+        """
+        self.roles = {}
+
+        for hockeyist, column in zip(hockeyists, solve_assignment(costs)):
+            self.roles[hockeyist.id] = roles[column]
+
+    def get_role(self, hockeyist: Hockeyist):
+        return self.roles[hockeyist.id]
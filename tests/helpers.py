@@ -0,0 +1,142 @@
+"""
+This module provides model factories and an in-memory socket for the tests and the benchmarks.
+"""
+import inspect
+import os
+import random
+import sys
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIRECTORY)
+
+from RemoteProcessClient import RemoteProcessClient
+from local_game_server import GAME_VALUES
+from model.Game import Game
+from model.Hockeyist import Hockeyist
+from model.HockeyistState import HockeyistState
+from model.HockeyistType import HockeyistType
+from model.Player import Player
+from model.PlayerContext import PlayerContext
+from model.Puck import Puck
+from model.World import World
+
+
+__all__ = ['REPO_DIRECTORY', 'GAME_VALUES', 'make_game', 'make_hockeyist', 'make_players', 'make_world', 'make_player_context',
+           'BufferSocket', 'make_client', 'encode_session']
+
+
+assert tuple(GAME_VALUES) == tuple(inspect.signature(Game.__init__).parameters)[1:]
+
+
+def make_game(**values):
+    return Game(**dict(GAME_VALUES, **values))
+
+
+def make_hockeyist(id=1, player_id=1, teammate_index=0, x=300.0, y=400.0, speed_x=0.0, speed_y=0.0, angle=0.0,
+                   teammate=True, type=HockeyistType.VERSATILE, stamina=2000.0, state=HockeyistState.ACTIVE,
+                   swing_ticks=0, last_action=None, last_action_tick=None, strength=100, endurance=100,
+                   dexterity=100, agility=100):
+    return Hockeyist(id, player_id, teammate_index, 85.0, 30.0, x, y, speed_x, speed_y, angle, 0.0, teammate, type,
+                     strength, endurance, dexterity, agility, stamina, state, teammate_index, 0, 0, swing_ticks,
+                     last_action, last_action_tick)
+
+
+def make_players():
+    return [Player(1, True, 'me', 0, False, 370.0, 10.0, 570.0, 65.0, 65.0, 10.0, False, False),
+            Player(2, False, 'opponent', 0, False, 370.0, 1135.0, 570.0, 1190.0, 1135.0, 1190.0, False, False)]
+
+
+def make_world(tick=0, team_size=2, seed=None, puck_owner=None):
+    """
+    :param puck_owner: id of the hockeyist owning the puck, the puck is free if None
+    :return: world with a goalie and team_size random hockeyists in each team, my hockeyists have ids 1..
+    """
+    rnd = random.Random(tick if seed is None else seed)
+    hockeyists = []
+
+    for player_id, teammate in ((1, True), (2, False)):
+        goalie_x = 95.0 if teammate else 1105.0
+        hockeyists.append(make_hockeyist(id=len(hockeyists) + 1, player_id=player_id, x=goalie_x, y=470.0,
+                                         teammate=teammate, type=HockeyistType.GOALIE))
+
+        for index in range(team_size):
+            hockeyists.append(make_hockeyist(
+                id=len(hockeyists) + 1, player_id=player_id, teammate_index=index, x=rnd.uniform(150, 1050),
+                y=rnd.uniform(200, 720), speed_x=rnd.uniform(-5, 5), speed_y=rnd.uniform(-5, 5),
+                angle=rnd.uniform(-3, 3), teammate=teammate, type=HockeyistType.VERSATILE,
+                stamina=rnd.uniform(0, 2000), last_action_tick=None if index % 2 else max(tick - 3, 0)))
+
+    owner = next((h for h in hockeyists if h.id == puck_owner), None)
+    puck = Puck(99, 1.0, 20.0, rnd.uniform(150, 1050), rnd.uniform(200, 720), rnd.uniform(-10, 10),
+                rnd.uniform(-10, 10), -1 if owner is None else owner.id, -1 if owner is None else owner.player_id)
+
+    if owner is not None:
+        puck.x, puck.y, puck.speed_x, puck.speed_y = owner.x + 55.0, owner.y, owner.speed_x, owner.speed_y
+
+    return World(tick, 6000, 1200.0, 800.0, make_players(), hockeyists, puck)
+
+
+def make_player_context(world):
+    return PlayerContext([h for h in world.hockeyists if h.teammate and h.type != HockeyistType.GOALIE], world)
+
+
+class BufferSocket:
+    """
+    Socket reading from bytes, in chunks of at most chunk_size bytes, and collecting what is sent
+    """
+
+    def __init__(self, data=b'', chunk_size=None):
+        self.data = bytes(data)
+        self.position = 0
+        self.chunk_size = chunk_size
+        self.sent = bytearray()
+        self.sendall_calls = 0
+
+    def recv_into(self, buffer, byte_count=0):
+        byte_count = min(byte_count or len(buffer), len(self.data) - self.position)
+
+        if self.chunk_size is not None:
+            byte_count = min(byte_count, self.chunk_size)
+
+        buffer[:byte_count] = self.data[self.position:self.position + byte_count]
+        self.position += byte_count
+        return byte_count
+
+    def sendall(self, data):
+        self.sent += data
+        self.sendall_calls += 1
+
+    def close(self):
+        pass
+
+
+def make_client(data=b'', reuse_objects=False, chunk_size=None):
+    """
+    :return: RemoteProcessClient talking to a BufferSocket instead of the server
+    """
+    client = RemoteProcessClient.__new__(RemoteProcessClient)
+    client.socket = BufferSocket(data, chunk_size)
+    client.cells = None
+    client.cell_visibilities = None
+    client._init_buffers()
+    client._init_pools(reuse_objects)
+    return client
+
+
+def encode_session(team_size=2, tick_count=50, game=None):
+    """
+    :return: the bytes the server sends in a game of tick_count ticks, as read by Runner
+    """
+    client = make_client()
+    client.write_enum(RemoteProcessClient.MessageType.TEAM_SIZE)
+    client.write_int(team_size)
+    client.write_enum(RemoteProcessClient.MessageType.GAME_CONTEXT)
+    client.write_game(game or make_game())
+
+    for tick in range(tick_count):
+        client.write_enum(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+        client.write_player_context(make_player_context(make_world(tick, team_size)))
+
+    client.write_enum(RemoteProcessClient.MessageType.GAME_OVER)
+    client.flush()
+    return bytes(client.socket.sent)
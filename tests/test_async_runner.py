@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from helpers import REPO_DIRECTORY
+
+from local_game_server import LocalGameServer, script_game
+from test_local_game_server import get_free_port
+
+
+def play(script, *options):
+    team_size, game, player_contexts = script_game(team_size=3, tick_count=300, seed=7)
+    report = LocalGameServer(game, team_size, player_contexts, get_free_port()).run(
+        [sys.executable, os.path.join(REPO_DIRECTORY, script)] + list(options))
+
+    assert report.missed_tick is None
+    return [[vars(move) for move in moves] for moves in report.moves]
+
+
+@pytest.mark.parametrize('options', [(), ('--reuse-objects',)])
+def test_async_runner_sends_the_same_moves(options):
+    moves = play('AsyncRunner.py', *options)
+
+    assert len(moves) == 300
+    assert moves == play('Runner.py', *options)
+
+
+@pytest.mark.parametrize('option', [['--record', 'match.bin'], ['--replay', 'match.bin'], ['--tick-deadline-ms', '5'],
+                                    ['--gc-control'], ['--gc-report'], ['--table-cache'], ['--tick-cache-stats']])
+def test_async_runner_rejects_unsupported_options(option):
+    result = subprocess.run([sys.executable, os.path.join(REPO_DIRECTORY, 'AsyncRunner.py')] + option,
+                            capture_output=True, text=True, timeout=30)
+
+    assert result.returncode != 0
+    assert option[0] in result.stderr
@@ -0,0 +1,81 @@
+import pytest
+
+from helpers import make_game, make_hockeyist, make_world
+
+np = pytest.importorskip('numpy', exc_type=ImportError)
+
+from forward_simulator import ForwardSimulator
+from puck_trajectory import PuckTrajectory
+
+
+def start(simulator, count, puck_owner=None, puck=(900.0, 250.0, 12.0, -9.0)):
+    world = make_world(7, 2, puck_owner=puck_owner)
+    hockeyist = world.hockeyists[1]
+
+    if puck_owner is None:
+        world.puck.x, world.puck.y, world.puck.speed_x, world.puck.speed_y = puck
+
+    return simulator.start(hockeyist, world.puck, count), world
+
+
+def test_batch_matches_single_rollouts():
+    simulator = ForwardSimulator(make_game())
+    rnd = np.random.default_rng(3)
+    speed_ups = rnd.uniform(-1.2, 1.2, (16, 40))
+    turns = rnd.uniform(-0.1, 0.1, (16, 40))
+
+    for puck_owner in (None, 2):
+        batch = simulator.simulate(start(simulator, 16, puck_owner)[0], speed_ups, turns)
+
+        for future in range(16):
+            single = simulator.simulate(start(simulator, 1, puck_owner)[0], speed_ups[future:future + 1],
+                                        turns[future:future + 1])
+
+            for name in single.FIELDS + ('own_puck',):
+                assert getattr(single, name)[0] == getattr(batch, name)[future], name
+
+
+def test_free_puck_follows_puck_trajectory():
+    game = make_game()
+    simulator = ForwardSimulator(game)
+    state, world = start(simulator, 3)
+    trajectory = PuckTrajectory(world, game, tick_count=80)
+
+    assert trajectory.get_net_crossing(world.players[1]) is None
+
+    for tick in range(1, 81):
+        simulator.step(state, 1.0, 0.05)
+        position, speed = trajectory.get_position(tick), trajectory.get_speed(tick)
+
+        assert np.allclose(state.puck_x, position.x) and np.allclose(state.puck_y, position.y)
+        assert np.allclose(state.puck_speed_x, speed.x) and np.allclose(state.puck_speed_y, speed.y)
+
+
+def test_owned_puck_is_carried_ahead_of_the_hockeyist():
+    game = make_game()
+    simulator = ForwardSimulator(game)
+    state, _ = start(simulator, 4, puck_owner=2)
+    speed_ups = np.array([1.0, 0.5, 0.0, -1.0])
+    turns = np.array([0.05, -0.05, 0.0, 0.02])
+
+    assert state.own_puck.all()
+
+    for _ in range(25):
+        simulator.step(state, speed_ups, turns)
+
+        assert np.allclose(state.puck_x, state.x + game.puck_binding_range * np.cos(state.angle))
+        assert np.allclose(state.puck_y, state.y + game.puck_binding_range * np.sin(state.angle))
+        assert (state.puck_speed_x == state.speed_x).all() and (state.puck_speed_y == state.speed_y).all()
+
+
+def test_speed_is_limited_and_hockeyist_stays_in_the_rink():
+    game = make_game()
+    simulator = ForwardSimulator(game)
+    state = simulator.start(make_hockeyist(x=1050.0, y=700.0, speed_x=14.0, speed_y=10.0, angle=0.5),
+                            make_world().puck, 2)
+
+    simulator.simulate(state, np.ones((2, 60)), np.array([[0.0], [0.03]]))
+
+    assert (np.hypot(state.speed_x, state.speed_y) <= game.hockeyist_max_speed + 1e-9).all()
+    assert ((state.x >= game.rink_left + state.radius) & (state.x <= game.rink_right - state.radius)).all()
+    assert ((state.y >= game.rink_top + state.radius) & (state.y <= game.rink_bottom - state.radius)).all()
@@ -0,0 +1,91 @@
+import gc
+
+import pytest
+
+from helpers import make_client, make_player_context, make_world
+
+import protocol_codec
+from RemoteProcessClient import RemoteProcessClient
+
+from gc_controller import GcController
+
+
+@pytest.fixture
+def restore_gc():
+    enabled = gc.isenabled()
+    yield
+    gc.unfreeze()
+
+    if enabled:
+        gc.enable()
+
+
+def play_tick(controller, tick, collect_in_tick=False):
+    controller.start_tick()
+
+    if collect_in_tick:
+        gc.collect(0)
+
+    controller.finish_tick(make_world(tick))
+
+
+def test_report_only_controller_leaves_collection_to_gc(restore_gc):
+    controller = GcController(control=False)
+    controller.start()
+
+    try:
+        assert gc.isenabled()
+
+        play_tick(controller, 0, collect_in_tick=True)
+        play_tick(controller, 1)
+        gc.collect(1)
+    finally:
+        controller.stop()
+
+    assert gc.isenabled()
+    assert controller.critical_path_collections == 1 and controller.critical_path_max_time > 0
+    assert controller.off_path_collections == [0, 1, 0]
+    assert 'left to gc' in controller.get_report()
+
+
+def test_controller_collects_between_ticks(restore_gc):
+    controller = GcController(full_collection_period=3)
+    controller.start()
+
+    try:
+        assert not gc.isenabled()
+
+        for tick in range(7):
+            play_tick(controller, tick)
+    finally:
+        controller.stop()
+
+    assert controller.critical_path_collections == 0
+    assert controller.off_path_collections[2] == 3
+    assert 'collections on the critical path: 0' in controller.get_report()
+
+
+def test_collection_while_decoding_is_on_the_critical_path(restore_gc, monkeypatch):
+    out = bytearray()
+    out.append(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+    protocol_codec.write_player_context(out, make_player_context(make_world(5)))
+    client = make_client(bytes(out))
+    read_player_context = client.read_player_context
+
+    def read_player_context_collecting():
+        gc.collect(0)
+        return read_player_context()
+
+    monkeypatch.setattr(client, 'read_player_context', read_player_context_collecting)
+    controller = client.gc_controller = GcController(control=False)
+    controller.start()
+
+    try:
+        gc.collect(0)
+        world = client.read_player_context_message().world
+        controller.finish_tick(world)
+    finally:
+        controller.stop()
+
+    assert controller.critical_path_collections == 1
+    assert controller.off_path_collections == [1, 0, 0]
@@ -0,0 +1,102 @@
+from collections import Counter, deque
+from types import SimpleNamespace
+
+import pytest
+
+from helpers import make_hockeyist
+
+import latency_watchdog
+from model.ActionType import ActionType
+from model.Move import Move
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+
+class TimedStrategy:
+    """
+    Strategy whose moves take the durations given by the test, on the fake clock
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.duration = 0.0002
+
+    def move(self, me, world, game, move):
+        self.clock.now += self.duration
+        move.speed_up, move.turn, move.action = 1.0, 0.1, ActionType.STRIKE
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(latency_watchdog, 'time', SimpleNamespace(perf_counter=clock.perf_counter))
+    monkeypatch.setattr(latency_watchdog, 'expected_move_time', 0.0)
+    monkeypatch.setattr(latency_watchdog, 'recent_move_times', deque(maxlen=latency_watchdog.move_time_window))
+    monkeypatch.setattr(latency_watchdog, 'last_moves', {})
+    monkeypatch.setattr(latency_watchdog, 'overruns', Counter())
+    monkeypatch.setattr(latency_watchdog, 'fallbacks', Counter())
+    monkeypatch.setattr(latency_watchdog, 'deadline', 0.003)
+    return clock
+
+
+def play(clock, strategies, durations):
+    """
+    Plays a tick per item of durations, which holds the move duration of every strategy in the tick
+    :return: the moves of every tick
+    """
+    hockeyists = [make_hockeyist(id=index + 2, teammate_index=index) for index in range(len(strategies))]
+    ticks = []
+
+    for tick_durations in durations:
+        clock.now += 0.01
+        latency_watchdog.start_tick()
+        moves = []
+
+        for strategy, hockeyist, duration in zip(strategies, hockeyists, tick_durations):
+            strategy.duration = duration
+            move = Move()
+            latency_watchdog.compute_move(strategy, hockeyist, None, None, move)
+            moves.append(move)
+
+        ticks.append(moves)
+
+    return ticks
+
+
+def test_one_slow_move_does_not_make_later_moves_fall_back(clock):
+    strategies = [TimedStrategy(clock), TimedStrategy(clock)]
+    durations = [(0.13, 0.13)] + [(0.0002, 0.0002)] * 100 + [(0.05, 0.0002)] + [(0.0002, 0.0002)] * 400
+
+    ticks = play(clock, strategies, durations)
+
+    assert sum(latency_watchdog.fallbacks.values()) == 2
+    assert [move.action for move in ticks[1]] == [ActionType.STRIKE, ActionType.STRIKE]
+    assert [move.action for move in ticks[101]] == [ActionType.STRIKE, ActionType.NONE]
+    assert all(move.action == ActionType.STRIKE for moves in ticks[102:] for move in moves)
+
+
+def test_first_strategy_of_a_tick_runs_even_if_strategies_are_too_slow(clock):
+    strategies = [TimedStrategy(clock), TimedStrategy(clock)]
+
+    ticks = play(clock, strategies, [(0.002, 0.002)] * 200)
+
+    assert latency_watchdog.expected_move_time == pytest.approx(0.0015)
+    assert all(moves[0].action == ActionType.STRIKE for moves in ticks)
+    assert all(moves[1].action == ActionType.NONE and moves[1].speed_up == 1.0 for moves in ticks[1:])
+
+
+def test_estimate_is_a_recent_percentile(clock):
+    strategy = TimedStrategy(clock)
+
+    play(clock, [strategy], [(0.0001,)] * 40 + [(0.0008,)] * 10)
+    assert latency_watchdog.expected_move_time == pytest.approx(0.0008)
+
+    play(clock, [strategy], [(0.0001,)] * 46)
+    assert latency_watchdog.expected_move_time == pytest.approx(0.0001)
+
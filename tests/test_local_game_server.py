@@ -0,0 +1,123 @@
+import socket
+import struct
+import sys
+import threading
+import time
+
+from helpers import REPO_DIRECTORY, make_client
+
+import protocol_codec
+from RemoteProcessClient import RemoteProcessClient
+from local_game_server import LocalGameServer, script_game
+from model.HockeyistType import HockeyistType
+from model.Move import Move
+
+
+def get_free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def test_scripted_worlds_round_trip():
+    team_size, game, player_contexts = script_game(team_size=3, tick_count=400, seed=5)
+    owned_ticks = 0
+
+    for tick, player_context in enumerate(player_contexts):
+        world = player_context.world
+        out = bytearray()
+        protocol_codec.write_player_context(out, player_context)
+        decoded = protocol_codec.read_player_context(make_client(bytes(out)))
+
+        assert world.tick == tick
+        assert [h.teammate_index for h in decoded.hockeyists] == list(range(team_size))
+        assert len([h for h in world.hockeyists if h.type == HockeyistType.GOALIE]) == 2
+        assert len(world.hockeyists) == 2 * team_size + 2
+        assert game.rink_left <= world.puck.x <= game.rink_right
+        assert game.rink_top <= world.puck.y <= game.rink_bottom
+        assert vars(decoded.world.puck) == vars(world.puck)
+
+        owned_ticks += world.puck.owner_hockeyist_id != -1
+
+    assert owned_ticks == 200
+
+
+class SlowBot(threading.Thread):
+    """
+    Bot answering every tick with a MOVE message sent in chunks delay seconds apart
+    """
+
+    def __init__(self, port, chunk_count, delay):
+        super().__init__(daemon=True)
+        self.port = port
+        self.chunk_count = chunk_count
+        self.delay = delay
+
+    def run(self):
+        for _ in range(100):
+            try:
+                client = RemoteProcessClient('127.0.0.1', self.port)
+                break
+            except OSError:
+                time.sleep(0.05)
+        else:
+            return
+
+        try:
+            client.write_token_message('0000000000000000')
+            team_size = client.read_team_size_message()
+            client.write_protocol_version_message()
+            client.read_game_context_message()
+
+            while client.read_player_context_message() is not None:
+                out = bytearray()
+                out += struct.pack('<b', RemoteProcessClient.MessageType.MOVE)
+                protocol_codec.write_moves(out, [Move() for _ in range(team_size)])
+                chunk_size = -(-len(out) // self.chunk_count)
+
+                for offset in range(0, len(out), chunk_size):
+                    client.socket.sendall(bytes(out[offset:offset + chunk_size]))
+                    time.sleep(self.delay)
+        except OSError:
+            pass
+        finally:
+            client.close()
+
+
+def test_deadline_covers_the_whole_tick():
+    port = get_free_port()
+    team_size, game, player_contexts = script_game(tick_count=5)
+    SlowBot(port, chunk_count=6, delay=0.02).start()
+
+    report = LocalGameServer(game, team_size, player_contexts, port, deadline=0.06).run()
+
+    assert report.latencies == []
+    assert report.missed_tick == 0
+
+
+def test_answers_within_the_deadline_are_kept():
+    port = get_free_port()
+    team_size, game, player_contexts = script_game(tick_count=5)
+    SlowBot(port, chunk_count=2, delay=0.0).start()
+
+    report = LocalGameServer(game, team_size, player_contexts, port, deadline=1.0).run()
+
+    assert report.missed_tick is None
+    assert len(report.moves) == 5
+    assert all(len(moves) == team_size for moves in report.moves)
+
+
+def test_bot_still_running_after_the_game_is_killed():
+    port = get_free_port()
+    team_size, game, player_contexts = script_game(tick_count=3)
+    bot_script = ('import sys, time; sys.path.insert(0, %r); from RemoteProcessClient import RemoteProcessClient; '
+                  'client = RemoteProcessClient("127.0.0.1", int(sys.argv[1])); client.write_token_message("0"); '
+                  'client.read_team_size_message(); client.write_protocol_version_message(); '
+                  'client.read_game_context_message(); time.sleep(60)' % REPO_DIRECTORY)
+
+    started = time.perf_counter()
+    report = LocalGameServer(game, team_size, player_contexts, port, deadline=0.05, handshake_timeout=0.5).run(
+        [sys.executable, '-c', bot_script])
+
+    assert report.missed_tick == 0
+    assert time.perf_counter() - started < 10
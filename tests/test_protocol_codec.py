@@ -0,0 +1,218 @@
+import struct
+
+import pytest
+
+from helpers import make_client, make_game, make_hockeyist, make_player_context, make_players, make_world
+
+import protocol_codec
+from model.ActionType import ActionType
+from model.Move import Move
+
+
+def pack(format_string, *values):
+    return struct.pack('<' + format_string, *values)
+
+
+def encode_string(value):
+    if value is None:
+        return pack('i', -1)
+
+    data = value.encode()
+    return pack('i', len(data)) + data
+
+
+def encode_enum(value):
+    return pack('b', -1 if value is None else value)
+
+
+def encode_game(game):
+    """
+    Field by field encoding of the original RemoteProcessClient, the reference for the compiled writers
+    """
+    if game is None:
+        return b'\x00'
+
+    formats = 'qidddddddddiiiiiidddiddddddiddddddddddddddddddddddddddiiiiiiiiiiiiiidd'
+    values = [getattr(game, name) for name in vars(game)]
+
+    return b'\x01' + b''.join(pack(f, value) for f, value in zip(formats, values))
+
+
+def encode_hockeyist(h):
+    if h is None:
+        return b'\x00'
+
+    return (b'\x01' + pack('qqidddddddd?', h.id, h.player_id, h.teammate_index, h.mass, h.radius, h.x, h.y,
+                           h.speed_x, h.speed_y, h.angle, h.angular_speed, h.teammate) +
+            encode_enum(h.type) + pack('iiiid', h.strength, h.endurance, h.dexterity, h.agility, h.stamina) +
+            encode_enum(h.state) + pack('iiii', h.original_position_index, h.remaining_knockdown_ticks,
+                                        h.remaining_cooldown_ticks, h.swing_ticks) +
+            encode_enum(h.last_action) +
+            (b'\x00' if h.last_action_tick is None else pack('?i', True, h.last_action_tick)))
+
+
+def encode_player(p):
+    if p is None:
+        return b'\x00'
+
+    return (b'\x01' + pack('q?', p.id, p.me) + encode_string(p.name) +
+            pack('i?dddddd??', p.goal_count, p.strategy_crashed, p.net_top, p.net_left, p.net_bottom, p.net_right,
+                 p.net_front, p.net_back, p.just_scored_goal, p.just_missed_goal))
+
+
+def encode_puck(p):
+    if p is None:
+        return b'\x00'
+
+    return b'\x01' + pack('qddddddqq', p.id, p.mass, p.radius, p.x, p.y, p.speed_x, p.speed_y,
+                          p.owner_hockeyist_id, p.owner_player_id)
+
+
+def encode_list(values, encode_item):
+    if values is None:
+        return pack('i', -1)
+
+    return pack('i', len(values)) + b''.join(encode_item(value) for value in values)
+
+
+def encode_world(w):
+    if w is None:
+        return b'\x00'
+
+    return (b'\x01' + pack('iidd', w.tick, w.tick_count, w.width, w.height) + encode_list(w.players, encode_player) +
+            encode_list(w.hockeyists, encode_hockeyist) + encode_puck(w.puck))
+
+
+def encode_player_context(c):
+    if c is None:
+        return b'\x00'
+
+    return b'\x01' + encode_list(c.hockeyists, encode_hockeyist) + encode_world(c.world)
+
+
+def assert_same(actual, expected):
+    if expected is None or isinstance(expected, (bool, int, float, str)):
+        assert actual == expected
+    elif isinstance(expected, list):
+        assert isinstance(actual, list) and len(actual) == len(expected)
+
+        for actual_item, expected_item in zip(actual, expected):
+            assert_same(actual_item, expected_item)
+    else:
+        assert type(actual) is type(expected)
+        assert vars(actual).keys() == vars(expected).keys()
+
+        for name, value in vars(expected).items():
+            assert_same(getattr(actual, name), value)
+
+
+def write(writer, value):
+    out = bytearray()
+    writer(out, value)
+    return bytes(out)
+
+
+def unusual_hockeyist():
+    return make_hockeyist(id=2 ** 40, player_id=-7, teammate=False, type=None, state=None, last_action=None,
+                          last_action_tick=None, stamina=-0.0)
+
+
+WORLDS = [make_world(5, 2), make_world(17, 3, puck_owner=2), make_world(0, 5)]
+
+CASES = [
+    ('game', make_game(), encode_game),
+    ('game', None, encode_game),
+    ('hockeyist', make_hockeyist(last_action=ActionType.SWING, last_action_tick=42), encode_hockeyist),
+    ('hockeyist', unusual_hockeyist(), encode_hockeyist),
+    ('hockeyist', None, encode_hockeyist),
+    ('player', make_players()[1], encode_player),
+    ('player', None, encode_player),
+    ('puck', WORLDS[1].puck, encode_puck),
+    ('puck', None, encode_puck),
+    ('world', WORLDS[0], encode_world),
+    ('world', WORLDS[2], encode_world),
+    ('world', None, encode_world),
+    ('player_context', make_player_context(WORLDS[1]), encode_player_context),
+    ('player_context', None, encode_player_context),
+]
+
+
+@pytest.mark.parametrize('kind, value, encode', CASES)
+def test_writer_matches_baseline_layout(kind, value, encode):
+    assert write(getattr(protocol_codec, 'write_' + kind), value) == encode(value)
+
+
+@pytest.mark.parametrize('kind, value, encode', CASES)
+def test_round_trip(kind, value, encode):
+    data = encode(value)
+    client = make_client(data, chunk_size=7)
+
+    assert_same(getattr(protocol_codec, 'read_' + kind)(client), value)
+    assert client._read_offset == len(data)
+
+
+def test_player_with_none_and_unicode_name():
+    for name in (None, '', 'игрок'):
+        player = make_players()[0]
+        player.name = name
+        data = encode_player(player)
+
+        assert write(protocol_codec.write_player, player) == data
+        assert_same(protocol_codec.read_player(make_client(data)), player)
+
+
+def test_unknown_enum_values_are_decoded_as_none():
+    hockeyist = make_hockeyist(type=4, state=3, last_action=6)
+    data = bytearray(encode_hockeyist(hockeyist))
+    type_offset = 1 + struct.calcsize('<qqidddddddd?')
+    data[type_offset] = 100
+    data[type_offset + 1 + struct.calcsize('<iiiid')] = 0x80
+
+    decoded = protocol_codec.read_hockeyist(make_client(bytes(data)))
+
+    assert decoded.type is None
+    assert decoded.state is None
+    assert decoded.last_action == 6
+
+
+def test_none_lists():
+    world = make_world(3)
+    world.players = None
+    world.hockeyists = None
+    context = make_player_context(make_world(4))
+    context.hockeyists = None
+
+    for kind, value, encode in (('world', world, encode_world), ('player_context', context, encode_player_context)):
+        data = encode(value)
+
+        assert write(getattr(protocol_codec, 'write_' + kind), value) == data
+        assert_same(getattr(protocol_codec, 'read_' + kind)(make_client(data)), value)
+
+
+def test_pooled_reader_reuses_instances_by_id():
+    client = make_client(b''.join(encode_player_context(make_player_context(make_world(tick, 2)))
+                                  for tick in range(3)), reuse_objects=True)
+    contexts = [protocol_codec.read_pooled_player_context(client, client._pools) for _ in range(3)]
+
+    for context in contexts:
+        assert context.world.tick == 2
+        assert_same(context.world.puck, make_world(2, 2).puck)
+
+    assert contexts[0].world.hockeyists[3] is contexts[2].world.hockeyists[3]
+    assert contexts[0].world.puck is contexts[1].world.puck
+
+
+@pytest.mark.parametrize('action, extra', [(ActionType.STRIKE, b''), (None, b''),
+                                           (ActionType.PASS, pack('dd', 0.5, -0.25)),
+                                           (ActionType.SUBSTITUTE, pack('i', 2))])
+def test_move_round_trip(action, extra):
+    move = Move()
+    move.speed_up, move.turn, move.action = 0.75, -0.1, action
+    move.pass_power, move.pass_angle, move.teammate_index = 0.5, -0.25, 2
+
+    data = b'\x01' + pack('ddb', 0.75, -0.1, -1 if action is None else action) + extra
+    decoded = protocol_codec.read_move(make_client(data))
+
+    assert write(protocol_codec.write_move, move) == data
+    assert (decoded.speed_up, decoded.turn, decoded.action) == (0.75, -0.1, action)
+    assert write(protocol_codec.write_moves, None) == pack('i', -1)
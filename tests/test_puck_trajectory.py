@@ -0,0 +1,45 @@
+from helpers import make_game, make_players, make_world
+
+from puck_trajectory import PuckTrajectory
+
+
+def make_puck_world(x, y, speed_x, speed_y):
+    world = make_world(10, 2)
+    world.puck.x, world.puck.y, world.puck.speed_x, world.puck.speed_y = x, y, speed_x, speed_y
+    world.puck.owner_hockeyist_id = world.puck.owner_player_id = -1
+    return world
+
+
+def test_net_crossing_is_found_by_side_of_the_net():
+    game = make_game()
+    me, opponent = make_players()
+    opponent.net_front = game.rink_right + 0.5
+    trajectory = PuckTrajectory(make_puck_world(900.0, 470.0, 15.0, 0.0), game)
+
+    ticks, y = trajectory.get_net_crossing(opponent)
+
+    assert trajectory.get_net_crossing(me) is None
+    assert 14 < ticks < 17 and y == 470.0
+    assert trajectory.get_position(ticks + 5).x == game.rink_right
+
+
+def test_net_crossing_of_the_left_net():
+    game = make_game()
+    me, opponent = make_players()
+    me.net_front = game.rink_left - 0.5
+    trajectory = PuckTrajectory(make_puck_world(300.0, 420.0, -15.0, 2.0), game)
+
+    ticks, y = trajectory.get_net_crossing(me)
+
+    assert trajectory.get_net_crossing(opponent) is None
+    assert 420.0 < y < 470.0
+
+
+def test_puck_missing_the_net():
+    game = make_game()
+    me, opponent = make_players()
+    trajectory = PuckTrajectory(make_puck_world(900.0, 200.0, 15.0, 0.0), game)
+
+    assert trajectory.get_net_crossing(opponent) is None
+    assert trajectory.get_net_crossing(me) is None
+    assert max(trajectory.xs) <= game.rink_right and trajectory.speed_xs[-1] < 0
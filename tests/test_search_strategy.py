@@ -0,0 +1,127 @@
+import copy
+import time
+
+import pytest
+
+from helpers import make_game, make_world
+
+from model.Move import Move
+
+np = pytest.importorskip('numpy', exc_type=ImportError)
+
+from forward_simulator import ForwardSimulator
+from search_strategy import RolloutPool, SearchStrategy, SNAPSHOT, SNAPSHOT_FIELDS, score_candidates
+
+
+def score_one_candidate(pool):
+    snapshot = np.zeros(len(SNAPSHOT_FIELDS))
+    snapshot[[SNAPSHOT['key'], SNAPSHOT['x'], SNAPSHOT['y'], SNAPSHOT['radius'], SNAPSHOT['puck_radius']]] = \
+        1.0, 300.0, 400.0, 30.0, 20.0
+    snapshot[[SNAPSHOT['agility'], SNAPSHOT['stamina'], SNAPSHOT['puck_x'], SNAPSHOT['puck_y']]] = \
+        100.0, 2000.0, 500.0, 400.0
+    snapshot[[SNAPSHOT['target_x'], SNAPSHOT['target_y'], SNAPSHOT['reach_distance']]] = 500.0, 400.0, 400.0
+    pool.snapshots[0] = snapshot
+
+    (_, future), = pool.submit(0, 1.0, np.array([1.0]), np.array([0.0]), 10, 2)
+    return future.result(timeout=60)
+
+
+def test_pool_is_replaced_when_the_game_or_the_worker_count_changes():
+    game = make_game()
+
+    try:
+        pool = RolloutPool.of(game, 1)
+
+        assert RolloutPool.of(game, 1) is pool
+        assert score_one_candidate(pool) is not None
+
+        other_game_pool = RolloutPool.of(copy.copy(game), 1)
+
+        assert other_game_pool is not pool
+        with pytest.raises(RuntimeError):
+            pool.executor.submit(int)
+
+        assert score_one_candidate(other_game_pool) is not None
+
+        more_workers_pool = RolloutPool.of(other_game_pool.game, 2)
+
+        assert more_workers_pool is not other_game_pool and more_workers_pool.worker_count == 2
+        assert RolloutPool.of(other_game_pool.game, 2) is more_workers_pool
+    finally:
+        if RolloutPool._instance is not None:
+            RolloutPool._instance.close()
+
+    assert RolloutPool._instance is None
+
+
+@pytest.fixture
+def game():
+    game = make_game()
+    search(game, 0.0)
+
+    yield game
+
+    if RolloutPool._instance is not None:
+        RolloutPool._instance.close()
+
+
+def search(game, deadline, worker_count=0):
+    """
+    :return: the search strategy of the first hockeyist of mine in a world with a free puck
+    """
+    world = make_world(7, 2)
+    SearchStrategy.configure(deadline, worker_count)
+
+    try:
+        return SearchStrategy(world.hockeyists[1], world, game, Move(), None)
+    finally:
+        SearchStrategy.configure(0.010)
+
+
+@pytest.mark.parametrize('deadline', [0.0, -1.0])
+def test_fallback_is_kept_when_there_is_no_time(game, deadline):
+    strategy = search(game, deadline)
+    snapshot = strategy.get_snapshot()
+    max_turn = game.hockeyist_turn_angle_factor * strategy.me.agility / game.hockeyist_attribute_base_value
+    angle_to_target = strategy.get_angle_to(snapshot[SNAPSHOT['target_x']], snapshot[SNAPSHOT['target_y']])
+
+    assert strategy.rounds == 0
+    assert strategy.speed_up == 1.0
+    assert strategy.turn == max(-max_turn, min(max_turn, angle_to_target))
+
+
+@pytest.mark.parametrize('worker_count', [0, 2])
+def test_search_returns_by_the_deadline(game, monkeypatch, worker_count):
+    search(game, 0.05, worker_count)
+    monkeypatch.setattr(SearchStrategy, 'horizon', 100000)
+
+    started = time.perf_counter()
+    strategy = search(game, 0.02, worker_count)
+
+    assert time.perf_counter() - started < 0.02 + 0.02
+    assert strategy.rounds == 0
+
+    if worker_count:
+        started = time.perf_counter()
+
+        assert score_one_candidate(RolloutPool._instance) is not None
+        assert time.perf_counter() - started < 1.0
+
+
+def test_more_rounds_never_make_the_best_score_worse(game, monkeypatch):
+    fallback = search(game, 0.0)
+    fallback_score, = score_candidates(ForwardSimulator(game), fallback._snapshot, np.array([fallback.speed_up]),
+                                       np.array([fallback.turn]), fallback.horizon, fallback.commit_ticks)
+    best_scores = []
+    update_best = SearchStrategy.update_best
+
+    def recording_update_best(self, speed_ups, turns, scores):
+        update_best(self, speed_ups, turns, scores)
+        best_scores.append(self.best_score)
+
+    monkeypatch.setattr(SearchStrategy, 'update_best', recording_update_best)
+    search(game, 0.05)
+
+    assert len(best_scores) > 1
+    assert best_scores == sorted(best_scores)
+    assert best_scores[0] >= fallback_score
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from helpers import make_game, make_hockeyist, make_players
+
+from model.HockeyistType import HockeyistType
+from point import Point
+
+np = pytest.importorskip('numpy', exc_type=ImportError)
+
+from shot_field import ShotField
+
+
+def get_counts_by_full_compute(field, goalie_y, goalie_radius, puck_speed):
+    """
+    The counts as computed from the static tables for every query before ScoredCounts
+    """
+    game = field.game
+    retention = field.speed_retention
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        left_part = 1.0 - field.entry_distances * (1.0 - retention) / puck_speed
+        scored = left_part > 0
+
+        if goalie_y is not None:
+            reach = game.goalie_max_speed * np.log(left_part) / np.log(retention)
+            top = game.goal_net_top + goalie_radius
+            bottom = game.goal_net_top + game.goal_net_height - goalie_radius
+            goalie_ys = np.clip(goalie_y + np.clip(field.entry_crossing_ys - goalie_y, -reach, reach), top, bottom)
+            scored &= np.abs(field.entry_crossing_ys - goalie_ys) >= goalie_radius + field.PUCK_RADIUS
+
+    return np.bincount(field.entry_cells, weights=scored, minlength=int(np.prod(field.shape))).reshape(field.shape)
+
+
+@pytest.fixture(scope='module')
+def field():
+    return ShotField(make_game())
+
+
+def test_incremental_counts_match_the_full_compute(field):
+    rnd = random.Random(3)
+    goalie = make_hockeyist(type=HockeyistType.GOALIE, teammate=False)
+
+    for puck_speed in (6.0, 15.0, 24.0):
+        for _ in range(30):
+            goalie.y = rnd.uniform(395.0, 545.0)
+            goalie_y = None if rnd.random() < 0.1 else int(goalie.y / field.GOALIE_STEP + 0.5) * field.GOALIE_STEP
+            counts = field.get_scored_counts(None if goalie_y is None else goalie, puck_speed)
+
+            assert counts.dtype == np.uint8
+            assert np.array_equal(counts, get_counts_by_full_compute(field, goalie_y, goalie.radius, puck_speed))
+
+
+def test_least_recently_used_speeds_are_dropped(field):
+    field.scored_counts.clear()
+    goalie = make_hockeyist(y=470.0)
+
+    for puck_speed in (10.0, 11.0, 12.0, 13.0, 10.0, 14.0):
+        field.get_scored_counts(goalie, puck_speed)
+
+    assert list(field.scored_counts) == [12, 13, 10, 14]
+
+
+def test_chances_are_counts_over_samples(field):
+    opponent = make_players()[1]
+    goalie = make_hockeyist(y=470.0)
+    angle, chance = field.get_best_angle(opponent, goalie, 20.0, 1000.0, 420.0)
+
+    cell_counts = field.get_scored_counts(goalie, 20.0)[field.get_cell(1000.0, 420.0)]
+
+    assert chance == int(cell_counts.max()) / field.DEVIATION_SAMPLES > 0
+    assert field.get_chance(opponent, goalie, 20.0, 1000.0, 420.0, angle) == chance
+
+
+def test_best_position_is_the_best_cell_in_reach(field):
+    opponent = make_players()[1]
+    goalie = make_hockeyist(y=470.0)
+    position, angle, chance = field.get_best_position(opponent, goalie, 20.0, 1000.0, 420.0, 100.0)
+    counts = field.get_scored_counts(goalie, 20.0)
+    in_reach = np.hypot(field.xs[:, None] - 1000.0, field.ys[None, :] - 420.0) <= 100.0
+
+    assert position.get_distance_to(Point(1000.0, 420.0)) <= 100.0
+    assert chance == int(counts.max(axis=2)[in_reach].max()) / field.DEVIATION_SAMPLES > 0
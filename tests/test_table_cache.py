@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+from helpers import make_game
+
+np = pytest.importorskip('numpy', exc_type=ImportError)
+
+from action_outcomes import ActionOutcomes
+from shot_field import ShotField
+from table_cache import TableCache
+
+
+@pytest.mark.parametrize('table_class', [ActionOutcomes, ShotField])
+def test_concurrent_of_builds_the_tables_once(monkeypatch, table_class):
+    game = make_game()
+    builds = []
+    init = table_class.__init__
+    entered = threading.Event()
+
+    def slow_init(self, *arguments, **keywords):
+        builds.append(threading.current_thread().name)
+        entered.set()
+        threading.Event().wait(0.05)
+        init(self, *arguments, **keywords)
+
+    monkeypatch.setattr(table_class, '__init__', slow_init)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(table_class.of(game))) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    entered.wait(5)
+    results.append(table_class.of(game))
+
+    for thread in threads:
+        thread.join(5)
+
+    assert len(builds) == 1
+    assert len(results) == 5 and all(result is results[0] for result in results)
+
+
+def test_prepared_tables_are_shared_with_strategies(tmp_path):
+    game = make_game()
+    cache = TableCache(str(tmp_path))
+
+    assert cache.prepare(game) == []
+    outcomes, field = ActionOutcomes.of(game), ShotField.of(game)
+    cache.wait()
+
+    assert game.action_outcomes is outcomes and game.shot_field is field
+
+    warm_game = make_game()
+    assert cache.prepare(warm_game) == [ActionOutcomes, ShotField]
+
+    for name in ShotField.TABLE_NAMES:
+        assert np.array_equal(getattr(warm_game.shot_field, name), getattr(field, name))
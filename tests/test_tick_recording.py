@@ -0,0 +1,114 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+from helpers import REPO_DIRECTORY
+
+from local_game_server import LocalGameServer, script_game
+from test_local_game_server import get_free_port
+from test_protocol_codec import assert_same
+from tick_recording import ReplayClient
+
+TICK_COUNT = 60
+
+
+@pytest.fixture(scope='module')
+def recording(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('recording') / 'match.bin')
+    team_size, game, player_contexts = script_game(team_size=3, tick_count=TICK_COUNT, seed=11)
+    report = LocalGameServer(game, team_size, player_contexts, get_free_port()).run(
+        [sys.executable, os.path.join(REPO_DIRECTORY, 'Runner.py'), '--record', path])
+
+    assert report.missed_tick is None
+    return path
+
+
+def copy_recording(recording, tmp_path):
+    path = str(tmp_path / 'match.bin')
+    shutil.copyfile(recording, path)
+    shutil.copyfile(recording + '.index', path + '.index')
+    return path
+
+
+def truncate(path, byte_count):
+    with open(path, 'r+b') as recording_file:
+        recording_file.truncate(os.path.getsize(path) - byte_count)
+
+
+def read_ticks(client):
+    ticks = []
+
+    try:
+        player_context = client.read_player_context_message()
+
+        while player_context is not None:
+            ticks.append(player_context.world.tick)
+            player_context = client.read_player_context_message()
+    finally:
+        client.close()
+
+    return ticks
+
+
+def test_replayed_messages_match_the_recorded_ones(recording):
+    team_size, game, player_contexts = script_game(team_size=3, tick_count=TICK_COUNT, seed=11)
+    client = ReplayClient(recording)
+
+    try:
+        assert client.read_team_size_message() == team_size
+        assert_same(client.read_game_context_message(), game)
+
+        for player_context in player_contexts:
+            assert_same(client.read_player_context_message(), player_context)
+
+        assert client.read_player_context_message() is None
+    finally:
+        client.close()
+
+
+def test_seek_starts_at_the_first_context_of_the_tick(recording):
+    client = ReplayClient(recording, start_tick=37)
+    client.read_team_size_message()
+    client.read_game_context_message()
+
+    assert read_ticks(client) == list(range(37, TICK_COUNT))
+
+    client = ReplayClient(recording)
+    client.seek(TICK_COUNT)
+
+    assert read_ticks(client) == []
+
+
+def test_truncated_index_falls_back_to_scanning(recording, tmp_path, monkeypatch):
+    path = copy_recording(recording, tmp_path)
+    truncate(path + '.index', 5)
+    scans = []
+    scan_records = ReplayClient.scan_records
+
+    def counting_scan_records(self):
+        scans.append(path)
+        return scan_records(self)
+
+    monkeypatch.setattr(ReplayClient, 'scan_records', counting_scan_records)
+
+    assert read_ticks(ReplayClient(path)) == list(range(TICK_COUNT))
+    assert scans == [path]
+
+
+def test_truncated_data_drops_the_partial_last_record(recording, tmp_path):
+    path = copy_recording(recording, tmp_path)
+    truncate(path, 10)
+
+    assert read_ticks(ReplayClient(path)) == list(range(TICK_COUNT - 1))
+
+
+def test_file_without_the_magic_header_is_rejected(tmp_path):
+    path = str(tmp_path / 'match.bin')
+
+    with open(path, 'wb') as recording_file:
+        recording_file.write(b'not a tick recording')
+
+    with pytest.raises(ValueError):
+        ReplayClient(path)
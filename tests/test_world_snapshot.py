@@ -0,0 +1,67 @@
+import struct
+
+import pytest
+
+from helpers import make_client, make_player_context, make_world
+
+import protocol_codec
+from RemoteProcessClient import RemoteProcessClient
+
+np = pytest.importorskip('numpy', exc_type=ImportError)
+
+from world_snapshot import WorldSnapshot
+
+
+def read_with_snapshot(data):
+    client = make_client(data)
+    client.world_snapshot = WorldSnapshot(capacity=2)
+    contexts = []
+
+    while True:
+        context = client.read_player_context_message()
+
+        if context is None:
+            return client.world_snapshot, contexts
+
+        contexts.append(context)
+
+
+def encode_messages(contexts):
+    out = bytearray()
+
+    for context in contexts:
+        out += struct.pack('<b', RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+        protocol_codec.write_player_context(out, context)
+
+    return bytes(out + struct.pack('<b', RemoteProcessClient.MessageType.GAME_OVER))
+
+
+def test_snapshot_matches_the_decoded_world():
+    snapshot, contexts = read_with_snapshot(encode_messages([make_player_context(make_world(tick, 3, puck_owner=2))
+                                                             for tick in range(4)]))
+    world = contexts[-1].world
+
+    assert world.snapshot is snapshot and snapshot.tick == 3 and snapshot.count == 8
+
+    for name in ('id', 'x', 'y', 'speed_x', 'angle', 'stamina', 'type', 'state', 'swing_ticks'):
+        assert getattr(snapshot, name).tolist() == [getattr(h, name) for h in world.hockeyists]
+
+    assert (snapshot.puck['x'], snapshot.puck['owner_hockeyist_id']) == (world.puck.x, 2)
+
+
+def test_unknown_enum_values_are_stored_as_minus_one():
+    context = make_player_context(make_world(1, 2))
+    data = bytearray(encode_messages([context]))
+
+    located = {protocol_codec.HOCKEYIST_SCHEMA: []}
+    protocol_codec.locate_records(protocol_codec.PLAYER_CONTEXT_SCHEMA, data, 1, located)
+    record_offset = located[protocol_codec.HOCKEYIST_SCHEMA][1 - len(context.world.hockeyists)]
+    type_offset = record_offset + struct.calcsize('<qqidddddddd?')
+    data[type_offset] = 100
+    data[type_offset + 1 + struct.calcsize('<iiiid')] = 0x80
+
+    snapshot, contexts = read_with_snapshot(bytes(data))
+
+    assert contexts[0].world.hockeyists[1].type is None
+    assert snapshot.type[1] == -1 and snapshot.state[1] == -1
+    assert snapshot.type[0] == contexts[0].world.hockeyists[0].type
@@ -0,0 +1,78 @@
+"""
+This module provides tick-scoped memoization of strategy properties.
+
+A property decorated with tick_cached_property is computed at most once per tick for every strategy instance.
+The cache is dropped as soon as instance.world.tick changes (or by invalidate_tick_cache), so only properties which
+depend on nothing but the world, the game and the hockeyist itself should be cached - not the ones reading
+strategy state or the move.
+
+With debug enabled hits and misses are counted per property, see get_report.
+"""
+from collections import Counter
+
+
+__all__ = ['tick_cached_property', 'invalidate_tick_cache', 'enable_debug', 'get_report']
+
+
+debug = False
+hits = Counter()
+misses = Counter()
+
+
+class TickCache(dict):
+    def __init__(self, tick):
+        super().__init__()
+        self.tick = tick
+
+
+class tick_cached_property:
+    def __init__(self, getter):
+        self.getter = getter
+        self.name = getter.__name__
+        self.qualified_name = getter.__qualname__
+        self.__doc__ = getter.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        tick = instance.world.tick
+        cache = instance.__dict__.get('_tick_cache')
+
+        if cache is None or cache.tick != tick:
+            cache = instance._tick_cache = TickCache(tick)
+
+        if self.name in cache:
+            if debug:
+                hits[self.qualified_name] += 1
+
+            return cache[self.name]
+
+        if debug:
+            misses[self.qualified_name] += 1
+
+        value = cache[self.name] = self.getter(instance)
+        return value
+
+
+def invalidate_tick_cache(instance):
+    instance.__dict__.pop('_tick_cache', None)
+
+
+def enable_debug(enabled=True):
+    global debug
+    debug = enabled
+
+
+def get_report():
+    lines = []
+
+    for name in sorted(set(hits) | set(misses), key=lambda n: -(hits[n] + misses[n])):
+        total = hits[name] + misses[name]
+        lines.append('%-60s hits: %8d  misses: %8d  hit rate: %5.1f%%' %
+                     (name, hits[name], misses[name], 100.0 * hits[name] / total))
+
+    return '\n'.join(lines)
@@ -0,0 +1,171 @@
+"""
+This module provides classes for recording the messages received from the game server and replaying them offline.
+
+A recording consists of two append-only files:
+  * PATH holds a magic header followed by records: (message type, tick, length) header and the raw message bytes
+    exactly as they were received, message type byte included;
+  * PATH.index holds one fixed-size (message type, tick, offset, length) entry per record, pointing into PATH.
+
+The index is only an accelerator: if it is missing or shorter than the data (e.g. the bot was killed), the records
+are found by scanning PATH.
+"""
+import mmap
+import os
+import struct
+
+from RemoteProcessClient import RemoteProcessClient
+
+
+__all__ = ['TickRecorder', 'ReplayClient']
+
+
+MAGIC = b'CHTICKS1'
+RECORD_HEADER_STRUCT = struct.Struct('<biI')
+INDEX_ENTRY_STRUCT = struct.Struct('<biqI')
+
+NO_TICK = -1
+
+
+class TickRecorder:
+    def __init__(self, path):
+        self.data_file = open(path, 'ab')
+        self.index_file = open(path + '.index', 'ab')
+
+        if self.data_file.tell() == 0:
+            self.data_file.write(MAGIC)
+
+    def record(self, message_type, tick, message_bytes):
+        offset = self.data_file.tell() + RECORD_HEADER_STRUCT.size
+
+        self.data_file.write(RECORD_HEADER_STRUCT.pack(message_type, tick, len(message_bytes)))
+        self.data_file.write(message_bytes)
+        self.index_file.write(INDEX_ENTRY_STRUCT.pack(message_type, tick, offset, len(message_bytes)))
+
+    def close(self):
+        self.data_file.close()
+        self.index_file.close()
+
+
+class ReplayClient(RemoteProcessClient):
+    """
+    Serves recorded messages in place of RemoteProcessClient, decoding them straight from the memory-mapped recording.
+    Written messages are discarded. Once the recorded player contexts are over, GAME_OVER is reported.
+    """
+
+    def __init__(self, path, reuse_objects=False, start_tick=None):
+        self.socket = None
+        self.cells = None
+        self.cell_visibilities = None
+
+        self._init_buffers()
+        self._init_pools(reuse_objects)
+
+        with open(path, 'rb') as data_file:
+            self._map = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a tick recording [path=%s]." % path)
+
+        self._buffer = self._map
+        self._buffer_view = memoryview(self._map)
+
+        self.entries = self.read_index(path + '.index') or self.scan_records()
+        self.entries = [entry for entry in self.entries if entry[2] + entry[3] <= len(self._map)]
+        self._next_entry_index = 0
+
+        self._context_entries = {
+            message_type: [entry for entry in self.entries if entry[0] == message_type]
+            for message_type in (RemoteProcessClient.MessageType.TEAM_SIZE,
+                                 RemoteProcessClient.MessageType.GAME_CONTEXT)
+        }
+
+        if start_tick is not None:
+            self.seek(start_tick)
+
+    def read_index(self, index_path):
+        if not os.path.exists(index_path):
+            return None
+
+        with open(index_path, 'rb') as index_file:
+            index = index_file.read()
+
+        entries = [INDEX_ENTRY_STRUCT.unpack_from(index, offset)
+                   for offset in range(0, len(index) - INDEX_ENTRY_STRUCT.size + 1, INDEX_ENTRY_STRUCT.size)]
+
+        if not entries or entries[-1][2] + entries[-1][3] != len(self._map):
+            return None
+
+        return entries
+
+    def scan_records(self):
+        entries = []
+        offset = len(MAGIC)
+
+        while offset + RECORD_HEADER_STRUCT.size <= len(self._map):
+            message_type, tick, length = RECORD_HEADER_STRUCT.unpack_from(self._map, offset)
+            offset += RECORD_HEADER_STRUCT.size
+
+            entries.append((message_type, tick, offset, length))
+            offset += length
+
+        return entries
+
+    @property
+    def ticks(self):
+        return [tick for message_type, tick, _, _ in self.entries
+                if message_type == RemoteProcessClient.MessageType.PLAYER_CONTEXT]
+
+    def seek(self, tick):
+        """
+        Makes the next player context message the first recorded one with world tick not less than tick
+        """
+        self._next_entry_index = len(self.entries)
+
+        for entry_index, (message_type, entry_tick, _, _) in enumerate(self.entries):
+            if message_type == RemoteProcessClient.MessageType.PLAYER_CONTEXT and entry_tick >= tick:
+                self._next_entry_index = entry_index
+                break
+
+    def read_team_size_message(self):
+        self._select_context_entry(RemoteProcessClient.MessageType.TEAM_SIZE)
+        return super().read_team_size_message()
+
+    def read_game_context_message(self):
+        self._select_context_entry(RemoteProcessClient.MessageType.GAME_CONTEXT)
+        return super().read_game_context_message()
+
+    def read_player_context_message(self):
+        while self._next_entry_index < len(self.entries):
+            entry = self.entries[self._next_entry_index]
+            self._next_entry_index += 1
+
+            if entry[0] == RemoteProcessClient.MessageType.PLAYER_CONTEXT:
+                self._select_entry(entry)
+                return super().read_player_context_message()
+
+        return None
+
+    def _select_context_entry(self, message_type):
+        entries = self._context_entries[message_type]
+        if not entries:
+            raise IOError("No %s message is recorded." % message_type)
+
+        self._select_entry(entries[0])
+
+    def _select_entry(self, entry):
+        _, _, offset, length = entry
+
+        self._message_offset = offset
+        self._read_offset = offset
+        self._received_offset = offset + length
+
+    def _ensure_buffered(self, byte_count):
+        if self._received_offset - self._read_offset < byte_count:
+            raise IOError("Can't read %s bytes from recorded message." % str(byte_count))
+
+    def flush(self):
+        del self._output_buffer[:]
+
+    def close(self):
+        self._buffer_view.release()
+        self._map.close()
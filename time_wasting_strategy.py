@@ -2,9 +2,8 @@
 This module provides classes for representing time wasting strategy
 """
 from enum import Enum
-from base_strategy import BaseStrategy
-from model.ActionType import ActionType
-from point import Point
+from state_machine import StateMachineStrategy, StateInfo, StateBehaviour, Transition, Guard, ANY_STATE, OWN_PUCK
+from tick_cache import tick_cached_property
 
 
 class StrategyState(Enum):
@@ -13,7 +12,7 @@ class StrategyState(Enum):
     waste_time = 3
 
 
-class TimeWastingStrategy(BaseStrategy):
+class TimeWastingStrategy(StateMachineStrategy):
     def __init__(self, me, world, game, move, info):
         super().__init__(me, world, game, move, info)
 
@@ -22,66 +21,38 @@ class TimeWastingStrategy(BaseStrategy):
         self.update_state()
         # print(self.angle_to_start_point)
 
-    @property
-    def speed_up(self):
-        return 1.0
-
-    @property
-    def action(self):
-        if self.state == StrategyState.take_puck:
-            return self.take_puck_or_prevent_attack_or_attack_opponent
-        else:
-            return ActionType.NONE
-
-    @property
-    def turn(self):
-        return {
-            StrategyState.take_puck: self.angle_to_puck,
-            StrategyState.move_to_start_point: self.angle_to_start_point,
-            StrategyState.waste_time: 0.02
-        }[self.state]
-
-    def update_state(self):
-        new_state = self.get_next_state(self.state)
-
-        while self.state != new_state:
-            self.state = new_state
-            new_state = self.get_next_state(self.state)
-
-    def get_next_state(self, state):
-        if not self.own_puck:
-            state = StrategyState.take_puck
-
-        if state == StrategyState.take_puck and self.own_puck:
-            state = StrategyState.move_to_start_point
-        elif (state == StrategyState.move_to_start_point and
-                self.distance_to_start_point < self._allowed_distance_to_start_point):
-            state = StrategyState.waste_time
-
-        return state
-
-    @property
+    behaviours = {
+        StrategyState.take_puck: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.angle_to_puck,
+            action=lambda s: s.take_puck_or_prevent_attack_or_attack_opponent),
+        StrategyState.move_to_start_point: StateBehaviour(
+            speed_up=1.0,
+            turn=lambda s: s.angle_to_start_point),
+        StrategyState.waste_time: StateBehaviour(
+            speed_up=1.0,
+            turn=0.02)
+    }
+
+    transitions = [
+        Transition(ANY_STATE, StrategyState.take_puck, ~OWN_PUCK),
+        Transition((StrategyState.take_puck,), StrategyState.move_to_start_point),
+        Transition((StrategyState.move_to_start_point,), StrategyState.waste_time,
+                   Guard(lambda s: s.distance_to_start_point < s._allowed_distance_to_start_point))
+    ]
+
+    @tick_cached_property
     def distance_to_start_point(self):
         return self.get_distance_to_unit(self.start_point)
 
-    @property
+    @tick_cached_property
     def angle_to_start_point(self):
         return self.get_angle_to_unit(self.start_point)
 
     @property
     def start_point(self):
-        return Point(600, 200)
+        return self.rink.time_wasting_start_point
 
     @staticmethod
     def initial_info():
-        return {
-            'state': StrategyState.take_puck
-        }
-
-    @property
-    def state(self):
-        return self.info['state']
-
-    @state.setter
-    def state(self, value):
-        self.info['state'] = value
+        return StateInfo(StrategyState.take_puck)
@@ -1,12 +1,39 @@
 """
 This module provides classes for representing vector
+
+Besides the Vector methods, the module has plain-float functions for the hot paths which have coordinates at hand
+and don't need to build Point and Vector objects at all.
 """
-from math import hypot, atan2, pi
+from math import hypot, atan2
 
 from point import Point
 
 
+__all__ = ['Vector', 'get_angle_between', 'is_between']
+
+
+def get_angle_between(dx1, dy1, dx2, dy2):
+    """
+    :return: the angle to rotate (dx1, dy1) by to get the direction of (dx2, dy2), in [-pi, pi]
+    """
+    return atan2(dx1 * dy2 - dy1 * dx2, dx1 * dx2 + dy1 * dy2)
+
+
+def is_between(dx1, dy1, dx2, dy2, dx3, dy3):
+    """
+    :return: whether (dx1, dy1) lies in the sector between (dx2, dy2) and (dx3, dy3), both of them being
+        less than a right angle away from it
+    """
+    cross2 = dx1 * dy2 - dy1 * dx2
+    cross3 = dx1 * dy3 - dy1 * dx3
+
+    return ((cross2 >= 0 >= cross3 or cross3 >= 0 >= cross2) and
+            dx1 * dx2 + dy1 * dy2 > 0 and dx1 * dx3 + dy1 * dy3 > 0)
+
+
 class Vector:
+    __slots__ = ('start', 'end')
+
     def __init__(self, a, b):
 
         if isinstance(a, (int, float)) and isinstance(b, (int, float)):
@@ -20,7 +47,8 @@ class Vector:
         return 'Vector({0} -> {1})'.format(self.start, self.end)
 
     def __mul__(self, n):
-        return Vector(self.start, self.start + self.delta * n)
+        start = self.start
+        return Vector(start, Point(start.x + (self.end.x - start.x) * n, start.y + (self.end.y - start.y) * n))
 
     @property
     def dx(self):
@@ -32,28 +60,36 @@ class Vector:
 
     @property
     def delta(self):
-        return Point(self.dx, self.dy)
+        return Point(self.end.x - self.start.x, self.end.y - self.start.y)
+
+    @property
+    def squared_length(self):
+        dx = self.end.x - self.start.x
+        dy = self.end.y - self.start.y
+
+        return dx * dx + dy * dy
 
     @property
     def length(self):
-        return hypot(self.dx, self.dy)
+        return hypot(self.end.x - self.start.x, self.end.y - self.start.y)
 
     @length.setter
     def length(self, value):
-        if self.length != 0:
-            k = value / self.length
+        length = self.length
 
-            delta = self.delta * k
+        if length != 0:
+            k = value / length
+            start = self.start
 
-            self.end = self.start + delta
+            self.end = Point(start.x + (self.end.x - start.x) * k, start.y + (self.end.y - start.y) * k)
 
-    def angle_to(self, v):
-        angle = atan2(v.dy, v.dx) - atan2(self.dy, self.dx)
-
-        while angle > pi:
-            angle -= 2.0 * pi
+    def dot(self, v):
+        return ((self.end.x - self.start.x) * (v.end.x - v.start.x) +
+                (self.end.y - self.start.y) * (v.end.y - v.start.y))
 
-        while angle < -pi:
-            angle += 2.0 * pi
+    def cross(self, v):
+        return ((self.end.x - self.start.x) * (v.end.y - v.start.y) -
+                (self.end.y - self.start.y) * (v.end.x - v.start.x))
 
-        return angle
\ No newline at end of file
+    def angle_to(self, v):
+        return atan2(self.cross(v), self.dot(v))
@@ -0,0 +1,91 @@
+"""
+This module provides class for indexing the world once per tick.
+
+The index is shared by the strategies of all teammates within a tick: it is attached to the world as world.index
+and rebuilt only when the world's tick changes.
+
+Lookups which don't depend on the asking hockeyist are computed on first use and then served to all teammates.
+The strategy factory stores the TeamPlan of the tick as team_plan. The static points of the rink are in rink.
+"""
+from model.HockeyistState import HockeyistState
+from model.HockeyistType import HockeyistType
+from model.World import World
+from rink_geometry import RinkGeometry
+
+
+__all__ = ['WorldIndex']
+
+
+class WorldIndex:
+    def __init__(self, world: World):
+        self.tick = world.tick
+        self._opponent_nearest_to_net = None
+        self.team_plan = None
+
+        self.player = None
+        self.opponent = None
+
+        for player in world.players:
+            if player.me:
+                self.player = self.player or player
+            else:
+                self.opponent = self.opponent or player
+
+        self.hockeyists_by_id = {}
+
+        self.my_hockeyists_with_goalie = []
+        self.my_hockeyists = []
+        self.opponent_hockeyists_with_goalie = []
+        self.opponent_hockeyists = []
+        self.goalies = []
+        self.active_hockeyists = []
+        self.resting_hockeyists = []
+
+        for hockeyist in world.hockeyists:
+            self.hockeyists_by_id.setdefault(hockeyist.id, hockeyist)
+
+            if hockeyist.teammate:
+                self.my_hockeyists_with_goalie.append(hockeyist)
+            else:
+                self.opponent_hockeyists_with_goalie.append(hockeyist)
+
+            if hockeyist.type == HockeyistType.GOALIE:
+                self.goalies.append(hockeyist)
+            elif hockeyist.teammate:
+                self.my_hockeyists.append(hockeyist)
+            else:
+                self.opponent_hockeyists.append(hockeyist)
+
+            if hockeyist.state == HockeyistState.RESTING:
+                self.resting_hockeyists.append(hockeyist)
+            else:
+                self.active_hockeyists.append(hockeyist)
+
+        self.puck_owner = self.hockeyists_by_id.get(world.puck.owner_hockeyist_id)
+
+        self.rink = RinkGeometry.of(self.player, self.opponent)
+
+    @property
+    def opponent_nearest_to_net(self):
+        """
+        :return: the first of opponent_hockeyists with the least distance to the center of the opponent's goal net
+            and that distance
+        """
+        if self._opponent_nearest_to_net is None:
+            net_center = self.rink.opponent_goal_net_center
+            opponent = min(self.opponent_hockeyists, key=lambda h: h.get_distance_to_unit(net_center))
+            self._opponent_nearest_to_net = opponent, opponent.get_distance_to_unit(net_center)
+
+        return self._opponent_nearest_to_net
+
+    @staticmethod
+    def of(world: World):
+        """
+        :rtype: WorldIndex
+        """
+        index = getattr(world, 'index', None)
+
+        if index is None or index.tick != world.tick:
+            index = world.index = WorldIndex(world)
+
+        return index
@@ -0,0 +1,115 @@
+"""
+This module provides structure-of-arrays snapshot of the world, filled from the raw PLAYER_CONTEXT message.
+
+Every hockeyist field of fixed size gets its own preallocated NumPy array, so geometry over all units costs a handful
+of array operations. Arrays are indexed in the order of world.hockeyists; only the first count items are valid.
+Unknown enum values are stored as -1 (they are decoded as None in the model objects).
+
+The bundled strategies don't read the snapshot. A strategy that does sets client.world_snapshot = WorldSnapshot() on
+its RemoteProcessClient, which then fills it from every PLAYER_CONTEXT message.
+"""
+import numpy as np
+
+import protocol_codec
+
+
+__all__ = ['WorldSnapshot', 'HOCKEYIST_DTYPE', 'PUCK_DTYPE']
+
+
+NUMPY_FORMATS = {
+    '?': '?',
+    'b': 'i1',
+    'i': '<i4',
+    'q': '<i8',
+    'd': '<f8'
+}
+
+
+def get_record_dtype(schema):
+    """
+    :return: packed structured dtype of the leading fixed-size fields of the schema
+    """
+    fields = schema.get_runs()[0]
+
+    return np.dtype({'names': [name for name, _ in fields],
+                     'formats': [NUMPY_FORMATS[field.format_char] for _, field in fields]})
+
+
+def get_enum_values(schema):
+    """
+    :return: the known values of every enum field among the leading fixed-size fields of the schema, by name
+    """
+    return {name: np.array(sorted(field.values), np.int8) for name, field in schema.get_runs()[0]
+            if isinstance(field, protocol_codec.EnumField)}
+
+
+HOCKEYIST_DTYPE = get_record_dtype(protocol_codec.HOCKEYIST_SCHEMA)
+HOCKEYIST_ENUM_VALUES = get_enum_values(protocol_codec.HOCKEYIST_SCHEMA)
+PUCK_DTYPE = get_record_dtype(protocol_codec.PUCK_SCHEMA)
+
+
+class WorldSnapshot:
+    def __init__(self, capacity=16):
+        self.count = 0
+        self.tick = None
+        self.arrays = {}
+        self.puck = np.zeros(1, PUCK_DTYPE)[0]
+
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.arrays = {name: np.zeros(capacity, HOCKEYIST_DTYPE.fields[name][0]) for name in HOCKEYIST_DTYPE.names}
+        self._byte_offsets = np.arange(HOCKEYIST_DTYPE.itemsize)
+
+    def __getattr__(self, name):
+        arrays = self.__dict__.get('arrays')
+
+        if arrays is not None and name in arrays:
+            return arrays[name][:self.count]
+
+        raise AttributeError(name)
+
+    def fill(self, message_bytes, world):
+        """
+        Fills the arrays from the PLAYER_CONTEXT message which world was decoded from and attaches the snapshot
+        to the world as world.snapshot.
+
+        If hockeyist records are equally spaced in the message (all have or all lack last_action_tick), they are
+        read through a single strided view of the message; otherwise they are gathered by their offsets.
+        """
+        located = {protocol_codec.HOCKEYIST_SCHEMA: [], protocol_codec.PUCK_SCHEMA: []}
+        protocol_codec.locate_records(protocol_codec.PLAYER_CONTEXT_SCHEMA, message_bytes, 1, located)
+
+        count = len(world.hockeyists)
+        offsets = np.array(located[protocol_codec.HOCKEYIST_SCHEMA][-count:] if count else [], dtype=np.intp)
+
+        if count > self.capacity:
+            self._allocate(max(count, 2 * self.capacity))
+
+        message = np.frombuffer(message_bytes, np.uint8)
+
+        if count:
+            strides = np.diff(offsets)
+
+            if count == 1 or (strides == strides[0]).all():
+                records = np.ndarray((count,), HOCKEYIST_DTYPE, message, offsets[0],
+                                     (strides[0] if count > 1 else HOCKEYIST_DTYPE.itemsize,))
+            else:
+                records = message[offsets[:, None] + self._byte_offsets].view(HOCKEYIST_DTYPE).reshape(count)
+
+            for name, array in self.arrays.items():
+                array[:count] = records[name]
+
+            for name, values in HOCKEYIST_ENUM_VALUES.items():
+                array = self.arrays[name][:count]
+                array[~np.isin(array, values)] = -1
+
+        puck_offsets = located[protocol_codec.PUCK_SCHEMA]
+        if puck_offsets:
+            self.puck = np.ndarray((1,), PUCK_DTYPE, message, puck_offsets[-1])[0].copy()
+
+        self.count = count
+        self.tick = world.tick
+
+        world.snapshot = self